@@ -1,44 +1,37 @@
 #!/usr/bin/env python3
 """Simple command-line interface for ChatGPT History Browser."""
 
-import argparse
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
-import json
-import subprocess
-import tempfile
+# Command modules are imported inside the commands that use them so that
+# --help and simple commands don't pay for the loaders, exporter and psutil.
 
-from ccsm.core.loader import load_conversations
-from ccsm.core.claude_loader import list_claude_projects, find_claude_project_for_cwd, load_raw_entries
-from ccsm.core.time_utils import format_relative_time
-from ccsm.core.exporter import export_conversation as export_conv, export_aligned
-from ccsm.core.logging_config import setup_logging, get_logger
-from ccsm.core.validation import validate_project_selection, validate_conversation_number, validate_file_path
 
-
-def list_conversations(file_path: str, count: int = 20, format: str = "auto") -> None:
+def list_conversations(file_path: str, count: int = 20, format: str = "auto", use_cache: bool = True,
+                       conversations: Optional[list] = None) -> None:
     """List recent conversations in claude --resume style."""
-    conversations = load_conversations(file_path, format=format)
+    from ccsm.core.time_utils import format_relative_times
+
+    if conversations is None:
+        from ccsm.core.loader import load_conversations
+        conversations = load_conversations(file_path, format=format, use_cache=use_cache, metadata_only=True)
     
     if not conversations:
         print("No conversations found.")
         return
     
-    # Print header
-    print(f"     {'Modified':<12} {'Created':<12} {'# Messages':<11} Summary")
+    # Format all times up front against one clock reading
+    shown = conversations[:count]
+    modified_times = format_relative_times(conv.update_time for conv in shown)
+    created_times = format_relative_times(conv.create_time for conv in shown)
     
-    # List conversations
-    for i, conv in enumerate(conversations[:count]):
-        # Format times
-        modified = format_relative_time(conv.update_time)
-        created = format_relative_time(conv.create_time)
-        
-        # Count messages
-        msg_count = len(conv.messages)
-        
-        # Format the line
+    # Build every row, then write them in one go rather than a print() per row
+    lines = [f"     {'Modified':<12} {'Created':<12} {'# Messages':<11} Summary"]
+    append = lines.append
+    for i, conv in enumerate(shown):
         # Use ❯ for first item, space for others
         marker = "❯" if i == 0 else " "
         
@@ -47,61 +40,118 @@ def list_conversations(file_path: str, count: int = 20, format: str = "auto") ->
         if len(title) > 50:
             title = title[:47] + "..."
         
-        print(f"{marker} {i+1:2}. {modified:<12} {created:<12} {msg_count:>10} {title}")
+        append(f"{marker} {i+1:2}. {modified_times[i]:<12} {created_times[i]:<12} "
+               f"{conv.get_message_count():>10} {title}")
+    
+    _write_lines(lines)
 
 
-def export_conversation(file_path: str, number: int, format: str = "auto", export_format: str = "text") -> None:
+def export_conversation(file_path: str, number: int, format: str = "auto", export_format: str = "text",
+                        use_cache: bool = True, conversations: Optional[list] = None) -> None:
     """Export a conversation to stdout."""
-    conversations = load_conversations(file_path, format=format)
+    from ccsm.core.exporter import export_conversation_iter
+    from ccsm.core.validation import validate_conversation_number
+
+    if conversations is None:
+        # Only the selected conversation is parsed in full
+        from ccsm.core.loader import load_conversation_at
+        conv, total = load_conversation_at(file_path, number - 1, format=format, use_cache=use_cache)
+    else:
+        total = len(conversations)
+        conv = conversations[number - 1] if 0 < number <= total else None
     
-    if not conversations:
+    if not total:
         print("No conversations found.")
         return
         
     # Validate conversation number
-    validated_num = validate_conversation_number(str(number), len(conversations))
-    if validated_num is None:
-        print(f"Error: Conversation {number} not found (1-{len(conversations)})")
+    validated_num = validate_conversation_number(str(number), total)
+    if validated_num is None or conv is None:
+        print(f"Error: Conversation {number} not found (1-{total})")
         return
     
-    idx = validated_num - 1
-        
-    conv = conversations[idx]
-    
-    # Export using shared exporter
-    output = export_conv(conv, format=export_format)
-    print(output)
+    # Stream the export straight to stdout instead of building one big string
+    _write_chunks(export_conversation_iter(conv, format=export_format))
+
+
+def _write_lines(lines: list) -> None:
+    """Write lines to stdout with a single write call."""
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
 
+def _write_chunks(chunks) -> None:
+    """Write text chunks to stdout followed by a newline, bypassing print()."""
+    stdout = sys.stdout
+    buffer = getattr(stdout, 'buffer', None)
+    if buffer is None:
+        for chunk in chunks:
+            stdout.write(chunk)
+        stdout.write("\n")
+        return
 
-def search_conversations(file_path: str, query: str, content: bool = False, format: str = "auto") -> None:
-    """Search conversations by title or content."""
-    conversations = load_conversations(file_path, format=format)
+    # Encode the same way the text layer would, then hand bytes to the buffer directly
+    encoding = stdout.encoding or 'utf-8'
+    errors = stdout.errors or 'strict'
+    stdout.flush()
+    write = buffer.write
+    for chunk in chunks:
+        write(chunk.encode(encoding, errors))
+    write(b"\n")
+    buffer.flush()
+
+
+_TITLE_MATCH, _CONTENT_MATCH = 0, 1
+_MATCH_TYPES = ("title", "content")
+
+
+def search_conversations(file_path: str, query: str, content: bool = False, format: str = "auto",
+                         use_cache: bool = True, limit: int = 20, conversations: Optional[list] = None) -> None:
+    """Search conversations by title or content, stopping once limit matches are found."""
+    if conversations is None:
+        from ccsm.core.loader import load_conversations
+        # Title-only searches never look at message bodies
+        conversations = load_conversations(file_path, format=format, use_cache=use_cache,
+                                           metadata_only=not content)
     query_lower = query.lower()
     
-    results = []
+    # Collect one extra match so we know whether there were more than shown.
+    # Matches are kept as parallel columns of indexes and match kinds; the
+    # conversation objects are only looked up again for the rows printed.
+    from array import array
+    match_indexes = array('l')
+    match_kinds = bytearray()
     for i, conv in enumerate(conversations):
-        # Check title
-        if query_lower in conv.title.lower():
-            results.append((i, conv, "title"))
+        if query_lower in conv.title_lower:
+            match_kinds.append(_TITLE_MATCH)
+        elif content and conv.contains_text(query_lower):
+            match_kinds.append(_CONTENT_MATCH)
+        else:
             continue
-            
-        # Check content if requested
-        if content:
-            for msg in conv.messages:
-                if query_lower in msg.content.lower():
-                    results.append((i, conv, "content"))
-                    break
+        match_indexes.append(i)
+        if len(match_indexes) > limit:
+            break
     
     # Show results
-    print(f"Found {len(results)} matches for '{query}'")
+    found = len(match_indexes)
+    if found > limit:
+        found = limit
+        print(f"Found more than {limit} matches for '{query}'")
+    else:
+        print(f"Found {found} matches for '{query}'")
     print("=" * 50)
     
-    for i, (idx, conv, match_type) in enumerate(results[:20]):
-        print(f"{i+1}. [{idx+1}] {conv.title} ({match_type} match)")
+    for i in range(found):
+        idx = match_indexes[i]
+        match_type = _MATCH_TYPES[match_kinds[i]]
+        print(f"{i+1}. [{idx+1}] {conversations[idx].title} ({match_type} match)")
 
 
 def aligned_export(file_path: str, output_dir: str = ".", fold_lines: int = 50) -> None:
     """Generate aligned JSON and plaintext files from a JSONL session."""
+    from ccsm.core.claude_loader import load_raw_entries
+    from ccsm.core.exporter import export_aligned
+
     entries = load_raw_entries(file_path)
     if not entries:
         print(f"No entries found in {file_path}")
@@ -124,6 +174,8 @@ def aligned_export(file_path: str, output_dir: str = ".", fold_lines: int = 50)
 
 def compact_json(file_path: str, output: Optional[str] = None) -> None:
     """Convert pretty JSON array back to JSONL format."""
+    import json
+
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -154,17 +206,22 @@ def compact_json(file_path: str, output: Optional[str] = None) -> None:
     if output is None:
         output = str(Path(file_path).with_suffix('.jsonl'))
 
-    # Write as JSONL
+    # Write as JSONL, in a single write call
+    lines = [json.dumps(entry, ensure_ascii=False) for entry in entries]
+    lines.append('')
     with open(output, 'w', encoding='utf-8') as f:
-        for entry in entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        f.write('\n'.join(lines))
 
     print(f"Wrote {len(entries)} entries to {output}")
 
 
 def edit_session(file_path: str, fold_lines: int = 50, output: Optional[str] = None) -> None:
     """Open session in vim with aligned split view."""
+    import subprocess
+    import tempfile
     import uuid
+    from ccsm.core.claude_loader import load_raw_entries
+    from ccsm.core.exporter import export_aligned
 
     entries = load_raw_entries(file_path)
     if not entries:
@@ -216,24 +273,24 @@ def edit_session(file_path: str, fold_lines: int = 50, output: Optional[str] = N
 
 def list_claude_projects_cmd() -> None:
     """List all Claude projects."""
+    from ccsm.core.claude_loader import list_claude_projects
+    from ccsm.core.time_utils import format_relative_times
+
     projects = list_claude_projects()
     
     if not projects:
         print("No Claude projects found in ~/.claude/projects/")
         return
     
-    print(f"Found {len(projects)} Claude projects:")
-    print("=" * 70)
-    
-    # Print header
-    print(f"     {'Last Modified':<15} {'# Convos':<10} Project Name")
+    last_modified_times = format_relative_times(project['last_modified'] for project in projects)
     
+    lines = [
+        f"Found {len(projects)} Claude projects:",
+        "=" * 70,
+        f"     {'Last Modified':<15} {'# Convos':<10} Project Name",
+    ]
     for i, project in enumerate(projects, 1):
         name = project['name']
-        count = project['conversation_count']
-        
-        # Format last modified time
-        last_mod = format_relative_time(project['last_modified'])
         
         # Clean up project name and add leading slash
         if name.startswith('-'):
@@ -244,14 +301,17 @@ def list_claude_projects_cmd() -> None:
         # Use ❯ for first item
         marker = "❯" if i == 1 else " "
         
-        print(f"{marker} {i:2}. {last_mod:<15} {count:>8}  {clean_name}")
+        lines.append(f"{marker} {i:2}. {last_modified_times[i - 1]:<15} {project['conversation_count']:>8}  {clean_name}")
     
-    print("\nUse: cgpt ~/.claude/projects/<PROJECT_NAME> list")
-    print("  or: cgpt --claude-project <PROJECT_NAME> list")
+    lines.append("\nUse: cgpt ~/.claude/projects/<PROJECT_NAME> list")
+    lines.append("  or: cgpt --claude-project <PROJECT_NAME> list")
+    _write_lines(lines)
 
 
 def _handle_standalone_command(cmd: str, args: list) -> None:
     """Handle standalone commands that don't need conversations_file."""
+    import argparse
+
     parser = argparse.ArgumentParser(prog=f"ccsm {cmd}")
 
     if cmd == "aligned":
@@ -276,14 +336,26 @@ def _handle_standalone_command(cmd: str, args: list) -> None:
         parsed = parser.parse_args(args)
         edit_session(parsed.session_file, parsed.fold_lines, parsed.output)
 
+    elif cmd == "serve":
+        from ccsm.cli.daemon import serve
+        parser.add_argument("--socket", help="Socket path (default: ccsm.sock in the cache directory)")
+        parsed = parser.parse_args(args)
+        serve(parsed.socket)
 
-def main():
-    """Main entry point."""
-    # Handle standalone commands that don't use conversations_file
-    standalone_commands = {'aligned', 'compact', 'edit'}
-    if len(sys.argv) > 1 and sys.argv[1] in standalone_commands:
-        _handle_standalone_command(sys.argv[1], sys.argv[2:])
-        return
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    import argparse
+
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _create_parser() -> "argparse.ArgumentParser":
+    """Build the full argument parser, used for help output and anything the fast path declines."""
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="Browse ChatGPT and Claude conversation history",
@@ -293,6 +365,10 @@ def main():
     # Add debug option
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
+    # Cache option
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse conversation files instead of using ~/.cache/ccsm")
+
     # File argument
     parser.add_argument(
         "conversations_file",
@@ -342,6 +418,8 @@ def main():
     search_parser.add_argument("query", help="Search term")
     search_parser.add_argument("-c", "--content", action="store_true",
                               help="Search in message content too")
+    search_parser.add_argument("--limit", type=_positive_int, default=20,
+                              help="Stop after this many matches (default: 20)")
 
     # Aligned export command
     aligned_parser = subparsers.add_parser("aligned", help="Export aligned JSON + plaintext")
@@ -362,9 +440,100 @@ def main():
                             help="Max lines before folding tool output")
     edit_parser.add_argument("--output", "-o", help="Output file path (default: <original>-edited-<timestamp>.jsonl)")
 
-    args = parser.parse_args()
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Keep conversations loaded and answer commands over a socket")
+    serve_parser.add_argument("--socket", help="Socket path (default: ccsm.sock in the cache directory)")
+
+    return parser
+
+
+_PARSER = None
+
+
+def _get_parser() -> "argparse.ArgumentParser":
+    """Return the full parser, building it on first use and reusing it afterwards."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _create_parser()
+    return _PARSER
+
+
+_FAST_COMMANDS = frozenset({'list', 'export', 'search'})
+
+
+def _parse_fast(argv: list) -> Optional[SimpleNamespace]:
+    """Parse the common `FILE list|export|search ...` forms without building argparse.
+
+    Returns None for anything else (help, global flags, malformed input) so
+    the caller falls back to the full parser, which stays the source of truth.
+    """
+    if len(argv) < 2 or argv[1] not in _FAST_COMMANDS or argv[0].startswith('-') or argv[0] in _FAST_COMMANDS:
+        return None
+    conversations_file, command, rest = argv[0], argv[1], argv[2:]
+
+    args = SimpleNamespace(debug=False, no_cache=False, conversations_file=conversations_file,
+                           format="auto", claude_project=None, gemini=False, command=command)
+    try:
+        if command == "list":
+            args.count = 20
+            if rest:
+                if len(rest) != 2 or rest[0] not in ('-n', '--count'):
+                    return None
+                args.count = int(rest[1])
+        elif command == "export":
+            args.export_format = "text"
+            if len(rest) == 3 and rest[1] == '--export-format' and rest[2] in ('text', 'markdown', 'json'):
+                args.export_format = rest[2]
+            elif len(rest) != 1:
+                return None
+            args.number = int(rest[0])
+        else:
+            flags = [arg for arg in rest if arg.startswith('-')]
+            positional = [arg for arg in rest if not arg.startswith('-')]
+            if len(positional) != 1 or any(flag not in ('-c', '--content') for flag in flags):
+                return None
+            args.query = positional[0]
+            args.content = bool(flags)
+            args.limit = 20
+    except ValueError:
+        return None
+    return args
+
+
+def _run_in_daemon(args) -> bool:
+    """Send the command to a running daemon when CCSM_DAEMON is set; False means run it here."""
+    from ccsm.cli.daemon import daemon_enabled, request
+
+    if args.no_cache or not daemon_enabled():
+        return False
+
+    command = {'cmd': args.command, 'file': args.conversations_file, 'format': args.format}
+    if args.command == "list":
+        command['count'] = args.count
+    elif args.command == "export":
+        command.update(number=args.number, export_format=args.export_format)
+    else:
+        command.update(query=args.query, content=args.content, limit=args.limit)
+
+    output = request(command)
+    if output is None:
+        return False
+    sys.stdout.write(output)
+    return True
+
+
+def main():
+    """Main entry point."""
+    # Handle standalone commands that don't use conversations_file
+    standalone_commands = {'aligned', 'compact', 'edit', 'serve'}
+    if len(sys.argv) > 1 and sys.argv[1] in standalone_commands:
+        _handle_standalone_command(sys.argv[1], sys.argv[2:])
+        return
+
+    args = _parse_fast(sys.argv[1:]) or _get_parser().parse_args()
     
     # Setup logging
+    from ccsm.core.logging_config import setup_logging, get_logger
     setup_logging(debug_mode=args.debug)
     logger = get_logger(__name__)
     
@@ -397,15 +566,29 @@ def main():
     if args.command == "edit":
         edit_session(args.session_file, args.fold_lines)
         return
+
+    # Handle serve command
+    if args.command == "serve":
+        from ccsm.cli.daemon import serve
+        serve(args.socket)
+        return
     
     # Auto-detect Claude project if no file specified
     if not args.conversations_file:
+        from ccsm.core.claude_loader import find_claude_project_for_cwd, list_claude_projects
+        from ccsm.core.validation import validate_project_selection
+
         # Check if we're in a Claude project directory
         claude_project = find_claude_project_for_cwd()
         if claude_project:
             args.conversations_file = claude_project
             args.format = "claude"
         else:
+            # The picker needs someone to answer it; don't scan every project just to fail at input()
+            if not sys.stdin.isatty():
+                print("Error: No conversation file given and not running interactively.", file=sys.stderr)
+                sys.exit(2)
+            
             # Fall back to showing Claude project picker with prompt
             projects = list_claude_projects()
             if not projects:
@@ -434,6 +617,7 @@ def main():
                 sys.exit(0)
     
     # Validate file path
+    from ccsm.core.validation import validate_file_path
     validated_path = validate_file_path(args.conversations_file, must_exist=True)
     if validated_path is None:
         print(f"Error: File not found or invalid: {args.conversations_file}")
@@ -442,17 +626,23 @@ def main():
     # Update with normalized path
     args.conversations_file = str(validated_path)
     
+    # Let a running `ccsm serve` answer if the user opted in
+    if args.command in _FAST_COMMANDS and _run_in_daemon(args):
+        return
+
     # Execute command
+    use_cache = not args.no_cache
     if args.command == "list":
-        list_conversations(args.conversations_file, args.count, format=args.format)
+        list_conversations(args.conversations_file, args.count, format=args.format, use_cache=use_cache)
     elif args.command == "export":
         export_conversation(args.conversations_file, args.number, format=args.format, 
-                          export_format=args.export_format)
+                          export_format=args.export_format, use_cache=use_cache)
     elif args.command == "search":
-        search_conversations(args.conversations_file, args.query, args.content, format=args.format)
+        search_conversations(args.conversations_file, args.query, args.content, format=args.format,
+                             use_cache=use_cache, limit=args.limit)
     else:
         # Default to list
-        list_conversations(args.conversations_file, format=args.format)
+        list_conversations(args.conversations_file, format=args.format, use_cache=use_cache)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Warm `ccsm serve` process that answers list/export/search over a Unix socket."""
+
+import io
+import json
+import os
+import socket
+import socketserver
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Tuple
+
+DAEMON_ENV = 'CCSM_DAEMON'
+SOCKET_NAME = 'ccsm.sock'
+
+
+def get_socket_path() -> str:
+    """Path of the daemon socket inside the cache directory."""
+    from ccsm.core.cache import get_cache_dir
+    return str(get_cache_dir() / SOCKET_NAME)
+
+
+def daemon_enabled() -> bool:
+    """Whether CLI commands should try the daemon first (CCSM_DAEMON=1)."""
+    return os.environ.get(DAEMON_ENV, '') not in ('', '0')
+
+
+def source_signature(file_path: str) -> Tuple:
+    """Cheap fingerprint of a conversation file or directory tree.
+
+    Directories are fingerprinted by the (path, mtime, size) of every file in
+    them and in their immediate subdirectories, which covers Claude projects
+    and Gemini session checkpoints without parsing anything.
+    """
+    from ccsm.core.cache import file_signature
+
+    if not os.path.isdir(file_path):
+        return (file_signature(file_path),)
+
+    entries = []
+    pending = [(file_path, 1)]
+    while pending:
+        dir_path, depth = pending.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if depth:
+                                pending.append((entry.path, depth - 1))
+                        else:
+                            st = entry.stat()
+                            entries.append((entry.path, st.st_mtime_ns, st.st_size))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return tuple(sorted(entries))
+
+
+def request(command: Dict, socket_path: Optional[str] = None) -> Optional[str]:
+    """Send a command to a running daemon and return its output.
+
+    Returns None if no daemon is listening or it could not run the command,
+    in which case the caller should run the command itself.
+    """
+    path = socket_path or get_socket_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            sock.sendall(json.dumps(command).encode('utf-8') + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile('rb') as f:
+                data = f.read()
+        reply = json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(reply, dict) or not reply.get('ok'):
+        return None
+    return reply.get('output', '')
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One JSON command per connection, one JSON reply back."""
+
+    def handle(self) -> None:
+        try:
+            command = json.loads(self.rfile.readline())
+            reply = {'ok': True, 'output': self.server.run(command)}
+        except Exception as e:
+            from ccsm.core.logging_config import get_logger
+            get_logger(__name__).error(f"Daemon command failed: {e}")
+            reply = {'ok': False, 'error': str(e)}
+        self.wfile.write(json.dumps(reply).encode('utf-8'))
+
+
+class ConversationServer(socketserver.UnixStreamServer):
+    """Serves CLI commands from conversations kept parsed in memory.
+
+    Requests are handled one at a time: commands print through a redirected
+    sys.stdout, which is process-wide, so threading would interleave output.
+    """
+
+    def __init__(self, socket_path: str):
+        self.conversations: Dict[Tuple[str, str], Tuple[Tuple, List]] = {}
+        super().__init__(socket_path, _Handler)
+        os.chmod(socket_path, 0o600)
+
+    def get_conversations(self, file_path: str, format: str) -> List:
+        """Return parsed conversations, reloading if the source changed on disk."""
+        from ccsm.core.loader import load_conversations
+
+        key = (file_path, format)
+        signature = source_signature(file_path)
+        cached = self.conversations.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        conversations = load_conversations(file_path, format=format)
+        self.conversations[key] = (signature, conversations)
+        return conversations
+
+    def run(self, command: Dict) -> str:
+        """Run a list/export/search command and return what it printed."""
+        from ccsm.cli.cli import list_conversations, export_conversation, search_conversations
+
+        name = command['cmd']
+        file_path = command['file']
+        format = command.get('format', 'auto')
+        conversations = self.get_conversations(file_path, format)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            if name == 'list':
+                list_conversations(file_path, command.get('count', 20), format=format,
+                                   conversations=conversations)
+            elif name == 'export':
+                export_conversation(file_path, command['number'], format=format,
+                                    export_format=command.get('export_format', 'text'),
+                                    conversations=conversations)
+            elif name == 'search':
+                search_conversations(file_path, command['query'], command.get('content', False),
+                                     format=format, limit=command.get('limit', 20),
+                                     conversations=conversations)
+            else:
+                raise ValueError(f"Unknown command: {name}")
+        return output.getvalue()
+
+
+def serve(socket_path: Optional[str] = None) -> None:
+    """Run the daemon until interrupted."""
+    path = socket_path or get_socket_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # A socket file left by a daemon that died is safe to replace; a live one is not
+    if os.path.exists(path):
+        if _is_listening(path):
+            print(f"A ccsm daemon is already listening on {path}")
+            return
+        os.unlink(path)
+
+    server = ConversationServer(path)
+    print(f"Serving on {path} (set {DAEMON_ENV}=1 to use it)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _is_listening(path: str) -> bool:
+    """Whether something accepts connections on a Unix socket path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+        return True
+    except OSError:
+        return False
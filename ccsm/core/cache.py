@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""On-disk cache of parsed conversations keyed by file mtime and size."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ccsm.core.models import Conversation
+from ccsm.core.parallel import map_files
+from ccsm.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump whenever the pickled models or loader output change shape
+CACHE_VERSION = 5
+
+# Protocol 5 (PEP 574) is the newest on every supported Python
+PICKLE_PROTOCOL = 5
+
+Signature = Tuple[int, int]
+
+
+def get_cache_dir() -> Path:
+    """Return the cache directory, honouring CCSM_CACHE_DIR and XDG_CACHE_HOME."""
+    override = os.environ.get('CCSM_CACHE_DIR')
+    if override:
+        return Path(override)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'ccsm'
+
+
+def file_signature(file_path: str) -> Optional[Signature]:
+    """Return (mtime_ns, size) for a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_path(source: str, variant: str) -> Path:
+    """Cache file for a source path and loader variant."""
+    key = f"{os.path.abspath(source)}\0{variant}".encode('utf-8', 'surrogateescape')
+    return get_cache_dir() / f"{hashlib.sha1(key).hexdigest()}.pickle"
+
+
+def _read(path: Path, is_fresh: Optional[Callable[[dict], bool]] = None) -> Optional[Tuple[dict, Any]]:
+    """Read a cache entry as (header, payload), treating any failure as a miss.
+
+    The header is a small pickle in front of the payload, so a stale entry is
+    rejected by is_fresh without unpickling the conversations behind it.
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if not isinstance(header, dict) or header.get('version') != CACHE_VERSION:
+                return None
+            if is_fresh is not None and not is_fresh(header):
+                return None
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable cache {path}: {e}")
+        return None
+    return header, payload
+
+
+def _write(path: Path, header: dict, payload: Any) -> None:
+    """Atomically write a cache entry; failures only cost a re-parse next time."""
+    header['version'] = CACHE_VERSION
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'wb') as f:
+            pickle.dump(header, f, protocol=PICKLE_PROTOCOL)
+            pickle.dump(payload, f, protocol=PICKLE_PROTOCOL)
+        temp_path.replace(path)
+    except Exception as e:
+        logger.debug(f"Could not write cache {path}: {e}")
+
+
+def load_file_cached(file_path: str, variant: str,
+                     loader: Callable[[str], List[Conversation]]) -> List[Conversation]:
+    """Load conversations from a single file, reusing the cached parse if the file is unchanged."""
+    signature = file_signature(file_path)
+    if signature is None:
+        return loader(file_path)
+
+    path = _cache_path(file_path, variant)
+    entry = _read(path, lambda header: header.get('signature') == signature)
+    if entry:
+        logger.debug(f"Cache hit for {file_path}")
+        return entry[1]
+
+    conversations = loader(file_path)
+    _write(path, {'signature': signature}, conversations)
+    return conversations
+
+
+def load_directory_cached(dir_path: str, file_paths: List[str], variant: str,
+                          loader: Callable[[str], Optional[Conversation]]) -> List[Conversation]:
+    """Load one conversation per file, re-parsing only files whose mtime or size changed."""
+    path = _cache_path(dir_path, variant)
+    entry = _read(path)
+    signatures: Dict[str, Signature] = entry[0]['files'] if entry else {}
+    cached: Dict[str, Optional[Conversation]] = entry[1] if entry else {}
+
+    new_signatures: Dict[str, Optional[Signature]] = {}
+    parsed: Dict[str, Optional[Conversation]] = {}
+    stale = []
+    for file_path in file_paths:
+        signature = file_signature(file_path)
+        new_signatures[file_path] = signature
+        if signature is not None and signatures.get(file_path) == signature:
+            parsed[file_path] = cached[file_path]
+        else:
+            stale.append(file_path)
+
+    # Re-parse everything that changed in one batch so it can be spread across cores
+    parsed.update(zip(stale, map_files(loader, stale)))
+    conversations = [conv for conv in (parsed[file_path] for file_path in file_paths) if conv]
+
+    if stale or len(parsed) != len(cached):
+        logger.debug(f"Cache for {dir_path}: {len(stale)} of {len(parsed)} files re-parsed")
+        _write(path, {'files': new_signatures}, parsed)
+    return conversations
@@ -1,40 +1,82 @@
 #!/usr/bin/env python3
 """Loader for Claude Code conversation history."""
 
-import json
+import mmap
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 from ccsm.core.models import Conversation, Message, MessageRole
+from ccsm.core.cache import load_directory_cached
+from ccsm.core.json_compat import loads
+from ccsm.core.parallel import map_files
+from ccsm.core.time_utils import format_timestamp
 from ccsm.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Text items starting with these are tool output or boilerplate, not a usable title
+_TITLE_SKIP_PREFIXES = (
+    '1. Replaced', 'File "', 'Applied ', 'The file ', 'Contents of',
+    'Error:', 'Traceback', 'WARNING:', 'INFO:', 'DEBUG:',
+    'Successfully', 'Failed to', 'Created', 'Updated', 'Deleted',
+    'Running', 'Executing', 'Processing', 'Building',
+    '```', '---', '===', '...', 'Note:'
+)
+_COMMENT_PREFIXES = ('#', '//', '/*')
 
-def load_claude_conversations(file_path: str) -> List[Conversation]:
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Session files above this size are mapped and read line by line instead of read whole
+_MMAP_THRESHOLD = 50 * 1024 * 1024
+
+# A message line must name its role, so lines with neither can't be counted as messages
+_MESSAGE_ROLE_RE = re.compile(rb'"(?:user|assistant)"')
+
+_NONALNUM_RE = re.compile(r'[^a-zA-Z0-9-]+')
+_DASH_RE = re.compile(r'-+')
+_USER_QUOTE_RE = re.compile(r'"([^"]+)"')
+
+
+def load_claude_conversations(file_path: str, use_cache: bool = False,
+                              metadata_only: bool = False) -> List[Conversation]:
     """Load conversations from Claude JSONL format."""
+    load_file = partial(load_claude_conversation, metadata_only=True) if metadata_only else load_claude_conversation
     if os.path.isdir(file_path):
         # Load all conversations from a project directory
-        conversations = []
-        for jsonl_file in Path(file_path).glob("*.jsonl"):
-            conv = load_claude_conversation(str(jsonl_file))
-            if conv:
-                conversations.append(conv)
+        jsonl_files = [os.path.join(file_path, name) for name in _list_dir(file_path, _SESSION_FILES)]
+        if use_cache:
+            variant = "claude-metadata" if metadata_only else "claude"
+            conversations = load_directory_cached(file_path, jsonl_files, variant, load_file)
+        else:
+            conversations = [conv for conv in map_files(load_file, jsonl_files) if conv]
         return sorted(conversations, key=lambda c: c.create_time or 0, reverse=True)
     else:
         # Load single conversation file
-        conv = load_claude_conversation(file_path)
+        conv = load_file(file_path)
         return [conv] if conv else []
 
 
-def load_claude_conversation(file_path: str) -> Optional[Conversation]:
-    """Load a single conversation from Claude JSONL file."""
+def load_claude_conversation(file_path: str, metadata_only: bool = False) -> Optional[Conversation]:
+    """Load a single conversation from Claude JSONL file.
+
+    With metadata_only, messages are counted rather than kept: only the ones
+    title generation looks at are parsed, and the result is a
+    LazyClaudeConversation with message_count set whose messages are parsed
+    again from the file only if something reads them.
+    """
     messages = []
+    message_count = 0
     session_id = None
     first_timestamp = None
     last_timestamp = None
     project_name = None
+    title = None
     
     # Get file modification time
     try:
@@ -50,33 +92,57 @@ def load_claude_conversation(file_path: str) -> Optional[Conversation]:
         if idx + 1 < len(path_parts):
             project_name = path_parts[idx + 1]
     
+    # Once the listing has its title and first timestamp, and the file's mtime
+    # stands in for the last one, lines are only parsed to count messages
+    count_only = False
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
+        # Lines stay bytes: orjson (or json) decodes UTF-8 itself while parsing
+        with open(file_path, 'rb') as f:
+            for line in _read_lines(f):
                 if not line.strip():
                     continue
+                if count_only:
+                    if _MESSAGE_ROLE_RE.search(line) is None:
+                        continue
+                    try:
+                        if _is_claude_message(loads(line)):
+                            message_count += 1
+                    except ValueError:
+                        pass
+                    continue
                     
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
+                    data = loads(line)
+                except ValueError:  # malformed JSON or invalid UTF-8 on this line
                     continue
                 
                 # Extract session info - use the most recent sessionId found
                 if 'sessionId' in data:
                     session_id = data['sessionId']
                 
-                # Track timestamps
-                if 'timestamp' in data:
-                    ts = parse_timestamp(data['timestamp'])
-                    if ts:
-                        if first_timestamp is None:
-                            first_timestamp = ts
-                        last_timestamp = ts
+                # Track timestamps, parsed once per line and handed to the message too
+                ts = parse_timestamp(data.get('timestamp'))
+                if ts:
+                    if first_timestamp is None:
+                        first_timestamp = ts
+                    last_timestamp = ts
                 
-                # Extract message
-                msg = parse_claude_message(data)
+                # Past the first few messages, only user messages can still supply a title
+                if metadata_only and len(messages) >= 5 and (title is not None or data.get('type') != 'user'):
+                    if _is_claude_message(data):
+                        message_count += 1
+                    count_only = (title is not None and first_timestamp is not None
+                                  and file_modified_time is not None)
+                    continue
+                
+                # Extract message, picking the title up from the first user message that has one
+                msg = parse_claude_message(data, ts)
                 if msg:
                     messages.append(msg)
+                    message_count += 1
+                    if title is None and msg.role == MessageRole.USER:
+                        title = title_from_user_message(data['message'])
     
     except Exception as e:
         logger.error(f"Error loading {file_path}: {e}")
@@ -89,13 +155,25 @@ def load_claude_conversation(file_path: str) -> Optional[Conversation]:
     filename_session_id = Path(file_path).stem
     conv_id = filename_session_id
     
-    # Generate title from first user message or project info
-    title = generate_title(messages, project_name)
+    # No user message gave a title; fall back to assistant phrasing or project info
+    if title is None:
+        title = fallback_title(messages, project_name)
     
     metadata = {'source': 'claude', 'file': file_path}
     if project_name:
         metadata['project'] = project_name
     
+    if metadata_only:
+        return LazyClaudeConversation(
+            id=conv_id,
+            title=title,
+            messages=None,
+            create_time=first_timestamp,
+            update_time=file_modified_time or last_timestamp,
+            metadata=metadata,
+            message_count=message_count
+        )
+    
     return Conversation(
         id=conv_id,
         title=title,
@@ -106,8 +184,50 @@ def load_claude_conversation(file_path: str) -> Optional[Conversation]:
     )
 
 
-def parse_claude_message(data: Dict[str, Any]) -> Optional[Message]:
-    """Parse a message from Claude JSONL format."""
+class LazyClaudeConversation(Conversation):
+    """Metadata-only Claude conversation that parses its session file the first time messages are read.
+
+    Listing, counting and title search never touch messages, so they cost
+    nothing; export or content search pays for the one file it needs.
+    """
+    
+    @property
+    def messages(self) -> List[Message]:
+        if self._messages is None:
+            full = load_claude_conversation(self.metadata['file'])
+            self._messages = full.messages if full else []
+        return self._messages
+    
+    @messages.setter
+    def messages(self, value: Optional[List[Message]]) -> None:
+        self._messages = value
+
+
+def _read_lines(f) -> Iterator[bytes]:
+    """Lines of a binary file, read in one call rather than one buffered read per line.
+
+    Very large files are memory-mapped so the page cache does the reading.
+    """
+    if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+        yield from f.read().split(b'\n')
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b'')
+
+
+def _is_claude_message(data: Dict[str, Any]) -> bool:
+    """Check whether parse_claude_message would produce a message, without extracting content."""
+    if data.get('type') not in ('user', 'assistant'):
+        return False
+    message_data = data.get('message', {})
+    return bool(message_data) and isinstance(message_data.get('content', []), list)
+
+
+def parse_claude_message(data: Dict[str, Any], create_time: Optional[float] = None) -> Optional[Message]:
+    """Parse a message from Claude JSONL format.
+
+    create_time may be passed when the caller has already parsed data['timestamp'].
+    """
     msg_type = data.get('type')
     
     if msg_type not in ['user', 'assistant']:
@@ -129,14 +249,16 @@ def parse_claude_message(data: Dict[str, Any]) -> Optional[Message]:
     msg_id = data.get('uuid', str(data.get('timestamp', '')))
     
     # Parse timestamp
-    create_time = parse_timestamp(data.get('timestamp'))
+    if create_time is None:
+        create_time = parse_timestamp(data.get('timestamp'))
     
+    # Keep only what generate_title re-reads, not the whole raw entry with its tool payloads
     return Message(
         id=msg_id,
         role=role,
         content=content,
         create_time=create_time,
-        metadata=data
+        metadata={'message': message_data} if role == MessageRole.USER else None
     )
 
 
@@ -147,49 +269,53 @@ def extract_claude_content(message_data: Dict[str, Any], for_title: bool = False
     if not isinstance(content_list, list):
         return ""
     
+    if for_title:
+        return _extract_title_text(content_list)
+    
+    # Collected and joined once; measured faster than writing into an io.StringIO
     parts = []
+    append = parts.append
     for item in content_list:
-        if isinstance(item, dict):
-            item_type = item.get('type')
-            
-            if item_type == 'text':
-                text = item.get('text', '')
-                if text:
-                    # For title generation, only use actual text content
-                    if for_title:
-                        # Skip tool results and system messages
-                        skip_prefixes = (
-                            '1. Replaced', 'File "', 'Applied ', 'The file ', 'Contents of',
-                            'Error:', 'Traceback', 'WARNING:', 'INFO:', 'DEBUG:',
-                            'Successfully', 'Failed to', 'Created', 'Updated', 'Deleted',
-                            'Running', 'Executing', 'Processing', 'Building',
-                            '```', '---', '===', '...', 'Note:'
-                        )
-                        if not text.startswith(skip_prefixes) and not text.strip().startswith(('#', '//', '/*')):
-                            parts.append(text)
-                    else:
-                        parts.append(text)
-            elif item_type == 'tool_use' and not for_title:
-                # Format tool use as special content
-                tool_name = item.get('name', 'unknown')
-                tool_input = item.get('input', {})
-                parts.append(f"[Tool: {tool_name}]")
-                if isinstance(tool_input, dict) and tool_input:
-                    # Show key tool inputs
-                    for key, value in list(tool_input.items())[:3]:
-                        parts.append(f"  {key}: {str(value)[:100]}")
-            elif item_type == 'tool_result' and not for_title:
-                # Show tool results
-                content = item.get('content', '')
-                if isinstance(content, str):
-                    # Truncate long results
-                    if len(content) > 200:
-                        content = content[:200] + "..."
-                    parts.append(f"[Tool Result: {content}]")
+        if not isinstance(item, dict):
+            continue
+        item_type = item.get('type')
+        
+        if item_type == 'text':
+            text = item.get('text', '')
+            if text:
+                append(text)
+        elif item_type == 'tool_use':
+            # Format tool use as special content
+            tool_name = item.get('name', 'unknown')
+            tool_input = item.get('input', {})
+            append(f"[Tool: {tool_name}]")
+            if isinstance(tool_input, dict) and tool_input:
+                # Show key tool inputs
+                for key, value in islice(tool_input.items(), 3):
+                    append(f"  {key}: {str(value)[:100]}")
+        elif item_type == 'tool_result':
+            # Show tool results, truncating long ones; non-string results are skipped
+            content = item.get('content', '')
+            if isinstance(content, str):
+                append(f"[Tool Result: {content[:200]}...]" if len(content) > 200
+                       else f"[Tool Result: {content}]")
     
     return '\n'.join(parts) if parts else "[Empty message]"
 
 
+def _extract_title_text(content_list: List[Any]) -> str:
+    """Text items usable for a title; tool use and tool results are never looked at."""
+    parts = []
+    for item in content_list:
+        if isinstance(item, dict) and item.get('type') == 'text':
+            text = item.get('text', '')
+            # Skip tool results and system messages
+            if (text and not text.startswith(_TITLE_SKIP_PREFIXES)
+                    and not text.lstrip().startswith(_COMMENT_PREFIXES)):
+                parts.append(text)
+    return '\n'.join(parts) if parts else "[Empty message]"
+
+
 def render_message_detailed(entry: Dict[str, Any], fold_lines: int = 50) -> str:
     """Render a JSONL entry as detailed plaintext for aligned view.
 
@@ -222,7 +348,7 @@ def render_message_detailed(entry: Dict[str, Any], fold_lines: int = 50) -> str:
     if timestamp_str:
         ts = parse_timestamp(timestamp_str)
         if ts:
-            ts_display = f" [{datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')}]"
+            ts_display = f" [{format_timestamp(ts)}]"
 
     if entry_type == 'user':
         lines.append(f"## 👤 USER{ts_display}")
@@ -306,13 +432,13 @@ def load_raw_entries(file_path: str) -> List[Dict[str, Any]]:
     """Load raw JSON entries from a JSONL file without parsing into Messages."""
     entries = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             for line in f:
                 if not line.strip():
                     continue
                 try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
+                    entries.append(loads(line))
+                except ValueError:
                     continue
     except Exception as e:
         logger.error(f"Error loading raw entries from {file_path}: {e}")
@@ -321,57 +447,63 @@ def load_raw_entries(file_path: str) -> List[Dict[str, Any]]:
 
 def parse_timestamp(timestamp_str: str) -> Optional[float]:
     """Parse ISO timestamp to Unix timestamp."""
-    if not timestamp_str:
+    if not timestamp_str or not isinstance(timestamp_str, str):
         return None
-    
+    return _parse_iso_timestamp(timestamp_str)
+
+
+@lru_cache(maxsize=16384)
+def _parse_iso_timestamp(timestamp_str: str) -> Optional[float]:
+    """Parse an ISO timestamp string, memoized since sessions repeat timestamps."""
     try:
-        # Parse ISO format with timezone
-        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        return dt.timestamp()
-    except (ValueError, AttributeError):
+        # Parse ISO format with timezone; 3.11+ understands the trailing Z itself
+        if not _FROMISOFORMAT_ACCEPTS_Z:
+            timestamp_str = timestamp_str.replace('Z', '+00:00')
+        return datetime.fromisoformat(timestamp_str).timestamp()
+    except ValueError:
         return None
 
 
 def generate_title(messages: List[Message], project_name: Optional[str]) -> str:
     """Generate a title for the conversation."""
     # Look through messages for a good title
-    skip_continuation = True
-    for i, msg in enumerate(messages):
-        if msg.role == MessageRole.USER:
+    for msg in messages:
+        if msg.role == MessageRole.USER and msg.metadata:
             # Get the original message data to extract cleaner content
-            if hasattr(msg, 'metadata') and msg.metadata:
-                message_data = msg.metadata.get('message', {})
-                if message_data:
-                    content = extract_claude_content(message_data, for_title=True)
-                    
-                    # Check if this is a continuation message
-                    if "being continued from a previous conversation" in content:
-                        # Extract the summary part after the analysis
-                        if "Summary:" in content:
-                            # Look for actual user messages in the summary
-                            summary_start = content.find("Summary:")
-                            if summary_start != -1:
-                                summary_content = content[summary_start:]
-                                # Look for quoted user messages
-                                import re
-                                user_quotes = re.findall(r'"([^"]+)"', summary_content)
-                                for quote in user_quotes:
-                                    if len(quote) > 20 and not quote.startswith("This session"):
-                                        if len(quote) > 80:
-                                            return quote[:77] + "..."
-                                        return quote
-                        continue
-                    
-                    # Use first substantial line
-                    lines = content.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if len(line) > 20 and not line.startswith('['):
-                            # Truncate to reasonable length
-                            if len(line) > 80:
-                                return line[:77] + "..."
-                            return line
+            title = title_from_user_message(msg.metadata.get('message', {}))
+            if title:
+                return title
     
+    return fallback_title(messages, project_name)
+
+
+def title_from_user_message(message_data: Dict[str, Any]) -> Optional[str]:
+    """Title taken from one user message's content, or None if it has nothing usable."""
+    if not message_data:
+        return None
+    content = extract_claude_content(message_data, for_title=True)
+    
+    # Check if this is a continuation message
+    if "being continued from a previous conversation" in content:
+        # Extract the summary part after the analysis
+        summary_start = content.find("Summary:")
+        if summary_start != -1:
+            # Look for quoted user messages in the summary
+            for quote in _USER_QUOTE_RE.findall(content, summary_start):
+                if len(quote) > 20 and not quote.startswith("This session"):
+                    return _truncate_title(quote)
+        return None
+    
+    # Use first substantial line
+    for line in content.split('\n'):
+        line = line.strip()
+        if len(line) > 20 and not line.startswith('['):
+            return _truncate_title(line)
+    return None
+
+
+def fallback_title(messages: List[Message], project_name: Optional[str]) -> str:
+    """Title for a conversation whose user messages gave no usable title."""
     # If we only found continuation messages, try to extract something from them
     for msg in messages[:5]:  # Check first 5 messages
         if msg.role == MessageRole.ASSISTANT:
@@ -383,9 +515,7 @@ def generate_title(messages: List[Message], project_name: Optional[str]) -> str:
                     if any(phrase in line for phrase in ["I'll help", "Let me", "I can"]):
                         # Extract the action being performed
                         if len(line) > 20:
-                            if len(line) > 80:
-                                return line[:77] + "..."
-                            return line
+                            return _truncate_title(line)
     
     # Fallback to project name or timestamp
     if project_name:
@@ -394,11 +524,18 @@ def generate_title(messages: List[Message], project_name: Optional[str]) -> str:
         return f"Session in {clean_name}"
     
     if messages and messages[0].create_time:
-        return f"Claude session {datetime.fromtimestamp(messages[0].create_time).strftime('%Y-%m-%d %H:%M')}"
+        return f"Claude session {format_timestamp(messages[0].create_time)}"
     
     return "Claude conversation"
 
 
+def _truncate_title(title: str) -> str:
+    """Truncate a title to 80 characters."""
+    if len(title) > 80:
+        return title[:77] + "..."
+    return title
+
+
 def encode_path_like_claude(path: Path) -> str:
     """Encode a path the same way Claude does for project directories."""
     # Claude encodes paths by replacing special characters with dashes and adding a leading -
@@ -410,11 +547,10 @@ def encode_path_like_claude(path: Path) -> str:
     
     # Replace filesystem-problematic characters with dashes
     # This includes: / _ space . , ; : ! @ # $ % ^ & * ( ) + = [ ] { } | \ ` ~ ? < > "
-    import re
     # Replace any sequence of non-alphanumeric, non-hyphen characters with a single dash
-    path_str = re.sub(r'[^a-zA-Z0-9-]+', '-', path_str)
+    path_str = _NONALNUM_RE.sub('-', path_str)
     # Clean up multiple consecutive dashes
-    path_str = re.sub(r'-+', '-', path_str)
+    path_str = _DASH_RE.sub('-', path_str)
     # Remove trailing dashes
     path_str = path_str.strip('-')
     
@@ -426,12 +562,11 @@ def find_claude_project_for_cwd() -> Optional[str]:
     cwd = Path.cwd().resolve()
     projects_dir = Path.home() / ".claude" / "projects"
     
-    if not projects_dir.exists():
+    # Get all existing project names in one directory read
+    existing_projects = set(_list_dir(str(projects_dir), _PROJECT_DIRS))
+    if not existing_projects:
         return None
     
-    # Get all existing project names
-    existing_projects = {p.name for p in projects_dir.iterdir() if p.is_dir()}
-    
     # Find the deepest matching parent directory
     # Start with cwd and work up the directory tree
     current_path = cwd
@@ -449,33 +584,72 @@ def find_claude_project_for_cwd() -> Optional[str]:
 
 def list_claude_projects() -> List[Dict[str, Any]]:
     """List all Claude projects with metadata."""
-    projects_dir = Path.home() / ".claude" / "projects"
+    projects_dir = str(Path.home() / ".claude" / "projects")
+    
+    # Scanning is stat-bound, so threads overlap the syscalls without pickling overhead
+    project_dirs = [os.path.join(projects_dir, name) for name in _list_dir(projects_dir, _PROJECT_DIRS)]
+    if len(project_dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(project_dirs))) as executor:
+            projects = list(executor.map(_scan_project, project_dirs))
+    else:
+        projects = [_scan_project(p) for p in project_dirs]
     
-    if not projects_dir.exists():
+    # Sort by last modified (handle None values)
+    return sorted(projects, key=lambda p: p.get('last_modified') or 0, reverse=True)
+
+
+# Directory listings from earlier calls, keyed by (path, kind) and valid while the
+# directory's own mtime is unchanged (entries were neither added nor removed)
+_PROJECT_DIRS = 'dirs'
+_SESSION_FILES = 'jsonl'
+_listing_cache: Dict[Tuple[str, str], Tuple[int, List[str]]] = {}
+
+
+def _list_dir(dir_path: str, kind: str) -> List[str]:
+    """Names of subdirectories or .jsonl files in a directory, or [] if it can't be read."""
+    try:
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
         return []
     
-    projects = []
-    for project_dir in projects_dir.iterdir():
-        if project_dir.is_dir():
-            # Count conversations
-            jsonl_files = list(project_dir.glob("*.jsonl"))
-            
-            # Get most recent conversation time
-            latest_time = None
-            for jsonl_file in jsonl_files:
-                try:
-                    mtime = jsonl_file.stat().st_mtime
-                    if latest_time is None or mtime > latest_time:
-                        latest_time = mtime
-                except (OSError, FileNotFoundError):
-                    pass  # Skip files that can't be accessed
-            
-            projects.append({
-                'name': project_dir.name,
-                'path': str(project_dir),
-                'conversation_count': len(jsonl_files),
-                'last_modified': latest_time
-            })
+    key = (dir_path, kind)
+    cached = _listing_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     
-    # Sort by last modified (handle None values)
-    return sorted(projects, key=lambda p: p.get('last_modified') or 0, reverse=True)
\ No newline at end of file
+    try:
+        with os.scandir(dir_path) as it:
+            if kind == _PROJECT_DIRS:
+                names = [entry.name for entry in it if entry.is_dir()]
+            else:
+                names = [entry.name for entry in it if entry.name.endswith('.jsonl')]
+    except OSError:
+        return []
+    
+    _listing_cache[key] = (mtime, names)
+    return names
+
+
+def _scan_project(project_dir: str) -> Dict[str, Any]:
+    """Count a project's conversations and find its most recent modification time."""
+    session_files = _list_dir(project_dir, _SESSION_FILES)
+    
+    # Appending to a session doesn't touch the directory mtime, so the files are always stat'ed
+    prefix = project_dir + os.sep
+    mtimes = (_mtime(prefix + name) for name in session_files)
+    latest_time = max((mtime for mtime in mtimes if mtime is not None), default=None)
+    
+    return {
+        'name': os.path.basename(project_dir),
+        'path': project_dir,
+        'conversation_count': len(session_files),
+        'last_modified': latest_time
+    }
+
+
+def _mtime(file_path: str) -> Optional[float]:
+    """A file's mtime, or None for files that can't be accessed."""
+    try:
+        return os.stat(file_path).st_mtime
+    except OSError:
+        return None
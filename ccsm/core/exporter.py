@@ -1,17 +1,23 @@
 #!/usr/bin/env python3
 """Shared conversation export functionality."""
 
-import json
-import io
+import copy
 import hashlib
-from typing import Optional, Dict, Tuple, List, Any
-from datetime import datetime
+import time
+from typing import Optional, Dict, Tuple, List, Any, Iterator
+from ccsm.core.json_compat import dumps_indented
 from ccsm.core.models import Conversation, MessageRole
+from ccsm.core.time_utils import format_timestamp
 
 # Simple in-memory cache for exported conversations
 _export_cache: Dict[str, Tuple[str, float]] = {}
 _cache_max_size = 50
 
+# Role labels are fixed per role, so build them once rather than per message
+_ROLE_ICONS = {MessageRole.USER: "👤 ", MessageRole.ASSISTANT: "🤖 "}
+_MARKDOWN_ROLE_HEADERS = {role: f"## {_ROLE_ICONS.get(role, '')}{role.value.upper()}\n\n" for role in MessageRole}
+_TEXT_ROLE_LABELS = {role: f"{role.value.upper()}:\n{'-' * 70}\n" for role in MessageRole}
+
 
 def export_conversation(conversation: Conversation, format: str = "markdown") -> str:
     """Export a conversation to the specified format.
@@ -34,12 +40,7 @@ def export_conversation(conversation: Conversation, format: str = "markdown") ->
             return content
     
     # Generate content
-    if format == "json":
-        content = export_as_json(conversation)
-    elif format == "text":
-        content = export_as_text(conversation)
-    else:  # markdown is default
-        content = export_as_markdown(conversation)
+    content = "".join(export_conversation_iter(conversation, format))
     
     # Cache the result
     _cache_export(cache_key, content)
@@ -47,6 +48,24 @@ def export_conversation(conversation: Conversation, format: str = "markdown") ->
     return content
 
 
+def export_conversation_iter(conversation: Conversation, format: str = "markdown") -> Iterator[str]:
+    """Export a conversation in chunks, without building the whole document.
+    
+    Args:
+        conversation: The conversation to export
+        format: Export format - "markdown", "text", or "json"
+        
+    Returns:
+        Iterator over consecutive pieces of the formatted conversation
+    """
+    if format == "json":
+        return iter((export_as_json(conversation),))
+    elif format == "text":
+        return _iter_text(conversation)
+    else:  # markdown is default
+        return _iter_markdown(conversation)
+
+
 def _get_cache_key(conversation: Conversation, format: str) -> str:
     """Generate cache key for conversation."""
     key_data = f"{conversation.id}:{conversation.update_time or 0}:{format}"
@@ -64,95 +83,67 @@ def _cache_export(cache_key: str, content: str) -> None:
                         key=lambda k: _export_cache[k][1])
         del _export_cache[oldest_key]
     
-    _export_cache[cache_key] = (content, datetime.now().timestamp())
+    _export_cache[cache_key] = (content, time.time())
 
 
 def export_as_markdown(conversation: Conversation) -> str:
-    """Export conversation as markdown using optimized string building."""
-    # Use StringIO for efficient string building
-    output = io.StringIO()
-    
+    """Export conversation as markdown."""
+    return "".join(_iter_markdown(conversation))
+
+
+def _iter_markdown(conversation: Conversation) -> Iterator[str]:
+    """Yield a markdown export one header or message at a time."""
     # Pre-format timestamps to avoid repeated formatting
     created_str = None
     updated_str = None
     if conversation.create_time:
-        created_str = datetime.fromtimestamp(conversation.create_time).strftime("%Y-%m-%d %H:%M:%S")
+        created_str = format_timestamp(conversation.create_time, "%Y-%m-%d %H:%M:%S")
     if conversation.update_time and conversation.update_time != conversation.create_time:
-        updated_str = datetime.fromtimestamp(conversation.update_time).strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Title and metadata
-    output.write(f"# {conversation.title}\n\n")
-    
-    # Add session ID for resuming Claude sessions
-    output.write(f"**Session ID:** {conversation.id}\n")
+        updated_str = format_timestamp(conversation.update_time, "%Y-%m-%d %H:%M:%S")
     
+    # Title and metadata, with session ID for resuming Claude sessions
+    header = [f"# {conversation.title}\n\n", f"**Session ID:** {conversation.id}\n"]
     if created_str:
-        output.write(f"**Created:** {created_str}\n")
+        header.append(f"**Created:** {created_str}\n")
     if updated_str:
-        output.write(f"**Updated:** {updated_str}\n")
-    
-    output.write(f"**Messages:** {len(conversation.messages)}\n\n---\n\n")
+        header.append(f"**Updated:** {updated_str}\n")
+    header.append(f"**Messages:** {len(conversation.messages)}\n\n---\n\n")
+    yield "".join(header)
     
     # Pre-compile code detection patterns for efficiency
     code_indicators = ("import ", "def ", "class ", "function ", "const ", "var ", "let ")
     
     # Messages
     for msg in conversation.messages:
-        role_name = msg.role.value.upper()
-        
-        # Role header
-        if msg.role == MessageRole.USER:
-            output.write(f"## 👤 {role_name}\n\n")
-        elif msg.role == MessageRole.ASSISTANT:
-            output.write(f"## 🤖 {role_name}\n\n")
-        else:
-            output.write(f"## {role_name}\n\n")
+        role_header = _MARKDOWN_ROLE_HEADERS[msg.role]
         
         # Content
         content = msg.content
         
         # Optimized code detection
-        if "```" in content:
-            # Already has code blocks
-            output.write(content)
-        else:
+        if "```" not in content:
             # Quick check for code patterns
             looks_like_code = ("\n" in content and 
                              any(content.find(indicator) != -1 for indicator in code_indicators))
-            
             if looks_like_code:
-                output.write("```\n")
-                output.write(content)
-                output.write("\n```")
-            else:
-                output.write(content)
+                content = f"```\n{content}\n```"
         
-        output.write("\n\n---\n\n")
-    
-    return output.getvalue()
+        yield f"{role_header}{content}\n\n---\n\n"
 
 
 def export_as_text(conversation: Conversation) -> str:
-    """Export conversation as plain text using optimized string building."""
-    output = io.StringIO()
-    
+    """Export conversation as plain text."""
+    return "".join(_iter_text(conversation))
+
+
+def _iter_text(conversation: Conversation) -> Iterator[str]:
+    """Yield a plain text export one header or message at a time."""
     # Title and session ID
-    output.write(f"Conversation: {conversation.title}\n")
-    output.write(f"Session ID: {conversation.id}\n")
-    output.write("=" * 70)
-    output.write("\n\n")
+    yield f"Conversation: {conversation.title}\nSession ID: {conversation.id}\n{'=' * 70}\n\n"
     
     # Messages
-    separator = "-" * 70
     for msg in conversation.messages:
-        role_name = msg.role.value.upper()
-        output.write(f"{role_name}:\n")
-        output.write(separator)
-        output.write("\n")
-        output.write(msg.content)
-        output.write("\n\n")
-    
-    return output.getvalue()
+        yield f"{_TEXT_ROLE_LABELS[msg.role]}{msg.content}\n\n"
 
 
 def export_as_json(conversation: Conversation) -> str:
@@ -173,7 +164,15 @@ def export_as_json(conversation: Conversation) -> str:
         ]
     }
     
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return dumps_indented(data)
+
+
+def _fold_text(text: str, fold_lines: int) -> str:
+    """Keep the first and last five lines of text longer than fold_lines."""
+    lines = text.split('\n')
+    if len(lines) <= fold_lines:
+        return text
+    return '\n'.join(lines[:5] + [f'... ({len(lines) - 10} lines folded) ...'] + lines[-5:])
 
 
 def fold_json_entry(entry: Dict[str, Any], fold_lines: int = 50) -> Dict[str, Any]:
@@ -186,39 +185,31 @@ def fold_json_entry(entry: Dict[str, Any], fold_lines: int = 50) -> Dict[str, An
     Returns:
         Copy of entry with large fields collapsed
     """
-    import copy
     result = copy.deepcopy(entry)
 
-    # Fold usage block to summary
-    if 'message' in result and isinstance(result['message'], dict):
-        msg = result['message']
+    msg = result.get('message')
+    if isinstance(msg, dict):
+        # Fold usage block to summary
         if 'usage' in msg and isinstance(msg['usage'], dict):
             usage = msg['usage']
             total = usage.get('input_tokens', 0) + usage.get('output_tokens', 0)
             msg['usage'] = {'_summary': f'{total} tokens', '_folded': True}
 
-    # Fold toolUseResult stdout/stderr
-    if 'toolUseResult' in result and isinstance(result['toolUseResult'], dict):
-        tr = result['toolUseResult']
-        for key in ['stdout', 'stderr']:
-            if key in tr and isinstance(tr[key], str):
-                lines = tr[key].split('\n')
-                if len(lines) > fold_lines:
-                    folded = lines[:5] + [f'... ({len(lines) - 10} lines folded) ...'] + lines[-5:]
-                    tr[key] = '\n'.join(folded)
-
-    # Fold large tool_result content in message.content
-    if 'message' in result and isinstance(result['message'], dict):
-        content_list = result['message'].get('content', [])
+        # Fold large tool_result content in message.content
+        content_list = msg.get('content', [])
         if isinstance(content_list, list):
             for item in content_list:
                 if isinstance(item, dict) and item.get('type') == 'tool_result':
                     content = item.get('content', '')
                     if isinstance(content, str):
-                        lines = content.split('\n')
-                        if len(lines) > fold_lines:
-                            folded = lines[:5] + [f'... ({len(lines) - 10} lines folded) ...'] + lines[-5:]
-                            item['content'] = '\n'.join(folded)
+                        item['content'] = _fold_text(content, fold_lines)
+
+    # Fold toolUseResult stdout/stderr
+    if 'toolUseResult' in result and isinstance(result['toolUseResult'], dict):
+        tr = result['toolUseResult']
+        for key in ['stdout', 'stderr']:
+            if key in tr and isinstance(tr[key], str):
+                tr[key] = _fold_text(tr[key], fold_lines)
 
     return result
 
@@ -245,7 +236,7 @@ def export_aligned(
     for entry in raw_entries:
         # Render JSON (folded, pretty-printed)
         folded = fold_json_entry(entry, fold_lines)
-        json_str = json.dumps(folded, indent=2, ensure_ascii=False)
+        json_str = dumps_indented(folded)
         json_lines = json_str.split('\n')
 
         # Render plaintext
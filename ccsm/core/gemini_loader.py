@@ -8,23 +8,27 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 import uuid
 from ccsm.core.models import Conversation, Message, MessageRole
+from ccsm.core.cache import load_directory_cached
+from ccsm.core.parallel import map_files
+from ccsm.core.time_utils import format_timestamp
 from ccsm.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-def load_gemini_conversations(file_path: str) -> List[Conversation]:
+def load_gemini_conversations(file_path: str, use_cache: bool = False) -> List[Conversation]:
     """Load conversations from Gemini JSON format."""
     if os.path.isdir(file_path):
-        # Load all conversations from a project directory
-        conversations = []
-        for session_dir in Path(file_path).iterdir():
-            if session_dir.is_dir():
-                # Look for checkpoint files within each session directory
-                for checkpoint_file in session_dir.glob("checkpoint-*.json"):
-                    conv = load_gemini_conversation(str(checkpoint_file))
-                    if conv:
-                        conversations.append(conv)
+        # Look for checkpoint files within each session directory
+        checkpoint_files = [
+            str(checkpoint_file)
+            for session_dir in Path(file_path).iterdir() if session_dir.is_dir()
+            for checkpoint_file in session_dir.glob("checkpoint-*.json")
+        ]
+        if use_cache:
+            conversations = load_directory_cached(file_path, checkpoint_files, "gemini", load_gemini_conversation)
+        else:
+            conversations = [conv for conv in map_files(load_gemini_conversation, checkpoint_files) if conv]
         return sorted(conversations, key=lambda c: c.create_time or 0, reverse=True)
     else:
         # Load single conversation file
@@ -134,6 +138,6 @@ def generate_title(messages: List[Message]) -> str:
             return title[:80] if len(title) > 80 else title
     
     if messages and messages[0].create_time:
-        return f"Gemini session {datetime.fromtimestamp(messages[0].create_time, tz=timezone.utc).strftime('%Y-%m-%d %H:%M')}"
+        return f"Gemini session {format_timestamp(messages[0].create_time, utc=True)}"
 
     return "Gemini conversation"
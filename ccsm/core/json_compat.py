@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""JSON decoding and encoding that use orjson when it is installed, stdlib json otherwise."""
+
+import json
+import mmap
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch this either way
+JSONDecodeError = json.JSONDecodeError
+
+# Both accept bytes, which lets callers skip decoding files to str first
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def _has_divergent_float(obj: Any) -> bool:
+    """Whether obj holds a float that orjson writes differently from json.dumps.
+
+    orjson writes NaN and infinities as null and never uses json's exponent
+    form (1e+16, 1e-05), so any float outside [1e-4, 1e16) counts.
+    """
+    pending = [obj]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, float):
+            if value and not 1e-4 <= abs(value) < 1e16:
+                return True
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return False
+
+
+def dumps_indented(obj: Any) -> str:
+    """Encode as 2-space indented JSON with non-ASCII kept, like json.dumps(indent=2, ensure_ascii=False).
+
+    Falls back to stdlib json for values orjson rejects, such as integers
+    wider than 64 bits or non-string keys, and for floats it would format
+    differently, so the output doesn't depend on whether orjson is installed.
+    """
+    if orjson is not None and not _has_divergent_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def load_file(file_path: str) -> Any:
+    """Decode a whole JSON file.
+
+    With orjson the file is memory-mapped and parsed in place, so a large
+    export is never copied into a Python bytes object alongside the result.
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty file, or not mappable (pipes, some filesystems)
+            return orjson.loads(f.read())
+        with mapped:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
@@ -1,54 +1,100 @@
 #!/usr/bin/env python3
 """Simple conversation loader for ChatGPT exports."""
 
-import json
 import os
-from typing import List, Dict, Any
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
 from ccsm.core.models import Conversation, Message, MessageRole
 from ccsm.core.claude_loader import load_claude_conversations, load_claude_conversation
 from ccsm.core.gemini_loader import load_gemini_conversations, load_gemini_conversation
 from ccsm.core.lazy_loader import LazyConversationLoader, ConversationMetadata
+from ccsm.core.cache import load_file_cached
+from ccsm.core.json_compat import load_file
 from ccsm.core.performance import get_performance_monitor, enable_performance_monitoring, ProgressIndicator
 from ccsm.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Role strings to roles; a dict lookup is several times cheaper than MessageRole(value)
+_ROLES = {role.value: role for role in MessageRole}
 
-def load_conversations(file_path: str, format: str = "auto", use_lazy_loading: bool = False) -> List[Conversation]:
-    """Load conversations from file with format detection."""
+
+def load_conversations(file_path: str, format: str = "auto", use_lazy_loading: bool = False,
+                       use_cache: bool = True, metadata_only: bool = False) -> List[Conversation]:
+    """Load conversations from file with format detection.
+
+    Parsed results are cached on disk keyed by file mtime and size, so repeat
+    invocations only re-parse files that changed. Pass use_cache=False to bypass.
+    metadata_only skips keeping message bodies for Claude sessions; callers then
+    use get_message_count() instead of len(messages).
+    """
     monitor = get_performance_monitor()
     
     with monitor.measure("load_conversations", file_path=file_path, format=format, lazy=use_lazy_loading):
-        # Auto-detect format
-        if format == "auto":
-            if os.path.isdir(file_path):
-                # Directory implies Claude or Gemini project
-                if ".gemini" in file_path:
-                    format = "gemini"
-                else:
-                    format = "claude"
-            elif file_path.endswith('.jsonl'):
-                format = "claude"
-            else:
-                format = "chatgpt"
+        format = detect_format(file_path, format)
         
         # Use lazy loading for large datasets
         if use_lazy_loading:
             return _load_conversations_lazy(file_path, format)
         
         # Route to appropriate loader
+        variant = format
         if format == "claude":
-            return load_claude_conversations(file_path)
+            loader = load_claude_conversations
+            if metadata_only:
+                loader = partial(load_claude_conversations, metadata_only=True)
+                variant = "claude-metadata"
         elif format == "gemini":
-            return load_gemini_conversations(file_path)
+            loader = load_gemini_conversations
         else:
-            return load_chatgpt_conversations(file_path)
+            loader = load_chatgpt_conversations
+        
+        if not use_cache:
+            return loader(file_path)
+        if loader is not load_chatgpt_conversations and os.path.isdir(file_path):
+            # Project directories are cached per file so one new session doesn't re-parse the rest
+            return loader(file_path, use_cache=True)
+        return load_file_cached(file_path, variant, loader)
+
+
+def detect_format(file_path: str, format: str = "auto") -> str:
+    """Resolve "auto" to chatgpt, claude or gemini from the path."""
+    if format != "auto":
+        return format
+    if os.path.isdir(file_path):
+        # Directory implies Claude or Gemini project
+        return "gemini" if ".gemini" in file_path else "claude"
+    if file_path.endswith('.jsonl'):
+        return "claude"
+    return "chatgpt"
+
+
+def load_conversation_at(file_path: str, index: int, format: str = "auto",
+                         use_cache: bool = True) -> Tuple[Optional[Conversation], int]:
+    """Load the conversation at a 0-based position in listing order.
+
+    Returns (conversation, total) where conversation is None if index is out
+    of range. For Claude project directories only the metadata listing (the
+    same one `list` uses) and the one selected session file are parsed.
+    """
+    format = detect_format(file_path, format)
+    if format == "claude" and os.path.isdir(file_path):
+        listing = load_conversations(file_path, format=format, use_cache=use_cache, metadata_only=True)
+        if not 0 <= index < len(listing):
+            return None, len(listing)
+        # Its messages are parsed from the session file when the export reads them
+        return listing[index], len(listing)
+
+    conversations = load_conversations(file_path, format=format, use_cache=use_cache)
+    if not 0 <= index < len(conversations):
+        return None, len(conversations)
+    return conversations[index], len(conversations)
 
 
 def load_chatgpt_conversations(file_path: str) -> List[Conversation]:
     """Load conversations from ChatGPT JSON export."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Memory-mapped and parsed in place when orjson is installed
+    data = load_file(file_path)
     
     # Handle wrapped format
     if isinstance(data, dict) and 'conversations' in data:
@@ -128,6 +174,14 @@ def add_messages_from_node(mapping: Dict, node_id: str, messages: List[Message],
         add_messages_from_node(mapping, child_id, messages, visited)
 
 
+def _parse_role(value: Any) -> MessageRole:
+    """Role named by a role string, or UNKNOWN for anything else."""
+    try:
+        return _ROLES.get(value, MessageRole.UNKNOWN)
+    except TypeError:  # Unhashable, so certainly not a role string
+        return MessageRole.UNKNOWN
+
+
 def parse_message(msg_data: Dict[str, Any]) -> Message:
     """Parse a message from various formats."""
     if not msg_data:
@@ -137,19 +191,12 @@ def parse_message(msg_data: Dict[str, Any]) -> Message:
     msg_id = msg_data.get('id', '')
     
     # Extract role
-    role = MessageRole.UNKNOWN
     if 'role' in msg_data:
-        try:
-            role = MessageRole(msg_data['role'])
-        except ValueError:
-            pass
-    elif 'author' in msg_data and isinstance(msg_data['author'], dict):
-        author_role = msg_data['author'].get('role')
-        if author_role:
-            try:
-                role = MessageRole(author_role)
-            except ValueError:
-                pass
+        role = _parse_role(msg_data['role'])
+    elif isinstance(msg_data.get('author'), dict):
+        role = _parse_role(msg_data['author'].get('role'))
+    else:
+        role = MessageRole.UNKNOWN
     
     # Extract content
     content = extract_content(msg_data)
@@ -5,7 +5,7 @@ Core data models for ChatGPT conversation browser.
 Defines the fundamental data structures used throughout the application.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from ccsm.core.type_definitions import MessageDict, ConversationDict, Timestamp
@@ -77,6 +77,13 @@ class Conversation:
     create_time: Optional[Timestamp] = None
     update_time: Optional[Timestamp] = None
     metadata: Optional[Dict[str, Any]] = None
+    message_count: Optional[int] = None  # Set when loaded metadata-only (messages left empty)
+    title_lower: str = field(default="", init=False, repr=False, compare=False)
+    _content_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the lowercased title used by title searches."""
+        self.title_lower = self.title.lower() if self.title else ""
     
     @classmethod
     def from_dict(cls, data: ConversationDict) -> 'Conversation':
@@ -109,8 +116,17 @@ class Conversation:
     
     def get_message_count(self) -> int:
         """Get the number of messages in this conversation."""
+        if self.message_count is not None:
+            return self.message_count
         return len(self.messages)
     
+    def contains_text(self, query_lower: str) -> bool:
+        """Check whether any message contains an already-lowercased query."""
+        # Lowercase all messages once, NUL-separated so matches can't span messages
+        if self._content_lower is None:
+            self._content_lower = "\0".join(msg.content for msg in self.messages).lower()
+        return query_lower in self._content_lower
+    
     def get_last_message_time(self) -> Optional[Timestamp]:
         """Get the timestamp of the last message."""
         if not self.messages:
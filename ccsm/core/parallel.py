@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Parse many conversation files across CPU cores."""
+
+import os
+from typing import Callable, List, TypeVar
+
+from ccsm.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+
+def map_files(loader: Callable[[str], T], file_paths: List[str]) -> List[T]:
+    """Apply loader to each file, in order, using a process pool for larger batches.
+
+    loader must be picklable (a module-level function or a partial of one).
+    Falls back to loading serially if worker processes can't be used.
+    """
+    workers = min(os.cpu_count() or 1, len(file_paths))
+    if len(file_paths) < PARALLEL_MIN_FILES or workers < 2:
+        return [loader(file_path) for file_path in file_paths]
+
+    try:
+        # Deferred: multiprocessing is slow to import and most runs only parse a few changed files
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            return list(executor.map(loader, file_paths, chunksize=chunksize))
+    except Exception as e:
+        logger.debug(f"Parallel load unavailable, loading serially: {e}")
+        return [loader(file_path) for file_path in file_paths]
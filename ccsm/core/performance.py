@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
 """Performance monitoring and profiling utilities."""
 
+import sys
 import time
 import psutil
 import functools
-from typing import Dict, Any, Optional, List, Callable
+from typing import Deque, Dict, Any, Optional, List, Callable, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
-from contextlib import contextmanager
+from collections import defaultdict, deque
+from itertools import islice
+from contextlib import contextmanager, nullcontext
 
 from ccsm.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# dataclass(slots=True) needs Python 3.10; older versions keep a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Only the newest metrics are kept; aggregated_stats covers the full history
+MAX_METRICS = 10000
+
+# Memory readings younger than this are reused; each fresh one is a /proc read
+MEMORY_SAMPLE_INTERVAL = 0.1
+
+
+@dataclass(**_SLOTS)
 class PerformanceMetric:
     """Individual performance metric."""
     name: str
@@ -24,9 +35,19 @@ class PerformanceMetric:
     memory_before: Optional[float] = None
     memory_after: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    start_ns: Optional[int] = field(default=None, repr=False)  # perf_counter_ns() at start
     
     def finish(self, end_time: Optional[float] = None) -> float:
-        """Mark the metric as finished and calculate duration."""
+        """Mark the metric as finished and calculate duration.
+
+        When started with start_ns and no end_time is given, the duration
+        comes from the monotonic perf_counter_ns clock rather than wall time.
+        """
+        if end_time is None and self.start_ns is not None:
+            self.duration = (time.perf_counter_ns() - self.start_ns) / 1e9
+            self.end_time = self.start_time + self.duration
+            return self.duration
+        
         self.end_time = end_time or time.time()
         self.duration = self.end_time - self.start_time
         return self.duration
@@ -38,28 +59,43 @@ class PerformanceMetric:
         self.metadata['memory_delta'] = after - before
 
 
+@dataclass(**_SLOTS)
+class OperationStats:
+    """Running duration statistics for one operation name."""
+    count: int = 0
+    total_time: float = 0.0
+    min_time: float = float('inf')
+    max_time: float = 0.0
+    last_time: float = 0.0
+    
+    def add(self, duration: float) -> None:
+        """Fold one more duration into the statistics."""
+        self.count += 1
+        self.total_time += duration
+        if duration < self.min_time:
+            self.min_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.last_time = duration
+
+
 class PerformanceMonitor:
     """Performance monitoring and metrics collection."""
     
     def __init__(self, enabled: bool = True):
         self.enabled = enabled
-        self.metrics: List[PerformanceMetric] = []
+        self.metrics: Deque[PerformanceMetric] = deque(maxlen=MAX_METRICS)
         self.active_metrics: Dict[str, PerformanceMetric] = {}
-        self.aggregated_stats: Dict[str, List[float]] = defaultdict(list)
+        self.aggregated_stats: Dict[str, OperationStats] = defaultdict(OperationStats)
         self.logger = get_logger(__name__)
+        self._process: Optional[psutil.Process] = None
+        self._memory_sample: Optional[Tuple[float, float]] = None  # (monotonic time, MB)
     
-    @contextmanager
     def measure(self, operation_name: str, **metadata):
         """Context manager for measuring operation performance."""
         if not self.enabled:
-            yield
-            return
-        
-        metric = self.start_metric(operation_name, **metadata)
-        try:
-            yield metric
-        finally:
-            self.end_metric(operation_name)
+            return _NOT_MEASURED
+        return _Measure(self, operation_name, metadata)
     
     def start_metric(self, name: str, **metadata) -> PerformanceMetric:
         """Start measuring a performance metric."""
@@ -71,7 +107,8 @@ class PerformanceMonitor:
             name=name,
             start_time=time.time(),
             memory_before=memory_before,
-            metadata=metadata
+            metadata=metadata,
+            start_ns=time.perf_counter_ns()
         )
         
         self.active_metrics[name] = metric
@@ -93,7 +130,7 @@ class PerformanceMonitor:
             metric.add_memory_usage(metric.memory_before, memory_after)
         
         self.metrics.append(metric)
-        self.aggregated_stats[name].append(duration)
+        self.aggregated_stats[name].add(duration)
         
         self.logger.debug(f"Performance: {name} took {duration:.3f}s")
         return duration
@@ -102,15 +139,15 @@ class PerformanceMonitor:
         """Get aggregated performance statistics."""
         stats = {}
         
-        for name, durations in self.aggregated_stats.items():
-            if durations:
+        for name, op in self.aggregated_stats.items():
+            if op.count:
                 stats[name] = {
-                    'count': len(durations),
-                    'total_time': sum(durations),
-                    'avg_time': sum(durations) / len(durations),
-                    'min_time': min(durations),
-                    'max_time': max(durations),
-                    'last_time': durations[-1] if durations else 0
+                    'count': op.count,
+                    'total_time': op.total_time,
+                    'avg_time': op.total_time / op.count,
+                    'min_time': op.min_time,
+                    'max_time': op.max_time,
+                    'last_time': op.last_time
                 }
         
         # Add system stats
@@ -119,7 +156,9 @@ class PerformanceMonitor:
     
     def get_recent_metrics(self, limit: int = 10) -> List[PerformanceMetric]:
         """Get the most recent performance metrics."""
-        return self.metrics[-limit:] if self.metrics else []
+        recent = list(islice(reversed(self.metrics), limit))
+        recent.reverse()
+        return recent
     
     def clear_metrics(self) -> None:
         """Clear all stored metrics."""
@@ -140,13 +179,20 @@ class PerformanceMonitor:
             for metric in slow_ops:
                 self.logger.warning(f"  {metric.name}: {metric.duration:.3f}s")
     
-    def _get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
+    def _get_memory_usage(self, max_age: float = MEMORY_SAMPLE_INTERVAL) -> float:
+        """Get current memory usage in MB, reusing a reading up to max_age seconds old."""
+        now = time.monotonic()
+        if self._memory_sample is not None and now - self._memory_sample[0] < max_age:
+            return self._memory_sample[1]
+        
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # Convert to MB
+            if self._process is None:
+                self._process = psutil.Process()
+            memory = self._process.memory_info().rss / 1024 / 1024  # Convert to MB
         except (psutil.NoSuchProcess, AttributeError):
             return 0.0
+        self._memory_sample = (now, memory)
+        return memory
     
     def _get_system_stats(self) -> Dict[str, Any]:
         """Get current system performance statistics."""
@@ -161,6 +207,30 @@ class PerformanceMonitor:
             return {}
 
 
+class _Measure:
+    """Context manager behind PerformanceMonitor.measure.
+
+    A plain class rather than @contextmanager, so each measurement skips
+    creating and resuming a generator.
+    """
+    __slots__ = ('monitor', 'name', 'metadata')
+    
+    def __init__(self, monitor: PerformanceMonitor, name: str, metadata: Dict[str, Any]):
+        self.monitor = monitor
+        self.name = name
+        self.metadata = metadata
+    
+    def __enter__(self) -> PerformanceMetric:
+        return self.monitor.start_metric(self.name, **self.metadata)
+    
+    def __exit__(self, *exc_info) -> bool:
+        self.monitor.end_metric(self.name)
+        return False
+
+
+_NOT_MEASURED = nullcontext()
+
+
 # Global performance monitor instance
 _performance_monitor = PerformanceMonitor(enabled=False)  # Disabled by default
 
@@ -202,14 +272,15 @@ def memory_monitor(operation_name: str):
         yield
         return
     
-    memory_before = _performance_monitor._get_memory_usage()
-    start_time = time.time()
+    # This is the one place a precise delta is the point, so skip the sample cache
+    memory_before = _performance_monitor._get_memory_usage(max_age=0)
+    start_ns = time.perf_counter_ns()
     
     try:
         yield
     finally:
-        memory_after = _performance_monitor._get_memory_usage()
-        duration = time.time() - start_time
+        memory_after = _performance_monitor._get_memory_usage(max_age=0)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         memory_delta = memory_after - memory_before
         
         if memory_delta > 1.0:  # Log if memory increased by more than 1MB
@@ -231,10 +302,16 @@ class ProgressIndicator:
         self.last_update = 0
         self.update_interval = 1.0  # Update every second
         self.logger = get_logger(__name__)
+        # Only look at the clock about a thousand times over the whole run
+        self._check_interval = max(1, total_items // 1000)
+        self._next_check = self._check_interval
     
     def update(self, increment: int = 1) -> None:
         """Update progress by the specified increment."""
         self.current_item += increment
+        if self.current_item < self._next_check and self.current_item < self.total_items:
+            return
+        self._next_check = self.current_item + self._check_interval
         current_time = time.time()
         
         # Only update if enough time has passed or we're done
@@ -1,65 +1,56 @@
 #!/usr/bin/env python3
 """Time formatting utilities."""
 
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from bisect import bisect_right
+from typing import Iterable, List, Optional
 
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
 
-def format_relative_time(timestamp: Optional[float]) -> str:
+# Upper bound of each relative-time bucket, and the unit each bucket counts in
+_BUCKET_BOUNDS = (HOUR, DAY, 7 * DAY, 30 * DAY, 365 * DAY)
+_BUCKET_UNITS = (
+    (MINUTE, "m", "m"),
+    (HOUR, "h", "h"),
+    (DAY, " day", " days"),
+    (7 * DAY, " week", " weeks"),
+    (30 * DAY, " month", " months"),
+    (365 * DAY, " year", " years"),
+)
+
+
+def _bucket(delta: float) -> int:
+    """Index into _BUCKET_UNITS for an age in seconds."""
+    return bisect_right(_BUCKET_BOUNDS, delta)
+
+
+def format_relative_time(timestamp: Optional[float], now: Optional[float] = None) -> str:
     """Format timestamp as relative time (e.g., '2h ago', '3 days ago')."""
     if not timestamp:
         return "Unknown"
-    
-    now = datetime.now()
-    then = datetime.fromtimestamp(timestamp)
-    delta = now - then
-    
-    # Less than an hour
-    if delta < timedelta(hours=1):
-        minutes = int(delta.total_seconds() / 60)
-        if minutes < 1:
-            return "Just now"
-        elif minutes == 1:
-            return "1m ago"
-        else:
-            return f"{minutes}m ago"
-    
-    # Less than a day
-    elif delta < timedelta(days=1):
-        hours = int(delta.total_seconds() / 3600)
-        if hours == 1:
-            return "1h ago"
-        else:
-            return f"{hours}h ago"
-    
-    # Less than a week
-    elif delta < timedelta(days=7):
-        days = delta.days
-        if days == 1:
-            return "1 day ago"
-        else:
-            return f"{days} days ago"
-    
-    # Less than a month
-    elif delta < timedelta(days=30):
-        weeks = delta.days // 7
-        if weeks == 1:
-            return "1 week ago"
-        else:
-            return f"{weeks} weeks ago"
-    
-    # Less than a year
-    elif delta < timedelta(days=365):
-        months = delta.days // 30
-        if months == 1:
-            return "1 month ago"
-        else:
-            return f"{months} months ago"
-    
-    # More than a year
-    else:
-        years = delta.days // 365
-        if years == 1:
-            return "1 year ago"
-        else:
-            return f"{years} years ago"
\ No newline at end of file
+
+    if now is None:
+        now = time.time()
+    delta = now - timestamp
+    if delta < MINUTE:
+        return "Just now"
+
+    unit, singular, plural = _BUCKET_UNITS[_bucket(delta)]
+    count = int(delta // unit)
+    return f"{count}{singular if count == 1 else plural} ago"
+
+
+def format_relative_times(timestamps: Iterable[Optional[float]]) -> List[str]:
+    """Format many timestamps against a single reading of the clock."""
+    now = time.time()
+    return [format_relative_time(timestamp, now) for timestamp in timestamps]
+
+
+def format_timestamp(timestamp: float, fmt: str = "%Y-%m-%d %H:%M", utc: bool = False) -> str:
+    """Format a Unix timestamp with strftime, in local time unless utc is set.
+
+    Goes through time.localtime/gmtime rather than building a datetime.
+    """
+    return time.strftime(fmt, time.gmtime(timestamp) if utc else time.localtime(timestamp))
@@ -3,13 +3,41 @@
 
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Tuple
 
 from ccsm.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Control characters other than tab and newline: as bytes for ASCII input, and
+# as a regex for the rest, where it beats a str.translate table several times over
+_CONTROL_BYTES = bytes(c for c in range(32) if c not in (0x09, 0x0A))
+_CONTROL_RE = re.compile(r'[\x00-\x08\x0b-\x1f]')
+
+_VALID_EXPORT_FORMATS = frozenset(("text", "markdown", "json"))
+
+# Listing counts accepted by validate_count_parameter's default bounds
+_DEFAULT_COUNT_RANGE = range(1, 1001)
+
+# Cached validators return (result, warning) so repeat inputs still log; the
+# warning is a logger.warning argument tuple, or None when the input is valid
+_Checked = Tuple[Any, Optional[Tuple]]
+
+# JSON whitespace followed by the opening bracket of an array
+_ARRAY_START_RE = re.compile(r'[ \t\n\r]*\[')
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """Parse a plain decimal integer, returning None instead of raising ValueError."""
+    text = text.strip()
+    digits = text[1:] if text[:1] in ('+', '-') else text
+    if not digits.isdecimal():
+        return None
+    return int(text)
+
 
 def validate_file_path(file_path: str, must_exist: bool = True) -> Optional[Path]:
     """
@@ -23,10 +51,14 @@ def validate_file_path(file_path: str, must_exist: bool = True) -> Optional[Path
         Normalized Path object if valid, None otherwise
     """
     try:
-        path = Path(file_path).resolve()
+        # An absolute, already-normalized path needs no realpath syscalls
+        if os.path.isabs(file_path) and os.path.normpath(file_path) == file_path:
+            path = Path(file_path)
+        else:
+            path = Path(file_path).resolve()
         
         if must_exist and not path.exists():
-            logger.warning(f"File does not exist: {path}")
+            logger.warning("File does not exist: %s", path)
             return None
             
         # Check if it's a valid path (not a directory when expecting file)
@@ -35,7 +67,7 @@ def validate_file_path(file_path: str, must_exist: bool = True) -> Optional[Path
         return path
         
     except (OSError, ValueError) as e:
-        logger.error(f"Invalid file path '{file_path}': {e}")
+        logger.error("Invalid file path '%s': %s", file_path, e)
         return None
 
 
@@ -50,6 +82,11 @@ def validate_json_data(data: str, expect_array: bool = False) -> Optional[Union[
     Returns:
         Parsed JSON data if valid, None otherwise
     """
+    # A document that doesn't open with '[' can't be an array, however long it is
+    if expect_array and not _ARRAY_START_RE.match(data):
+        logger.warning("Expected JSON array but got different type")
+        return None
+    
     try:
         parsed = json.loads(data)
         
@@ -60,7 +97,7 @@ def validate_json_data(data: str, expect_array: bool = False) -> Optional[Union[
         return parsed
         
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON data: {e}")
+        logger.error("Invalid JSON data: %s", e)
         return None
 
 
@@ -75,22 +112,27 @@ def validate_conversation_number(number: str, max_conversations: int) -> Optiona
     Returns:
         Validated conversation number (1-based) if valid, None otherwise
     """
-    try:
-        conv_num = int(number)
-        
-        if conv_num < 1:
-            logger.warning(f"Conversation number must be positive: {conv_num}")
-            return None
-            
-        if conv_num > max_conversations:
-            logger.warning(f"Conversation number {conv_num} exceeds maximum {max_conversations}")
-            return None
-            
-        return conv_num
-        
-    except ValueError:
-        logger.warning(f"Invalid conversation number: '{number}' is not a valid integer")
-        return None
+    conv_num, warning = _check_conversation_number(number, max_conversations)
+    if warning:
+        logger.warning(*warning)
+    return conv_num
+
+
+@lru_cache(maxsize=256)
+def _check_conversation_number(number: str, max_conversations: int) -> _Checked:
+    """Cached core of validate_conversation_number."""
+    conv_num = _parse_int(number)
+    if conv_num is None:
+        return None, ("Invalid conversation number: '%s' is not a valid integer", number)
+    
+    # One range check covers the common, valid case
+    if conv_num in range(1, max_conversations + 1):
+        return conv_num, None
+    
+    if conv_num < 1:
+        return None, ("Conversation number must be positive: %d", conv_num)
+    
+    return None, ("Conversation number %d exceeds maximum %d", conv_num, max_conversations)
 
 
 def validate_project_selection(choice: str, available_projects: list) -> Optional[Union[int, str]]:
@@ -111,27 +153,25 @@ def validate_project_selection(choice: str, available_projects: list) -> Optiona
         return None
     
     # Try to parse as project number
-    try:
-        project_num = int(choice)
-        
-        if project_num < 1:
-            logger.warning(f"Project number must be positive: {project_num}")
-            return None
-            
-        if project_num > len(available_projects):
-            logger.warning(f"Project number {project_num} exceeds available projects ({len(available_projects)})")
-            return None
-            
-        return project_num - 1  # Convert to 0-based index
-        
-    except ValueError:
+    project_num = _parse_int(choice)
+    if project_num is None:
         # Not a number, treat as file path
         validated_path = validate_file_path(choice, must_exist=False)
         if validated_path:
             return str(validated_path)
         else:
-            logger.warning(f"Invalid project selection: '{choice}'")
+            logger.warning("Invalid project selection: '%s'", choice)
             return None
+    
+    if project_num < 1:
+        logger.warning("Project number must be positive: %d", project_num)
+        return None
+        
+    if project_num > len(available_projects):
+        logger.warning("Project number %d exceeds available projects (%d)", project_num, len(available_projects))
+        return None
+        
+    return project_num - 1  # Convert to 0-based index
 
 
 def sanitize_search_term(term: str, max_length: int = 100) -> str:
@@ -149,11 +189,13 @@ def sanitize_search_term(term: str, max_length: int = 100) -> str:
         return ""
     
     # Remove control characters and limit length
-    sanitized = ''.join(char for char in term if ord(char) >= 32 or char in '\t\n')
-    sanitized = sanitized[:max_length]
+    if term.isascii():
+        sanitized = term.encode('ascii').translate(None, _CONTROL_BYTES)[:max_length].decode('ascii')
+    else:
+        sanitized = _CONTROL_RE.sub('', term)[:max_length]
     
     if len(sanitized) != len(term):
-        logger.debug(f"Search term sanitized from '{term}' to '{sanitized}'")
+        logger.debug("Search term sanitized from '%s' to '%s'", term, sanitized)
     
     return sanitized
 
@@ -168,13 +210,20 @@ def validate_export_format(format_str: str) -> Optional[str]:
     Returns:
         Validated format string if valid, None otherwise
     """
-    valid_formats = {"text", "markdown", "json"}
-    
-    if format_str.lower() not in valid_formats:
-        logger.warning(f"Invalid export format '{format_str}'. Valid formats: {valid_formats}")
-        return None
+    fmt, warning = _check_export_format(format_str)
+    if warning:
+        logger.warning(*warning)
+    return fmt
+
+
+@lru_cache(maxsize=256)
+def _check_export_format(format_str: str) -> _Checked:
+    """Cached core of validate_export_format."""
+    fmt = format_str.lower()
+    if fmt in _VALID_EXPORT_FORMATS:
+        return fmt, None
     
-    return format_str.lower()
+    return None, ("Invalid export format '%s'. Valid formats: %s", format_str, sorted(_VALID_EXPORT_FORMATS))
 
 
 def validate_count_parameter(count_str: str, min_count: int = 1, max_count: int = 1000) -> Optional[int]:
@@ -189,19 +238,28 @@ def validate_count_parameter(count_str: str, min_count: int = 1, max_count: int
     Returns:
         Validated count if valid, None otherwise
     """
-    try:
-        count = int(count_str)
-        
-        if count < min_count:
-            logger.warning(f"Count {count} is below minimum {min_count}")
-            return None
-            
-        if count > max_count:
-            logger.warning(f"Count {count} exceeds maximum {max_count}")
-            return None
-            
-        return count
+    count, warning = _check_count_parameter(count_str, min_count, max_count)
+    if warning:
+        logger.warning(*warning)
+    return count
+
+
+@lru_cache(maxsize=256)
+def _check_count_parameter(count_str: str, min_count: int, max_count: int) -> _Checked:
+    """Cached core of validate_count_parameter."""
+    count = _parse_int(count_str)
+    if count is None:
+        return None, ("Invalid count parameter: '%s' is not a valid integer", count_str)
+    
+    # One range check covers the common, valid case
+    if min_count == _DEFAULT_COUNT_RANGE.start and max_count == _DEFAULT_COUNT_RANGE[-1]:
+        valid = _DEFAULT_COUNT_RANGE
+    else:
+        valid = range(min_count, max_count + 1)
+    if count in valid:
+        return count, None
+    
+    if count < min_count:
+        return None, ("Count %d is below minimum %d", count, min_count)
         
-    except ValueError:
-        logger.warning(f"Invalid count parameter: '{count_str}' is not a valid integer")
-        return None
\ No newline at end of file
+    return None, ("Count %d exceeds maximum %d", count, max_count)
\ No newline at end of file
@@ -2,17 +2,23 @@
 """Simple, self-documenting conversation tree."""
 
 import json
+import sys
 import uuid
 
 from ccsm.core.logging_config import get_logger
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 logger = get_logger(__name__)
 
+# Every node in the tree is kept in memory and read on every redraw; slots
+# (Python 3.10+) drop the per-node __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TreeNode:
     """A node in the tree - either a folder or conversation."""
     id: str
@@ -46,6 +52,9 @@ class ConversationTree:
         self.root_nodes: Set[str] = set()      # Top-level node IDs
         self.metadata: Dict[str, dict] = {}    # Extra data for conversations
         self.custom_order: Dict[str, List[str]] = {}  # Custom ordering for each parent
+        self._folder_children: Dict[Optional[str], List[str]] = {}  # Folder IDs per parent, see first_folder_child
+        self._folders: Optional[List[TreeNode]] = None  # Every folder node, see folders
+        self._ensured_conversations: Optional[Tuple[list, int]] = None  # See _ensure_conversations_in_tree
         self._load()
     
     def _load(self) -> None:
@@ -127,6 +136,8 @@ class ConversationTree:
         folder_id = str(uuid.uuid4())
         folder = TreeNode(folder_id, name, is_folder=True, parent_id=parent_id)
         self.nodes[folder_id] = folder
+        self._folders = None
+        self._folder_children.clear()
         
         if parent_id:
             if parent_id in self.nodes:
@@ -143,6 +154,7 @@ class ConversationTree:
             
         node = TreeNode(conv_id, title, is_folder=False, parent_id=parent_id)
         self.nodes[conv_id] = node
+        self._folders = None
         
         if parent_id and parent_id in self.nodes:
             self.nodes[parent_id].children.add(conv_id)
@@ -153,27 +165,54 @@ class ConversationTree:
         """Move a node to a different parent."""
         if node_id not in self.nodes:
             raise ValueError(f"Node {node_id} not found")
-            
-        node = self.nodes[node_id]
-        old_parent_id = node.parent_id
-        
-        # Remove from old parent
-        if old_parent_id and old_parent_id in self.nodes:
-            self.nodes[old_parent_id].children.discard(node_id)
-        else:
-            self.root_nodes.discard(node_id)
+        self.move_nodes([(node_id, new_parent_id)])
+    
+    def move_nodes(self, moves: Iterable[Tuple[str, Optional[str]]],
+                   previous_parents: Optional[List[Tuple[str, Optional[str]]]] = None) -> int:
+        """Apply (node_id, new_parent_id) moves in order, returning how many were made.
+
+        Unknown node IDs are skipped. Bookkeeping shared by all the moves is
+        done once rather than per node. moves may be a generator; each pair
+        is read after the previous move has been applied. If previous_parents
+        is given, (node_id, old_parent_id) is appended to it for each move made.
+        """
+        nodes = self.nodes
+        root_nodes = self.root_nodes
+        self._folder_children.clear()
         
-        # Add to new parent
-        node.parent_id = new_parent_id
-        if new_parent_id and new_parent_id in self.nodes:
-            self.nodes[new_parent_id].children.add(node_id)
-        else:
-            self.root_nodes.add(node_id)
+        moved = 0
+        for node_id, new_parent_id in moves:
+            node = nodes.get(node_id)
+            if node is None:
+                logger.warning(f"Cannot move unknown node {node_id}")
+                continue
+            if previous_parents is not None:
+                previous_parents.append((node_id, node.parent_id))
+            
+            # Remove from old parent
+            old_parent = nodes.get(node.parent_id) if node.parent_id else None
+            if old_parent is not None:
+                old_parent.children.discard(node_id)
+            else:
+                root_nodes.discard(node_id)
+            
+            # Add to new parent
+            node.parent_id = new_parent_id
+            new_parent = nodes.get(new_parent_id) if new_parent_id else None
+            if new_parent is not None:
+                new_parent.children.add(node_id)
+            else:
+                root_nodes.add(node_id)
+            moved += 1
+        return moved
     
     def delete_node(self, node_id: str) -> None:
         """Delete a node and all its children."""
         if node_id not in self.nodes:
             return
+        self._folder_children.clear()
+        self._folders = None
+        self._ensured_conversations = None
             
         # Get all descendants
         to_delete = [node_id]
@@ -194,19 +233,64 @@ class ConversationTree:
                     self.root_nodes.discard(del_id)
                 del self.nodes[del_id]
     
+    def ancestors(self, node_id: str) -> Iterator[str]:
+        """Yield the IDs of a node's parent, grandparent and so on up to the root."""
+        seen = set()
+        node = self.nodes.get(node_id)
+        while node is not None and node.parent_id and node.parent_id not in seen:
+            seen.add(node.parent_id)
+            yield node.parent_id
+            node = self.nodes.get(node.parent_id)
+    
+    def folders(self) -> List[TreeNode]:
+        """All folder nodes, remembered until the next create or delete."""
+        if self._folders is None:
+            self._folders = [node for node in self.nodes.values() if node.is_folder]
+        return self._folders
+    
+    def first_folder_child(self, parent_id: Optional[str], exclude: Optional[Set[str]] = None) -> Optional[str]:
+        """First folder directly under parent_id (None for root) that isn't in exclude.
+
+        The folder IDs under each parent are remembered until the next
+        create, move or delete, so repeated lookups skip scanning every child.
+        """
+        folder_ids = self._folder_children.get(parent_id)
+        if folder_ids is None:
+            if parent_id:
+                parent = self.nodes.get(parent_id)
+                children = parent.children if parent else ()
+            else:
+                children = self.root_nodes
+            nodes = self.nodes
+            folder_ids = [child_id for child_id in children
+                          if child_id in nodes and nodes[child_id].is_folder]
+            self._folder_children[parent_id] = folder_ids
+        
+        for folder_id in folder_ids:
+            if not exclude or folder_id not in exclude:
+                return folder_id
+        return None
+    
     def get_tree_items(self, conversations: List[any], sort_by_date: bool = True, use_custom_order: bool = True) -> List[Tuple[TreeNode, Optional[any], int]]:
         conv_map = {c.id: c for c in conversations}
         self._ensure_conversations_in_tree(conversations)
         
-        items = []
-        self._build_tree_items(self.root_nodes, 0, None, conv_map, sort_by_date, use_custom_order, items)
-        return items
+        return self._build_tree_items(conv_map, sort_by_date, use_custom_order)
     
     def _ensure_conversations_in_tree(self, conversations: List[any]) -> None:
-        """Add conversations to tree if not already present."""
+        """Add conversations to tree if not already present.
+        
+        Skipped when given the same list, at the same length, as last time with
+        no node deleted since, as every conversation in it is still in the tree.
+        """
+        ensured = self._ensured_conversations
+        if ensured is not None and ensured[0] is conversations and ensured[1] == len(conversations):
+            return
+        nodes = self.nodes
         for conv in conversations:
-            if conv.id not in self.nodes:
+            if conv.id not in nodes:
                 self.add_conversation(conv.id, conv.title)
+        self._ensured_conversations = (conversations, len(conversations))
     
     def _get_sorted_children(self, node_ids: Set[str], parent_id: Optional[str], conv_map: dict, sort_by_date: bool, use_custom_order: bool) -> List[str]:
         """Get children sorted according to custom order or automatic sorting."""
@@ -221,39 +305,56 @@ class ConversationTree:
     def _apply_custom_order(self, valid_ids: List[str], custom_key: str) -> List[str]:
         """Apply custom ordering to node list."""
         custom_ordered = self.custom_order[custom_key]
-        ordered_ids = [id for id in custom_ordered if id in valid_ids]
+        # Membership is tested against sets so each list is scanned once
+        valid_set = set(valid_ids)
+        ordered_ids = [id for id in custom_ordered if id in valid_set]
         # Add any new items not in custom order
-        ordered_ids.extend(id for id in valid_ids if id not in custom_ordered)
+        custom_set = set(custom_ordered)
+        ordered_ids.extend(id for id in valid_ids if id not in custom_set)
         return ordered_ids
     
     def _apply_automatic_sort(self, valid_ids: List[str], conv_map: dict, sort_by_date: bool) -> List[str]:
         """Apply automatic sorting (folders first, then conversations)."""
-        folder_ids = [id for id in valid_ids if self.nodes[id].is_folder]
-        conv_ids = [id for id in valid_ids if not self.nodes[id].is_folder and id in conv_map]
-        
-        folder_ids.sort(key=lambda id: self.nodes[id].name.lower())
+        # Pair each ID with its sort key in one pass, then sort on the keys alone
+        nodes = self.nodes
+        folders = []
+        convs = []
+        for id in valid_ids:
+            node = nodes[id]
+            if node.is_folder:
+                folders.append((node.name.lower(), id))
+            else:
+                conv = conv_map.get(id)
+                if conv is not None:
+                    convs.append(((conv.create_time or 0) if sort_by_date else node.name.lower(), id))
         
-        if sort_by_date:
-            conv_ids.sort(key=lambda id: conv_map.get(id).create_time or 0, reverse=True)
-        else:
-            conv_ids.sort(key=lambda id: self.nodes[id].name.lower())
-            
-        return folder_ids + conv_ids
+        folders.sort(key=itemgetter(0))
+        convs.sort(key=itemgetter(0), reverse=sort_by_date)
+        return [id for _, id in folders] + [id for _, id in convs]
     
-    def _build_tree_items(self, node_ids: Set[str], depth: int, parent_id: Optional[str], conv_map: dict, sort_by_date: bool, use_custom_order: bool, items: List) -> None:
-        """Recursively build tree items for display."""
-        sorted_ids = self._get_sorted_children(node_ids, parent_id, conv_map, sort_by_date, use_custom_order)
+    def _build_tree_items(self, conv_map: dict, sort_by_date: bool, use_custom_order: bool) -> List[Tuple[TreeNode, Optional[any], int]]:
+        """Flatten the expanded part of the tree into display order, depth first."""
+        nodes = self.nodes
+        items = []
+        roots = self._get_sorted_children(self.root_nodes, None, conv_map, sort_by_date, use_custom_order)
+        # Pending (node_id, depth) pairs, pushed in reverse so they pop in order
+        stack = [(node_id, 0) for node_id in reversed(roots)]
+        opened = set()  # Folders already listed, so a parent cycle can't loop forever
         
-        for node_id in sorted_ids:
-            node = self.nodes[node_id]
+        while stack:
+            node_id, depth = stack.pop()
+            node = nodes[node_id]
             if node.is_folder:
                 items.append((node, None, depth))
-                if node.expanded:
-                    self._build_tree_items(node.children, depth + 1, node_id, conv_map, sort_by_date, use_custom_order, items)
+                if node.expanded and node_id not in opened:
+                    opened.add(node_id)
+                    children = self._get_sorted_children(node.children, node_id, conv_map, sort_by_date, use_custom_order)
+                    stack.extend((child_id, depth + 1) for child_id in reversed(children))
             else:
                 conv = conv_map.get(node_id)
                 if conv is not None:
                     items.append((node, conv, depth))
+        return items
     
     def rename_node(self, node_id: str, new_name: str) -> None:
         """Rename a node."""
@@ -1,34 +1,46 @@
 #!/usr/bin/env python3
 """Base classes for action handling in the TUI."""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, Any, Tuple
 
+# A context and a result are built for every key press; slots (Python 3.10+) skip their __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+_NOT_LOOKED_UP = object()
+
+
+@dataclass(**_SLOTS)
 class ActionContext:
     """Context information passed to action handlers."""
     tui: Any
     key: int
     result: str
     tree_view: Any = field(init=False)
-    selected_item: Any = field(init=False)
     selected_items: set = field(init=False)
     tree_items: list = field(init=False)
     tree: Any = field(init=False)
     stdscr: Any = field(init=False)
+    _selected_item: Any = field(init=False, default=_NOT_LOOKED_UP, repr=False)
     
     def __post_init__(self):
         self.tree_view = self.tui.tree_view
-        self.selected_item = self.tui.tree_view.get_selected()
         self.selected_items = self.tui.selection_manager.selected_items
         self.tree_items = self.tui.tree_items
         self.tree = self.tui.tree
         self.stdscr = getattr(self.tui, 'stdscr', None)
+    
+    @property
+    def selected_item(self) -> Any:
+        """The item under the cursor, looked up the first time a handler asks for it."""
+        if self._selected_item is _NOT_LOOKED_UP:
+            self._selected_item = self.tree_view.get_selected()
+        return self._selected_item
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActionResult:
     """Result returned by action handlers."""
     success: bool
@@ -54,7 +54,7 @@ class FZFSearch:
                 update_ts = conv.update_time.timestamp() if hasattr(conv.update_time, 'timestamp') else conv.update_time
                 created = format_relative_time(create_ts)
                 modified = format_relative_time(update_ts)
-                msg_count = len(conv.messages) if conv.messages else 0
+                msg_count = conv.get_message_count()
                 
                 # Create searchable line with metadata
                 search_line = f"{conv.title} | {created} | {modified} | {msg_count} msgs"
@@ -147,7 +147,7 @@ class FZFSearch:
                     # Convert datetime to timestamp if needed
                     update_ts = conv.update_time.timestamp() if hasattr(conv.update_time, 'timestamp') else conv.update_time
                     modified = format_relative_time(update_ts)
-                    msg_count = len(conv.messages) if conv.messages else 0
+                    msg_count = conv.get_message_count()
                     search_line = f"{indent}{icon} {conv.title} | {modified} | {msg_count} msgs"
                 else:
                     search_line = f"{indent}{icon} {node.name}"
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Operations management for folder and item operations."""
 
+import curses
+import os
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Set, List, Tuple, Any, Optional
 
 from ccsm.core.logging_config import get_logger
@@ -10,22 +14,44 @@ from ccsm.tui.action_handler import ActionHandler, ActionContext, ActionResult
 logger = get_logger(__name__)
 
 
+@dataclass
+class OpResult:
+    """Outcome of a folder or item operation."""
+    success: bool
+    message: str
+    payload: Any = None  # e.g. the new folder ID, or original positions for undo
+
+
 class OperationsManager(ActionHandler):
     """Manages folder and item operations like create, move, delete, rename."""
     
     def __init__(self, tree, stdscr):
         self.tree = tree
         self.stdscr = stdscr
+        # Action name -> handler, looked up once per key press by handle()
+        self._handlers = {
+            "new_folder": self._handle_new_folder,
+            "rename": self._handle_rename,
+            "delete": self._handle_delete,
+            "move": self._handle_move,
+            "bulk_move": self._handle_bulk_move,
+            "move_up": self._handle_move_up,
+            "move_down": self._handle_move_down,
+            "indent": self._handle_indent,
+            "outdent": self._handle_outdent,
+            "resume": self._handle_resume,
+            "new_claude_code": self._handle_new_claude_code,
+        }
         
-    def create_folder(self, selected_items: Set[str], current_item: Optional[Tuple[Any, Any, int]] = None) -> Tuple[str, bool, Optional[str]]:
+    def create_folder(self, selected_items: Set[str], current_item: Optional[Tuple[Any, Any, int]] = None) -> OpResult:
         """Create new folder and optionally move selected items into it.
         
         Returns:
-            Tuple of (status_message, should_clear_selection, folder_id)
+            OpResult whose payload is the new folder's ID
         """
         name = get_input(self.stdscr, "Folder name:")
         if not name:
-            return "Folder creation cancelled", False, None
+            return OpResult(False, "Folder creation cancelled")
             
         try:
             parent_id = None
@@ -38,364 +64,302 @@ class OperationsManager(ActionHandler):
             
             # If we have selected items, move them into the new folder
             if selected_items:
-                moved_items = []
-                for item_id in selected_items.copy():  # Copy to avoid modification during iteration
-                    try:
-                        self.tree.move_node(item_id, folder_id)
-                        moved_items.append(self.tree.nodes[item_id].name)
-                    except Exception as e:
-                        logger.warning(f"Failed to move item {item_id}: {e}")
+                # Moving nodes never touches the selection set, so it can be iterated directly
+                moved = self.tree.move_nodes((item_id, folder_id) for item_id in selected_items)
 
-                if moved_items:
-                    status = f"Created '{name}' and moved {len(moved_items)} items into it"
+                if moved:
+                    status = f"Created '{name}' and moved {moved} items into it"
                 else:
                     status = f"Created '{name}' (no items could be moved)"
                     
-                # Clear selection after moving
-                return status, True, folder_id
+                return OpResult(True, status, folder_id)
             else:
-                return f"Created '{name}'", False, folder_id
+                return OpResult(True, f"Created '{name}'", folder_id)
                 
         except Exception as e:
-            return f"Error: {e}", False, None
+            return OpResult(False, f"Error: {e}")
             
-    def rename_item(self, current_item: Optional[Tuple[Any, Any, int]]) -> str:
-        """Rename the selected item.
-        
-        Returns:
-            Status message
-        """
+    def rename_item(self, current_item: Optional[Tuple[Any, Any, int]]) -> OpResult:
+        """Rename the selected item."""
         if not current_item:
-            return "No item selected to rename"
+            return OpResult(False, "No item selected to rename")
             
         node, _, _ = current_item
         current_name = node.name
         new_name = get_input(self.stdscr, f"Rename '{current_name}' to:", current_name)
         
         if not new_name or new_name == current_name:
-            return "Rename cancelled"
+            return OpResult(False, "Rename cancelled")
             
         try:
             self.tree.rename_node(node.id, new_name)
-            return f"Renamed '{current_name}' to '{new_name}'"
+            return OpResult(True, f"Renamed '{current_name}' to '{new_name}'")
         except Exception as e:
-            return f"Error: {e}"
+            return OpResult(False, f"Error: {e}")
             
-    def delete_item(self, current_item: Optional[Tuple[Any, Any, int]]) -> str:
-        """Delete the selected item.
-        
-        Returns:
-            Status message
-        """
+    def delete_item(self, current_item: Optional[Tuple[Any, Any, int]]) -> OpResult:
+        """Delete the selected item."""
         if not current_item:
-            return "No item selected to delete"
+            return OpResult(False, "No item selected to delete")
             
         node, _, _ = current_item
         try:
             self.tree.delete_node(node.id)
-            return f"Deleted '{node.name}'"
+            return OpResult(True, f"Deleted '{node.name}'")
         except Exception as e:
-            return f"Error: {e}"
+            return OpResult(False, f"Error: {e}")
             
-    def move_item(self, current_item: Optional[Tuple[Any, Any, int]]) -> str:
-        """Move the selected item to a different folder.
-        
-        Returns:
-            Status message
-        """
+    def move_item(self, current_item: Optional[Tuple[Any, Any, int]]) -> OpResult:
+        """Move the selected item to a different folder."""
         if not current_item:
-            return "No item selected to move"
+            return OpResult(False, "No item selected to move")
             
-        from ccsm.tui.input import select_folder
-        
         node, _, _ = current_item
         target_folder = select_folder(self.stdscr, self.tree, f"Move '{node.name}' to:")
         
         if target_folder is None:
-            return "Move cancelled"
+            return OpResult(False, "Move cancelled")
             
         try:
             self.tree.move_node(node.id, target_folder)
             target_name = self.tree.nodes[target_folder].name if target_folder else "Root"
-            return f"Moved '{node.name}' to '{target_name}'"
+            return OpResult(True, f"Moved '{node.name}' to '{target_name}'")
         except Exception as e:
-            return f"Error: {e}"
+            return OpResult(False, f"Error: {e}")
             
-    def indent_items(self, selected_items: Set[str], current_item: Optional[Tuple[Any, Any, int]]) -> Tuple[str, List[Tuple[str, str]]]:
+    def indent_items(self, selected_items: Set[str], current_item: Optional[Tuple[Any, Any, int]]) -> OpResult:
         """Indent selected items (move them into a sibling folder).
         
         Returns:
-            Tuple of (status_message, original_positions_for_undo)
+            OpResult whose payload is the original positions, for undo
         """
         # If no items selected, use current item
         if not selected_items and current_item:
             current_node, _, _ = current_item
             selected_items = {current_node.id}
         elif not selected_items:
-            return "No items selected to indent", []
+            return OpResult(False, "No items selected to indent", [])
             
         # Find a suitable folder to move items into
         if not current_item:
-            return "Cannot determine target for indentation", []
+            return OpResult(False, "Cannot determine target for indentation", [])
             
         current_node, _, _ = current_item
         
         # Look for a folder at the same level to move items into
-        parent_id = current_node.parent_id
-        siblings = self.tree.nodes[parent_id].children if parent_id else self.tree.root_nodes
-        
-        # Find first folder sibling
-        target_folder = None
-        for sibling_id in siblings:
-            sibling = self.tree.nodes.get(sibling_id)
-            if sibling and sibling.is_folder and sibling_id not in selected_items:
-                target_folder = sibling_id
-                break
+        target_folder = self.tree.first_folder_child(current_node.parent_id, exclude=selected_items)
                 
         if not target_folder:
-            return "No folder available for indentation", []
+            return OpResult(False, "No folder available for indentation", [])
             
-        # Save original positions for undo
+        # Original parent of each item actually moved, for undo
         original_positions = []
-        for item_id in selected_items:
-            if item_id in self.tree.nodes:
-                node = self.tree.nodes[item_id]
-                original_positions.append((item_id, node.parent_id))
         
-        moved = 0
-        for item_id in selected_items:
-            try:
-                self.tree.move_node(item_id, target_folder)
-                moved += 1
-            except Exception as e:
-                logger.warning(f"Failed to indent item {item_id}: {e}")
+        moved = self.tree.move_nodes(((item_id, target_folder) for item_id in selected_items),
+                                     original_positions)
 
         if moved > 0:
             if moved == 1:
-                return f"Indented item into folder", original_positions
+                return OpResult(True, f"Indented item into folder", original_positions)
             else:
-                return f"Indented {moved} items into folder", original_positions
+                return OpResult(True, f"Indented {moved} items into folder", original_positions)
         else:
-            return "Could not indent items", []
+            return OpResult(False, "Could not indent items", [])
             
-    def outdent_items(self, selected_items: Set[str], current_item: Optional[Tuple[Any, Any, int]] = None) -> Tuple[str, List[Tuple[str, str]]]:
+    def outdent_items(self, selected_items: Set[str], current_item: Optional[Tuple[Any, Any, int]] = None) -> OpResult:
         """Outdent selected items (move them to parent level).
         
         Returns:
-            Tuple of (status_message, original_positions_for_undo)
+            OpResult whose payload is the original positions, for undo
         """
         # If no items selected, use current item
         if not selected_items and current_item:
             current_node, _, _ = current_item
             selected_items = {current_node.id}
         elif not selected_items:
-            return "No items selected to outdent", []
+            return OpResult(False, "No items selected to outdent", [])
             
-        # Save original positions for undo
+        # Original parent of each item actually moved, for undo
         original_positions = []
-        for item_id in selected_items:
-            if item_id in self.tree.nodes:
-                node = self.tree.nodes[item_id]
-                original_positions.append((item_id, node.parent_id))
             
-        moved = 0
-        for item_id in selected_items:
-            node = self.tree.nodes.get(item_id)
-            if node and node.parent_id:
-                # Move to the parent's parent
-                grandparent_id = self.tree.nodes[node.parent_id].parent_id if node.parent_id in self.tree.nodes else None
-                try:
-                    self.tree.move_node(item_id, grandparent_id)
-                    moved += 1
-                except Exception as e:
-                    logger.warning(f"Failed to outdent item {item_id}: {e}")
+        moved = self.tree.move_nodes(self._outdent_moves(selected_items), original_positions)
 
         if moved > 0:
             if moved == 1:
-                return f"Outdented item", original_positions
+                return OpResult(True, f"Outdented item", original_positions)
             else:
-                return f"Outdented {moved} items", original_positions
+                return OpResult(True, f"Outdented {moved} items", original_positions)
         else:
-            return "Could not outdent items (already at top level?)", []
+            return OpResult(False, "Could not outdent items (already at top level?)", [])
             
-    def bulk_move_up(self, selected_items: Set[str], tree_items: List[Tuple[Any, Any, int]]) -> str:
-        """Move all selected items up.
-        
-        Returns:
-            Status message
+    def _outdent_moves(self, selected_items: Set[str]):
+        """Yield (item_id, grandparent_id) for each selected item that has a parent.
+
+        Read lazily by move_nodes, so each grandparent reflects earlier moves.
         """
+        nodes = self.tree.nodes
+        for item_id in selected_items:
+            node = nodes.get(item_id)
+            if node and node.parent_id:
+                # Move to the parent's parent
+                parent = nodes.get(node.parent_id)
+                yield item_id, parent.parent_id if parent else None
+                
+    def bulk_move_up(self, selected_items: Set[str], tree_items: List[Tuple[Any, Any, int]]) -> OpResult:
+        """Move all selected items up."""
         if not selected_items:
-            return "No items selected to move"
+            return OpResult(False, "No items selected to move")
             
+        # Snapshot the selection so moves can't change what the scan below sees
+        selected = frozenset(selected_items)
+        
         # Get items in tree order
-        selected_in_order = []
-        for node, _, _ in tree_items:
-            if node.id in selected_items:
-                selected_in_order.append(node.id)
+        selected_in_order = [node.id for node, _, _ in tree_items if node.id in selected]
                 
         # Move from top to bottom to maintain relative order
-        moved = 0
-        for item_id in selected_in_order:
-            if self.tree.move_item_up(item_id):
-                moved += 1
+        move_up = self.tree.move_item_up
+        moved = sum(1 for item_id in selected_in_order if move_up(item_id))
                 
-        return f"Moved {moved} items up" if moved > 0 else "Could not move items up"
-        
-    def bulk_move_down(self, selected_items: Set[str], tree_items: List[Tuple[Any, Any, int]]) -> str:
-        """Move all selected items down.
+        if moved > 0:
+            return OpResult(True, f"Moved {moved} items up")
+        return OpResult(False, "Could not move items up")
         
-        Returns:
-            Status message
-        """
+    def bulk_move_down(self, selected_items: Set[str], tree_items: List[Tuple[Any, Any, int]]) -> OpResult:
+        """Move all selected items down."""
         if not selected_items:
-            return "No items selected to move"
+            return OpResult(False, "No items selected to move")
             
+        # Snapshot the selection so moves can't change what the scan below sees
+        selected = frozenset(selected_items)
+        
         # Get items in tree order
-        selected_in_order = []
-        for node, _, _ in tree_items:
-            if node.id in selected_items:
-                selected_in_order.append(node.id)
+        selected_in_order = [node.id for node, _, _ in tree_items if node.id in selected]
                 
         # Move from bottom to top to maintain relative order
-        moved = 0
-        for item_id in reversed(selected_in_order):
-            if self.tree.move_item_down(item_id):
-                moved += 1
+        move_down = self.tree.move_item_down
+        moved = sum(1 for item_id in reversed(selected_in_order) if move_down(item_id))
                 
-        return f"Moved {moved} items down" if moved > 0 else "Could not move items down"
+        if moved > 0:
+            return OpResult(True, f"Moved {moved} items down")
+        return OpResult(False, "Could not move items down")
         
     # ActionHandler implementation
     def can_handle(self, action: str) -> bool:
         """Check if this handler can process the action."""
-        actions = {"new_folder", "rename", "delete", "move_up", "move_down", 
-                   "indent", "outdent", "move", "bulk_move", "resume", "new_claude_code"}
-        return action in actions
+        return action in self._handlers
         
     def handle(self, action: str, context: ActionContext) -> Optional[ActionResult]:
         """Handle folder and item operations."""
-        if action == "new_folder":
-            message, should_clear_selection, folder_id = self.create_folder(
-                context.selected_items.copy(), 
-                context.selected_item
-            )
-            if "Created" in message and folder_id:
-                # Save action for undo
-                if hasattr(context.tui, 'action_manager'):
-                    context.tui.action_manager.save_undo_state("create", folder_id)
-                return ActionResult(True, message=message, save_tree=True, 
-                                  refresh_tree=True, clear_selection=should_clear_selection)
-            return ActionResult(False, message=message)
-            
-        elif action == "rename":
-            message = self.rename_item(context.selected_item)
-            if "Renamed" in message:
-                return ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-            return ActionResult(False, message=message)
-            
-        elif action == "delete":
-            if not context.selected_item:
-                return ActionResult(False, message="No item selected to delete")
-            node, _, _ = context.selected_item
-            item_type = "folder" if node.is_folder else "conversation"
-            
-            if not confirm(context.stdscr, f"Delete {item_type} '{node.name}'?"):
-                return ActionResult(False, message="Delete cancelled")
-                
-            message = self.delete_item(context.selected_item)
-            if "Deleted" in message:
-                return ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-            return ActionResult(False, message=message)
-            
-        elif action == "move":
-            if context.selected_items:
-                # Bulk move
-                return self._handle_bulk_move(context)
-            else:
-                # Single item move
-                message = self.move_item(context.selected_item)
-                if "Moved" in message:
-                    return ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-                return ActionResult(False, message=message)
-                
-        elif action == "move_up":
-            if context.selected_items:
-                message = self.bulk_move_up(context.selected_items, context.tree_items)
-            else:
-                if not context.selected_item:
-                    return ActionResult(False, message="No item to move")
-                node, _, _ = context.selected_item
-                item_id = node.id
-                if self.tree.move_item_up(item_id):
-                    context.tui.action_manager.save_last_action("move_up")
-                    message = f"Moved '{node.name}' up"
-                else:
-                    return ActionResult(False, message="Cannot move up")
-                    
-            if "Moved" in message:
-                # Track the item ID to restore selection after refresh
-                if not context.selected_items:
-                    result = ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-                    result.select_item_id = item_id
-                    return result
-                else:
-                    return ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-            return ActionResult(False, message=message)
-            
-        elif action == "move_down":
-            if context.selected_items:
-                message = self.bulk_move_down(context.selected_items, context.tree_items)
-            else:
-                if not context.selected_item:
-                    return ActionResult(False, message="No item to move")
-                node, _, _ = context.selected_item
-                item_id = node.id
-                if self.tree.move_item_down(item_id):
-                    context.tui.action_manager.save_last_action("move_down")
-                    message = f"Moved '{node.name}' down"
-                else:
-                    return ActionResult(False, message="Cannot move down")
-                    
-            if "Moved" in message:
-                # Track the item ID to restore selection after refresh
-                if not context.selected_items:
-                    result = ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-                    result.select_item_id = item_id
-                    return result
-                else:
-                    return ActionResult(True, message=message, save_tree=True, refresh_tree=True)
-            return ActionResult(False, message=message)
-            
-        elif action == "indent":
-            message, original_positions = self.indent_items(
-                context.selected_items, 
-                context.selected_item
-            )
-            if original_positions and hasattr(context.tui, 'action_manager'):
-                context.tui.action_manager.save_undo_state("indent", original_positions)
-            if "Indented" in message:
-                return ActionResult(True, message=message, save_tree=True, 
-                                  refresh_tree=True, clear_selection=True)
-            return ActionResult(False, message=message)
-            
-        elif action == "outdent":
-            message, original_positions = self.outdent_items(
-                context.selected_items,
-                context.selected_item
-            )
-            if original_positions and hasattr(context.tui, 'action_manager'):
-                context.tui.action_manager.save_undo_state("outdent", original_positions)
-            if "Outdented" in message:
-                return ActionResult(True, message=message, save_tree=True, 
-                                  refresh_tree=True, clear_selection=True)
-            return ActionResult(False, message=message)
-            
-        elif action == "resume":
-            return self._handle_resume(context)
-            
-        elif action == "new_claude_code":
-            return self._handle_new_claude_code(context)
+        handler = self._handlers.get(action)
+        return handler(context) if handler else None
+        
+    def _handle_new_folder(self, context: ActionContext) -> ActionResult:
+        """Handle creating a folder, moving any selected items into it."""
+        result = self.create_folder(
+            context.selected_items, 
+            context.selected_item
+        )
+        if result.success:
+            # Save action for undo
+            if hasattr(context.tui, 'action_manager'):
+                context.tui.action_manager.save_undo_state("create", result.payload)
+            # Selected items were moved into the new folder, so clear the selection
+            return ActionResult(True, message=result.message, save_tree=True, 
+                              refresh_tree=True, clear_selection=bool(context.selected_items))
+        return ActionResult(False, message=result.message)
+        
+    def _handle_rename(self, context: ActionContext) -> ActionResult:
+        """Handle renaming the current item."""
+        result = self.rename_item(context.selected_item)
+        return ActionResult(result.success, message=result.message,
+                            save_tree=result.success, refresh_tree=result.success)
+        
+    def _handle_delete(self, context: ActionContext) -> ActionResult:
+        """Handle deleting the current item after confirmation."""
+        if not context.selected_item:
+            return ActionResult(False, message="No item selected to delete")
+        node, _, _ = context.selected_item
+        item_type = "folder" if node.is_folder else "conversation"
+        
+        if not confirm(context.stdscr, f"Delete {item_type} '{node.name}'?"):
+            return ActionResult(False, message="Delete cancelled")
             
-        return None
+        result = self.delete_item(context.selected_item)
+        return ActionResult(result.success, message=result.message,
+                            save_tree=result.success, refresh_tree=result.success)
+        
+    def _handle_move(self, context: ActionContext) -> ActionResult:
+        """Handle moving the selection, or the current item, to another folder."""
+        if context.selected_items:
+            # Bulk move
+            return self._handle_bulk_move(context)
+        
+        # Single item move
+        result = self.move_item(context.selected_item)
+        return ActionResult(result.success, message=result.message,
+                            save_tree=result.success, refresh_tree=result.success)
+        
+    def _handle_move_up(self, context: ActionContext) -> ActionResult:
+        """Handle moving the selection, or the current item, up."""
+        if context.selected_items:
+            result = self.bulk_move_up(context.selected_items, context.tree_items)
+            return ActionResult(result.success, message=result.message,
+                                save_tree=result.success, refresh_tree=result.success)
+        
+        if not context.selected_item:
+            return ActionResult(False, message="No item to move")
+        node, _, _ = context.selected_item
+        if not self.tree.move_item_up(node.id):
+            return ActionResult(False, message="Cannot move up")
+        context.tui.action_manager.save_last_action("move_up")
+        
+        # Track the item ID to restore selection after refresh
+        return ActionResult(True, message=f"Moved '{node.name}' up", save_tree=True,
+                            refresh_tree=True, select_item_id=node.id)
+        
+    def _handle_move_down(self, context: ActionContext) -> ActionResult:
+        """Handle moving the selection, or the current item, down."""
+        if context.selected_items:
+            result = self.bulk_move_down(context.selected_items, context.tree_items)
+            return ActionResult(result.success, message=result.message,
+                                save_tree=result.success, refresh_tree=result.success)
+        
+        if not context.selected_item:
+            return ActionResult(False, message="No item to move")
+        node, _, _ = context.selected_item
+        if not self.tree.move_item_down(node.id):
+            return ActionResult(False, message="Cannot move down")
+        context.tui.action_manager.save_last_action("move_down")
+        
+        # Track the item ID to restore selection after refresh
+        return ActionResult(True, message=f"Moved '{node.name}' down", save_tree=True,
+                            refresh_tree=True, select_item_id=node.id)
+        
+    def _handle_indent(self, context: ActionContext) -> ActionResult:
+        """Handle indenting the selection into a sibling folder."""
+        result = self.indent_items(
+            context.selected_items, 
+            context.selected_item
+        )
+        if result.payload and hasattr(context.tui, 'action_manager'):
+            context.tui.action_manager.save_undo_state("indent", result.payload)
+        if result.success:
+            return ActionResult(True, message=result.message, save_tree=True, 
+                              refresh_tree=True, clear_selection=True)
+        return ActionResult(False, message=result.message)
+        
+    def _handle_outdent(self, context: ActionContext) -> ActionResult:
+        """Handle outdenting the selection to its parent's level."""
+        result = self.outdent_items(
+            context.selected_items,
+            context.selected_item
+        )
+        if result.payload and hasattr(context.tui, 'action_manager'):
+            context.tui.action_manager.save_undo_state("outdent", result.payload)
+        if result.success:
+            return ActionResult(True, message=result.message, save_tree=True, 
+                              refresh_tree=True, clear_selection=True)
+        return ActionResult(False, message=result.message)
         
     def _handle_bulk_move(self, context: ActionContext) -> ActionResult:
         """Handle bulk move operation."""
@@ -404,14 +368,20 @@ class OperationsManager(ActionHandler):
         if dest_id is None:
             return ActionResult(False, message="Move cancelled")
             
-        moved = 0
-        for item_id in context.selected_items:
-            if item_id != dest_id:  # Can't move to itself
-                try:
-                    self.tree.move_node(item_id, dest_id)
-                    moved += 1
-                except Exception as e:
-                    logger.warning(f"Failed to move item {item_id}: {e}")
+        # Items inside a selected folder travel with it, so only move the
+        # outermost selected items, shallowest first. The destination stays
+        # put even when selected, so items below it still move into it.
+        selected = context.selected_items
+        roots = []
+        for item_id in selected:
+            if item_id == dest_id:  # Can't move to itself
+                continue
+            ancestors = list(self.tree.ancestors(item_id))
+            if not any(ancestor_id in selected and ancestor_id != dest_id for ancestor_id in ancestors):
+                roots.append((len(ancestors), item_id))
+        roots.sort()
+        
+        moved = self.tree.move_nodes((item_id, dest_id) for _, item_id in roots)
                     
         if moved > 0:
             dest_name = self.tree.nodes[dest_id].name if dest_id else "root"
@@ -442,10 +412,6 @@ class OperationsManager(ActionHandler):
             
             
         # Execute claude --resume command properly with ncurses
-        import subprocess
-        import curses
-        import os
-        from pathlib import Path
         # Properly end ncurses mode
         
         # Get the project directory from the conversation file path and run claude from there
@@ -472,10 +438,6 @@ class OperationsManager(ActionHandler):
             
     def _handle_new_claude_code(self, context: ActionContext) -> ActionResult:
         """Handle starting a new Claude Code session."""
-        import subprocess
-        import curses
-        import os
-        
         # Properly end ncurses mode
         curses.endwin()
         
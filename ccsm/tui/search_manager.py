@@ -41,7 +41,7 @@ class SearchManager(ActionHandler):
                 
             # Search in conversation title and content
             if conv:
-                if term_lower in conv.title.lower():
+                if term_lower in conv.title_lower:
                     matches.append(i)
                     continue
                     
@@ -16,15 +16,31 @@ class SelectionManager(ActionHandler):
         self.visual_mode: bool = False  # Visual mode for range selection
         self.visual_start: Optional[int] = None  # Starting position for visual mode
         
+        # Range last selected by update_visual_selection, and the items it indexes
+        self._visual_range: Optional[Tuple[int, int]] = None
+        self._visual_items: Optional[List[Tuple[Any, Any, int]]] = None
+        
+        # Node IDs of the last tree items seen, in order, so ranges are plain slices
+        self._ids: List[str] = []
+        self._ids_source: Optional[List[Tuple[Any, Any, int]]] = None
+        
+    def _item_ids(self, tree_items: List[Tuple[Any, Any, int]]) -> List[str]:
+        """Node IDs of tree_items in order, rebuilt only when the item list changes."""
+        if tree_items is not self._ids_source:
+            self._ids = [node.id for node, _, _ in tree_items]
+            self._ids_source = tree_items
+        return self._ids
+        
     def clear_selection(self) -> None:
         """Clear all selected items."""
         self.selected_items.clear()
+        self._visual_items = None
         
     def select_all(self, tree_items: List[Tuple[Any, Any, int]]) -> int:
         """Select all items in the tree."""
         self.selected_items.clear()
-        for node, _, _ in tree_items:
-            self.selected_items.add(node.id)
+        self._visual_items = None
+        self.selected_items.update(self._item_ids(tree_items))
         return len(self.selected_items)
         
     def toggle_item_selection(self, node_id: str, node_name: str) -> Tuple[bool, str]:
@@ -33,6 +49,7 @@ class SelectionManager(ActionHandler):
         Returns:
             Tuple of (is_now_selected, status_message)
         """
+        self._visual_items = None
         if node_id in self.selected_items:
             self.selected_items.remove(node_id)
             return False, f"Deselected '{node_name}'"
@@ -50,6 +67,7 @@ class SelectionManager(ActionHandler):
             # Enter visual mode
             self.visual_mode = True
             self.visual_start = current_position
+            self._visual_items = None
             # Start with current item selected
             if current_position < len(tree_items):
                 node, _, _ = tree_items[current_position]
@@ -70,36 +88,37 @@ class SelectionManager(ActionHandler):
         if not self.visual_mode or self.visual_start is None:
             return ""
             
-        # Clear previous selection and rebuild based on range
-        self.selected_items.clear()
-        
-        start_pos = self.visual_start
+        # Determine the range (inclusive), ignoring positions past the end
+        min_pos = min(self.visual_start, current_position)
+        max_pos = min(max(self.visual_start, current_position), len(tree_items) - 1)
         
-        # Determine the range (inclusive)
-        min_pos = min(start_pos, current_position)
-        max_pos = max(start_pos, current_position)
-        
-        # Select all items in the range
-        for i in range(min_pos, max_pos + 1):
-            if i < len(tree_items):
-                node, _, _ = tree_items[i]
-                self.selected_items.add(node.id)
+        selected = self.selected_items
+        ids = self._item_ids(tree_items)
+        if tree_items is self._visual_items:
+            # Same items as last time: only rows entering or leaving the range change
+            old_min, old_max = self._visual_range
+            selected.difference_update(ids[old_min:min(min_pos, old_max + 1)])
+            selected.difference_update(ids[max(max_pos + 1, old_min):old_max + 1])
+            selected.update(ids[min_pos:min(old_min, max_pos + 1)])
+            selected.update(ids[max(old_max + 1, min_pos):max_pos + 1])
+        else:
+            # Clear previous selection and rebuild based on range
+            selected.clear()
+            selected.update(ids[min_pos:max_pos + 1])
+        self._visual_range = (min_pos, max_pos)
+        self._visual_items = tree_items
                 
         # Update status to show selection size
         return f"Visual: {len(self.selected_items)} items selected"
         
     def has_selection(self) -> bool:
         """Check if any items are selected."""
-        return len(self.selected_items) > 0
+        return bool(self.selected_items)
         
     def get_selection_count(self) -> int:
         """Get the number of selected items."""
         return len(self.selected_items)
         
-    def get_selected_items(self) -> Set[str]:
-        """Get the set of selected item IDs."""
-        return self.selected_items.copy()
-        
     # ActionHandler implementation
     def can_handle(self, action: str) -> bool:
         """Check if this handler can process the action."""
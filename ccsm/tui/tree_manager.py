@@ -1,227 +1,249 @@
 #!/usr/bin/env python3
 """Tree management operations for the TUI interface."""
 
+import curses
 import os
+import shutil
 import tempfile
 import subprocess
+from collections import deque
+from pathlib import Path
 from typing import Optional, Any
 from ccsm.tui.action_handler import ActionHandler, ActionContext, ActionResult
-from ccsm.core.exporter import export_conversation, export_aligned
+from ccsm.core.exporter import export_conversation_iter, export_aligned
 from ccsm.core.claude_loader import load_raw_entries
 
 
 class TreeManager(ActionHandler):
     """Manages tree-specific operations like expand/collapse and filtering."""
     
+    # Shown by the help action, with the dialog sized to the widest line
+    _HELP_TEXT = (
+        "Enhanced Keybindings:",
+        "",
+        "Vim Navigation:",
+        "  ↑/k, ↓/j   - Move up/down",
+        "  gg, G      - Go to top/bottom",  
+        "  Ctrl+D/U   - Half page down/up",
+        "  Ctrl+F/B   - Full page down/up",
+        "  H/M/L      - Jump High/Middle/Low on screen",
+        "  h/l        - Jump to parent / Expand folder",
+        "  zz         - Center current item",
+        "",
+        "Quick Actions:",
+        "  x, dd      - Delete item",
+        "  yy         - Copy title",
+        "  p          - Paste",
+        "  u          - Undo",
+        "  .          - Repeat action",
+        "",
+        "Function Keys (may not work in all terminals):",
+        "  F1 or ?    - Help (this screen)",
+        "  F2 or r    - Rename item",
+        "  F3 or f    - Filter/search",
+        "  F5         - Refresh tree",
+        "  Delete/x   - Delete item",
+        "  Insert     - New folder",
+        "",
+        "Claude Integration:",
+        "  r          - Resume Claude session",
+        "  c          - New Claude Code session",
+        "",
+        "Multi-select:",
+        "  Space      - Select/deselect",
+        "  Ctrl+A     - Select all",
+        "  V          - Visual mode",
+        "",
+        "Search/Filter:",
+        "  /          - Vim-style search",
+        "  f          - Filter mode",
+        "  n/N        - Next/prev match",
+        "  Ctrl+G     - Next match (in search)",
+        "",
+        "Organization:",
+        "  Tab/S-Tab  - Indent/outdent",
+        "  Alt+↑/↓    - Move item up/down",
+        "  Insert     - New folder",
+        "  r          - Rename",
+        "  m          - Move to folder",
+        "  o/O        - Sort order/Clear custom",
+        "",
+        "View Control:",
+        "  Enter      - View conversation in less/toggle folder",
+        "  e          - Edit conversation in $EDITOR",
+        "  E          - Expand all",
+        "  C          - Collapse all", 
+        "  1-5        - Expand to depth",
+        "  0          - Collapse all",
+        "",
+        "Press any key to close...",
+    )
+    _HELP_WIDTH = max(map(len, _HELP_TEXT))
+    
     def __init__(self, tree, tui):
         self.tree = tree
         self.tui = tui
+        self._fallback_editor: Optional[str] = None  # First installed editor, found on first use
+        # Action name -> handler, looked up once per key press by handle();
+        # expand_depth_<n> actions are matched by prefix instead
+        self._handlers = {
+            "select": self._handle_view,  # Legacy name for view
+            "view": self._handle_view,
+            "edit": self._handle_edit,
+            "toggle": self._handle_toggle,
+            "expand_all": self._handle_expand_all,
+            "collapse_all": self._handle_collapse_all,
+            "filter_folders": self._handle_filter_folders,
+            "filter_conversations": self._handle_filter_conversations,
+            "show_all": self._handle_show_all,
+            "toggle_sort": self._handle_toggle_sort,
+            "clear_custom_order": self._handle_clear_custom_order,
+            "refresh": self._handle_refresh,
+            "help": self._handle_help,
+        }
         
     # ActionHandler implementation
     def can_handle(self, action: str) -> bool:
         """Check if this handler can process the action."""
-        actions = {"select", "view", "edit", "toggle", "expand_all", "collapse_all",
-                   "filter_folders", "filter_conversations", "show_all",
-                   "toggle_sort", "clear_custom_order", "refresh", "help"}
-        return action in actions or action.startswith("expand_depth_")
+        return action in self._handlers or action.startswith("expand_depth_")
         
     def handle(self, action: str, context: ActionContext) -> Optional[ActionResult]:
         """Handle tree-specific actions."""
-        if action == "select":
-            # Keep legacy select behavior for backwards compatibility
-            if not context.selected_item:
-                return ActionResult(False)
-            
-            node, conv, _ = context.selected_item
-            if node.is_folder:
-                self.tree.toggle_folder(node.id)
-                return ActionResult(True, refresh_tree=True)
-            elif conv:
-                # Default to view action
-                return self._view_in_less(conv)
-                
-        elif action == "view":
-            if not context.selected_item:
-                return ActionResult(False)
+        handler = self._handlers.get(action)
+        if handler:
+            return handler(context)
+        if action.startswith("expand_depth_"):
+            return self._handle_expand_depth(int(action.split("_")[-1]))
+        return None
+        
+    def _handle_view(self, context: ActionContext) -> Optional[ActionResult]:
+        """Handle toggling a folder or viewing a conversation in less."""
+        if not context.selected_item:
+            return ActionResult(False)
+        
+        node, conv, _ = context.selected_item
+        if node.is_folder:
+            self.tree.toggle_folder(node.id)
+            return ActionResult(True, refresh_tree=True)
+        elif conv:
+            return self._view_in_less(conv)
+        return None
+        
+    def _handle_edit(self, context: ActionContext) -> ActionResult:
+        """Handle opening the current conversation in an editor."""
+        if not context.selected_item:
+            return ActionResult(False)
+        
+        node, conv, _ = context.selected_item
+        if conv:
+            try:
+                self._open_in_editor(conv)
+                return ActionResult(True, message="Opened in editor")
+            except Exception as e:
+                return ActionResult(False, message=f"Failed to open editor: {e}")
+        else:
+            return ActionResult(False, message="Cannot edit folders")
             
-            node, conv, _ = context.selected_item
+    def _handle_toggle(self, context: ActionContext) -> Optional[ActionResult]:
+        """Handle expanding or collapsing the current folder."""
+        if context.selected_item:
+            node, _, _ = context.selected_item
             if node.is_folder:
                 self.tree.toggle_folder(node.id)
                 return ActionResult(True, refresh_tree=True)
-            elif conv:
-                return self._view_in_less(conv)
-                
-        elif action == "edit":
-            if not context.selected_item:
-                return ActionResult(False)
-            
-            node, conv, _ = context.selected_item
-            if conv:
-                try:
-                    self._open_in_editor(conv)
-                    return ActionResult(True, message="Opened in editor")
-                except Exception as e:
-                    return ActionResult(False, message=f"Failed to open editor: {e}")
-            else:
-                return ActionResult(False, message="Cannot edit folders")
-                
-        elif action == "toggle":
-            if context.selected_item:
-                node, _, _ = context.selected_item
-                if node.is_folder:
-                    self.tree.toggle_folder(node.id)
-                    return ActionResult(True, refresh_tree=True)
-                    
-        elif action == "expand_all":
-            for node in self.tree.nodes.values():
-                if node.is_folder:
-                    node.expanded = True
-            return ActionResult(True, refresh_tree=True)
-            
-        elif action == "collapse_all":
-            for node in self.tree.nodes.values():
-                if node.is_folder:
-                    node.expanded = False
-            return ActionResult(True, refresh_tree=True)
-            
-        elif action.startswith("expand_depth_"):
-            depth = int(action.split("_")[-1])
-            self._expand_to_depth(depth)
-            if depth == 0:
-                message = "Collapsed all folders"
-            else:
-                message = f"Expanded to depth {depth}"
-            return ActionResult(True, message=message, refresh_tree=True)
-            
-        elif action == "filter_folders":
-            # Filter conversations to empty, keeping only folder structure
-            context.tui.filtered_conversations = []
-            return ActionResult(True, message="Showing only folders", refresh_tree=True)
-            
-        elif action == "filter_conversations":
-            # This would need more complex logic to flatten the tree
-            return ActionResult(True, message="Showing only conversations")
-            
-        elif action == "show_all":
+        return None
+        
+    def _handle_expand_all(self, context: ActionContext) -> ActionResult:
+        """Handle expanding every folder."""
+        for node in self.tree.folders():
+            node.expanded = True
+        return ActionResult(True, refresh_tree=True)
+        
+    def _handle_collapse_all(self, context: ActionContext) -> ActionResult:
+        """Handle collapsing every folder."""
+        for node in self.tree.folders():
+            node.expanded = False
+        return ActionResult(True, refresh_tree=True)
+        
+    def _handle_expand_depth(self, depth: int) -> ActionResult:
+        """Handle expanding folders down to a depth, or collapsing all for 0."""
+        self._expand_to_depth(depth)
+        if depth == 0:
+            message = "Collapsed all folders"
+        else:
+            message = f"Expanded to depth {depth}"
+        return ActionResult(True, message=message, refresh_tree=True)
+        
+    def _handle_filter_folders(self, context: ActionContext) -> ActionResult:
+        """Handle hiding conversations, keeping only folder structure."""
+        context.tui.filtered_conversations = []
+        return ActionResult(True, message="Showing only folders", refresh_tree=True)
+        
+    def _handle_filter_conversations(self, context: ActionContext) -> ActionResult:
+        """Handle showing only conversations."""
+        # This would need more complex logic to flatten the tree
+        return ActionResult(True, message="Showing only conversations")
+        
+    def _handle_show_all(self, context: ActionContext) -> ActionResult:
+        """Handle clearing any filter."""
+        context.tui.filtered_conversations = context.tui.conversations
+        return ActionResult(True, message="Showing all items", refresh_tree=True)
+        
+    def _handle_toggle_sort(self, context: ActionContext) -> ActionResult:
+        """Handle switching between date and alphabetical sorting."""
+        context.tui.sort_by_date = not context.tui.sort_by_date
+        self.tree.clear_custom_order()
+        sort_type = "date" if context.tui.sort_by_date else "alphabetical"
+        return ActionResult(True, message=f"Sorting by {sort_type} (custom order cleared)", 
+                          save_tree=True, refresh_tree=True)
+        
+    def _handle_clear_custom_order(self, context: ActionContext) -> ActionResult:
+        """Handle dropping any custom ordering."""
+        self.tree.clear_custom_order()
+        return ActionResult(True, message="Cleared custom ordering", 
+                          save_tree=True, refresh_tree=True)
+                          
+    def _handle_refresh(self, context: ActionContext) -> ActionResult:
+        """Handle reloading conversations from disk."""
+        try:
+            from ccsm.core.loader import load_conversations
+            context.tui.conversations = load_conversations(context.tui.conversations_file)
             context.tui.filtered_conversations = context.tui.conversations
-            return ActionResult(True, message="Showing all items", refresh_tree=True)
-            
-        elif action == "toggle_sort":
-            context.tui.sort_by_date = not context.tui.sort_by_date
-            self.tree.clear_custom_order()
-            sort_type = "date" if context.tui.sort_by_date else "alphabetical"
-            return ActionResult(True, message=f"Sorting by {sort_type} (custom order cleared)", 
-                              save_tree=True, refresh_tree=True)
-            
-        elif action == "clear_custom_order":
-            self.tree.clear_custom_order()
-            return ActionResult(True, message="Cleared custom ordering", 
-                              save_tree=True, refresh_tree=True)
-                              
-        elif action == "refresh":
-            try:
-                from ccsm.core.loader import load_conversations
-                context.tui.conversations = load_conversations(context.tui.conversations_file)
-                context.tui.filtered_conversations = context.tui.conversations
-                message = f"Refreshed {len(context.tui.conversations)} conversations"
-                return ActionResult(True, message=message, refresh_tree=True)
-            except Exception as e:
-                return ActionResult(False, message=f"Refresh failed: {e}")
-                
-        elif action == "help":
-            self._show_tree_help(context)
-            return ActionResult(True)
+            message = f"Refreshed {len(context.tui.conversations)} conversations"
+            return ActionResult(True, message=message, refresh_tree=True)
+        except Exception as e:
+            return ActionResult(False, message=f"Refresh failed: {e}")
             
-        return None
+    def _handle_help(self, context: ActionContext) -> ActionResult:
+        """Handle showing the tree view help."""
+        self._show_tree_help(context)
+        return ActionResult(True)
         
     def _expand_to_depth(self, depth: int) -> None:
         """Expand tree to specific depth level."""
         if depth == 0:
             # Collapse all
-            for node in self.tree.nodes.values():
-                if node.is_folder:
-                    node.expanded = False
+            for node in self.tree.folders():
+                node.expanded = False
         else:
-            # Expand to specified depth
-            def expand_recursive(node_ids, current_depth):
-                for node_id in node_ids:
-                    if node_id in self.tree.nodes:
-                        node = self.tree.nodes[node_id]
-                        if node.is_folder:
-                            node.expanded = current_depth < depth
-                            if node.expanded:
-                                expand_recursive(node.children, current_depth + 1)
-            
-            expand_recursive(self.tree.root_nodes, 1)
+            # Expand to specified depth, breadth first from the roots
+            nodes = self.tree.nodes
+            pending = deque((node_id, 1) for node_id in self.tree.root_nodes)
+            while pending:
+                node_id, current_depth = pending.popleft()
+                node = nodes.get(node_id)
+                if node is not None and node.is_folder:
+                    node.expanded = current_depth < depth
+                    if node.expanded:
+                        pending.extend((child_id, current_depth + 1) for child_id in node.children)
             
     def _show_tree_help(self, context: ActionContext) -> None:
         """Show help dialog for tree view."""
-        help_text = [
-            "Enhanced Keybindings:",
-            "",
-            "Vim Navigation:",
-            "  ↑/k, ↓/j   - Move up/down",
-            "  gg, G      - Go to top/bottom",  
-            "  Ctrl+D/U   - Half page down/up",
-            "  Ctrl+F/B   - Full page down/up",
-            "  H/M/L      - Jump High/Middle/Low on screen",
-            "  h/l        - Jump to parent / Expand folder",
-            "  zz         - Center current item",
-            "",
-            "Quick Actions:",
-            "  x, dd      - Delete item",
-            "  yy         - Copy title",
-            "  p          - Paste",
-            "  u          - Undo",
-            "  .          - Repeat action",
-            "",
-            "Function Keys (may not work in all terminals):",
-            "  F1 or ?    - Help (this screen)",
-            "  F2 or r    - Rename item",
-            "  F3 or f    - Filter/search",
-            "  F5         - Refresh tree",
-            "  Delete/x   - Delete item",
-            "  Insert     - New folder",
-            "",
-            "Claude Integration:",
-            "  r          - Resume Claude session",
-            "  c          - New Claude Code session",
-            "",
-            "Multi-select:",
-            "  Space      - Select/deselect",
-            "  Ctrl+A     - Select all",
-            "  V          - Visual mode",
-            "",
-            "Search/Filter:",
-            "  /          - Vim-style search",
-            "  f          - Filter mode",
-            "  n/N        - Next/prev match",
-            "  Ctrl+G     - Next match (in search)",
-            "",
-            "Organization:",
-            "  Tab/S-Tab  - Indent/outdent",
-            "  Alt+↑/↓    - Move item up/down",
-            "  Insert     - New folder",
-            "  r          - Rename",
-            "  m          - Move to folder",
-            "  o/O        - Sort order/Clear custom",
-            "",
-            "View Control:",
-            "  Enter      - View conversation in less/toggle folder",
-            "  e          - Edit conversation in $EDITOR",
-            "  E          - Expand all",
-            "  C          - Collapse all", 
-            "  1-5        - Expand to depth",
-            "  0          - Collapse all",
-            "",
-            "Press any key to close..."
-        ]
-        
         # Show help using curses window
-        import curses
+        help_text = self._HELP_TEXT
         h, w = context.stdscr.getmaxyx()
         height = min(len(help_text) + 2, h - 2)
-        width = min(max(len(line) for line in help_text) + 4, w - 4)
+        width = min(self._HELP_WIDTH + 4, w - 4)
         start_y = (h - height) // 2
         start_x = (w - width) // 2
         
@@ -252,9 +274,6 @@ class TreeManager(ActionHandler):
 
     def _open_claude_aligned(self, conversation) -> None:
         """Open Claude session with aligned JSON + plaintext split view."""
-        import curses
-        from pathlib import Path
-
         file_path = conversation.metadata['file']
         entries = load_raw_entries(file_path)
         if not entries:
@@ -308,20 +327,16 @@ class TreeManager(ActionHandler):
                     self.tui.status_message = f"Saved: --resume {new_uuid[:8]}..."
 
         except Exception as e:
-            import curses
             curses.doupdate()
             self.tui.status_message = f"Error: {e}"
 
     def _open_markdown_editor(self, conversation) -> None:
         """Open conversation as markdown in editor (non-Claude sessions)."""
-        import curses
         temp_path = None
 
         try:
-            content = export_conversation(conversation, format="markdown")
-
             with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
-                f.write(content)
+                f.writelines(export_conversation_iter(conversation, format="markdown"))
                 temp_path = f.name
 
             editor = self._get_editor()
@@ -349,27 +364,16 @@ class TreeManager(ActionHandler):
         if editor:
             return editor
         
-        # Try common editors in order of preference
-        editors = ['nano', 'vim', 'vi', 'emacs', 'less', 'more']
-        for ed in editors:
-            try:
-                if subprocess.run(['which', ed], capture_output=True, 
-                                text=True).returncode == 0:
-                    return ed
-            except:
-                continue
-        
-        # Last resort
-        return 'less'
+        if self._fallback_editor is None:
+            # Try common editors in order of preference, falling back to less
+            editors = ['nano', 'vim', 'vi', 'emacs', 'less', 'more']
+            self._fallback_editor = next((ed for ed in editors if shutil.which(ed)), 'less')
+        return self._fallback_editor
     
     def _view_in_less(self, conversation) -> ActionResult:
         """View conversation in less for fast incremental viewing."""
         try:
-            # Export conversation
-            content = export_conversation(conversation, format="markdown")
-            
             # Suspend curses
-            import curses
             curses.endwin()
             
             try:
@@ -380,9 +384,17 @@ class TreeManager(ActionHandler):
                 # -X: don't clear screen on exit
                 less_cmd = ['less', '-R', '-S', '-F', '-X']
                 
-                # Pipe content to less
+                # Stream the export to less as it is produced, so the
+                # first screen shows before the whole conversation is rendered
                 proc = subprocess.Popen(less_cmd, stdin=subprocess.PIPE, text=True)
-                proc.communicate(input=content)
+                try:
+                    with proc.stdin:
+                        proc.stdin.writelines(export_conversation_iter(conversation, format="markdown"))
+                except BrokenPipeError:
+                    # less was quit before reading everything
+                    pass
+                finally:
+                    proc.wait()
                 
             finally:
                 # Resume curses
@@ -392,6 +404,5 @@ class TreeManager(ActionHandler):
             
         except Exception as e:
             # Resume curses if there was an error
-            import curses
             curses.doupdate()
             return ActionResult(False, message=f"Failed to view: {e}")
\ No newline at end of file
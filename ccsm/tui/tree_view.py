@@ -13,12 +13,9 @@ class TreeView:
     
     def __init__(self, stdscr):
         self.stdscr = stdscr
-        # Use almost full screen, leaving room for status line
-        h, w = stdscr.getmaxyx()
         self.y = 1
         self.x = 0
-        self.width = w
-        self.height = h - 2
+        self.resize()
         
         # Visual settings
         self.indent_size = 2
@@ -35,6 +32,13 @@ class TreeView:
         self.last_key = None  # For vim-like double-key commands
         self.last_key_time = 0  # Timestamp for double-key timeout
         
+    def resize(self) -> None:
+        """Re-read the terminal size; called on KEY_RESIZE rather than every frame."""
+        # Use almost full screen, leaving room for status line
+        h, w = self.stdscr.getmaxyx()
+        self.width = w
+        self.height = h - 2
+        
     def set_items(self, items: List[Tuple[TreeNode, Optional[any], int]]) -> None:
         """Update tree items."""
         self.tree_items = items
@@ -239,11 +243,6 @@ class TreeView:
             
     def draw(self) -> None:
         """Draw the tree with enhanced visuals."""
-        # Update dimensions in case of resize
-        h, w = self.stdscr.getmaxyx()
-        self.width = w
-        self.height = h - 2
-
         # Clear area
         try:
             for row in range(self.height):
@@ -260,8 +259,8 @@ class TreeView:
             return
             
         # Count items for header
-        folders = sum(1 for n, _, _ in self.tree_items if n.is_folder)
-        convs = sum(1 for n, _, _ in self.tree_items if not n.is_folder)
+        folders = sum(node.is_folder for node, _, _ in self.tree_items)
+        convs = len(self.tree_items) - folders
         
         # Draw header with counts
         header = f"📁 {folders} folders, 💬 {convs} conversations"
@@ -337,7 +336,7 @@ class TreeView:
                 # Get times
                 modified = format_relative_time(conv.update_time)
                 created = format_relative_time(conv.create_time)
-                msg_count = len(conv.messages) if conv.messages else 0
+                msg_count = conv.get_message_count()
                 
                 # Calculate space needed for the format
                 # icon (3) + space + [modified] (12) + space + [created] (12) + space + (msgs) (7) = ~37 chars
@@ -11,11 +11,9 @@ from typing import List
 
 from ccsm.core.loader import load_conversations
 from ccsm.core.claude_loader import find_claude_project_for_cwd, list_claude_projects
-from ccsm.core.exporter import export_conversation as export_conv
 from ccsm.core.logging_config import setup_logging, get_logger
 from ccsm.core.curses_context import curses_context, emergency_cleanup
 from ccsm.tree.tree import ConversationTree
-from ccsm.tui.input import get_input, confirm, select_folder
 from ccsm.tui.tree_view import TreeView
 from ccsm.tui.search_overlay import SearchOverlay
 from ccsm.tui.selection_manager import SelectionManager
@@ -24,7 +22,7 @@ from ccsm.tui.operations_manager import OperationsManager
 from ccsm.tui.action_manager import ActionManager
 from ccsm.tui.tree_manager import TreeManager
 from ccsm.tui.fzf_search import FZFSearch
-from ccsm.tui.action_handler import ActionContext, ActionResult
+from ccsm.tui.action_handler import ActionContext, ActionHandler, ActionResult
 
 
 class ViewMode(Enum):
@@ -60,10 +58,12 @@ class TUI:
         self.tree_offset = 0
         self.tree_selected = 0
         self.sort_by_date = True  # True for date, False for alphabetical
+        self._project_info = None  # Status line project tag, see _get_project_info
         
         # Search state (keeping some here for compatibility)
         self.search_term = ""
         self.filtered_conversations = self.conversations  # Conversations matching search
+        self._last_filter = None  # (term, matches) from the last filter, to narrow as the user types
         
         # Initialize managers
         self.selection_manager = SelectionManager()
@@ -74,6 +74,8 @@ class TUI:
         
         # Action handlers list (will be populated in run())
         self.action_handlers = []
+        self._routes = {}  # Action -> handlers accepting it, see _handlers_for
+        self._routes_for = None  # The handler list _routes was built from
         
     def run(self, stdscr) -> None:
         """Main UI loop."""
@@ -88,8 +90,8 @@ class TUI:
         
         # Initialize components
         self.tree_view = TreeView(stdscr)
-        height, width = stdscr.getmaxyx()
-        self.search_overlay = SearchOverlay(stdscr, 0, 0, width)
+        self._size = stdscr.getmaxyx()  # (height, width), re-read on KEY_RESIZE
+        self.search_overlay = SearchOverlay(stdscr, 0, 0, self._size[1])
         self.operations_manager = OperationsManager(self.tree, stdscr)
         self.tree_manager = TreeManager(self.tree, self)
         
@@ -118,6 +120,8 @@ class TUI:
                 key = get_key_with_escape_handling(stdscr)
                 if key != -1:
                     self.status_message = ""
+                if key == curses.KEY_RESIZE:
+                    self._resize()
                 self._handle_key(key)
             except KeyboardInterrupt:
                 break
@@ -129,7 +133,7 @@ class TUI:
     def _draw(self) -> None:
         """Draw current view."""
         self.stdscr.clear()
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         # Draw tree view
         self._draw_tree()
@@ -142,23 +146,31 @@ class TUI:
         try:
             if self.status_message:
                 self.stdscr.addstr(height-1, 0, self.status_message[:width-1], curses.color_pair(2))
-            else:
+            elif self.current_view == ViewMode.TREE:
                 multi_info = f" [{len(self.selection_manager.selected_items)} selected]" if self.selection_manager.selected_items else ""
                 visual_info = " [VISUAL]" if self.selection_manager.visual_mode else ""
                 search_info = f" [{len(self.search_manager.search_matches)} matches]" if self.search_manager.search_matches else ""
                 filter_info = f" [{len(self.filtered_conversations)} filtered]" if len(self.filtered_conversations) != len(self.conversations) else ""
                 project_info = self._get_project_info()
-                help_text = {
-                    ViewMode.TREE: f"/:Search f:Filter Ctrl+F:FZF n/N:Next/Prev x:Delete V:Visual u:Undo F1:Help{multi_info}{visual_info}{search_info}{filter_info}{project_info}",
-                    ViewMode.SEARCH: ("Type:Filter Ctrl+W:DelWord ESC:Cancel Enter:Apply" if self.search_manager.filter_mode else
-                                    "Type:Search Ctrl+G:Next Ctrl+W:DelWord ESC:Cancel Enter:Apply"),
-                }.get(self.current_view, "q:Quit")
+                help_text = f"/:Search f:Filter Ctrl+F:FZF n/N:Next/Prev x:Delete V:Visual u:Undo F1:Help{multi_info}{visual_info}{search_info}{filter_info}{project_info}"
+                self.stdscr.addstr(height-1, 0, help_text[:width-1])
+            elif self.current_view == ViewMode.SEARCH:
+                help_text = ("Type:Filter Ctrl+W:DelWord ESC:Cancel Enter:Apply" if self.search_manager.filter_mode else
+                             "Type:Search Ctrl+G:Next Ctrl+W:DelWord ESC:Cancel Enter:Apply")
                 self.stdscr.addstr(height-1, 0, help_text[:width-1])
+            else:
+                self.stdscr.addstr(height-1, 0, "q:Quit"[:width-1])
         except curses.error:
             pass
             
         self.stdscr.refresh()
             
+    def _resize(self) -> None:
+        """Pick up a new terminal size for the views that lay out against it."""
+        self._size = self.stdscr.getmaxyx()
+        self.tree_view.resize()
+        self.search_overlay.width = self._size[1]
+            
     def _draw_tree(self) -> None:
         """Draw tree view."""
         self.tree_view.set_selected_items(self.selection_manager.selected_items)
@@ -296,27 +308,26 @@ class TUI:
             context = ActionContext(self, key, result)
             
             # Let each handler process the action
-            for handler in self.action_handlers:
-                if handler.can_handle(result):
-                    action_result = handler.handle(result, context)
-                    if action_result:
-                        # Process action result
-                        if action_result.message:
-                            self.status_message = action_result.message
-                        if action_result.save_tree:
-                            self.tree.save()
-                        if action_result.refresh_tree:
-                            self._refresh_tree()
-                            # Restore selection to the moved item if specified
-                            if action_result.select_item_id:
-                                self._move_cursor_to_item(action_result.select_item_id)
-                        if action_result.change_view:
-                            self.current_view = action_result.change_view
-                        if action_result.clear_selection:
-                            self.selection_manager.clear_selection()
-                        if action_result.exit_tui:
-                            self.running = False
-                        break
+            for handler in self._handlers_for(result):
+                action_result = handler.handle(result, context)
+                if action_result:
+                    # Process action result
+                    if action_result.message:
+                        self.status_message = action_result.message
+                    if action_result.save_tree:
+                        self.tree.save()
+                    if action_result.refresh_tree:
+                        self._refresh_tree()
+                        # Restore selection to the moved item if specified
+                        if action_result.select_item_id:
+                            self._move_cursor_to_item(action_result.select_item_id)
+                    if action_result.change_view:
+                        self.current_view = action_result.change_view
+                    if action_result.clear_selection:
+                        self.selection_manager.clear_selection()
+                    if action_result.exit_tui:
+                        self.running = False
+                    break
                         
         # Handle special search keys that don't come as results from tree_view
         if key == ord('n') and not result:  # Next search match
@@ -403,6 +414,21 @@ class TUI:
             self.tree_selected = max(0, len(self.tree_items) - 1)
             
         
+    def _handlers_for(self, action: str) -> List[ActionHandler]:
+        """Registered handlers that accept an action, in priority order.
+        
+        A handler's can_handle answer for an action never changes, so each
+        action is routed once per handler list rather than on every key press.
+        """
+        if self._routes_for is not self.action_handlers:
+            self._routes = {}
+            self._routes_for = self.action_handlers
+        handlers = self._routes.get(action)
+        if handlers is None:
+            handlers = [handler for handler in self.action_handlers if handler.can_handle(action)]
+            self._routes[action] = handlers
+        return handlers
+        
     def _move_cursor_to_item(self, item_id: str) -> None:
         """Move cursor to the specified item in the tree."""
         for i, (node, _, _) in enumerate(self.tree_items):
@@ -417,31 +443,33 @@ class TUI:
         if not self.search_term:
             self.filtered_conversations = self.conversations
         else:
-            # Search in both title and content
-            self.filtered_conversations = []
-            for conv in self.conversations:
-                # Check title
-                if self.search_term in conv.title.lower():
-                    self.filtered_conversations.append(conv)
-                    continue
+            # Typing forward can only narrow the previous matches, so filter those instead
+            candidates = self.conversations
+            if self._last_filter is not None:
+                last_term, last_matches = self._last_filter
+                if last_matches is self.filtered_conversations and self.search_term.startswith(last_term):
+                    candidates = last_matches
                     
-                # Check message content
-                found_in_content = False
-                for message in conv.messages:
-                    if self.search_term in message.content.lower():
-                        found_in_content = True
-                        break
-                        
-                if found_in_content:
-                    self.filtered_conversations.append(conv)
+            # Search in both title and content
+            term_lower = self.search_term
+            matches = [conv for conv in candidates
+                       if term_lower in conv.title_lower or conv.contains_text(term_lower)]
+            if candidates is not self.conversations and len(matches) == len(candidates):
+                # Narrowing kept every previous match, so the tree shown is still right
+                self._last_filter = (term_lower, candidates)
+                return
+            self.filtered_conversations = matches
+            self._last_filter = (term_lower, matches)
                     
         self._refresh_tree()
         
     def _clear_search(self) -> None:
         """Clear search filter."""
         self.search_term = ""
-        self.filtered_conversations = self.conversations
-        self._refresh_tree()
+        # Nothing to rebuild if no filter is applied
+        if self.filtered_conversations is not self.conversations:
+            self.filtered_conversations = self.conversations
+            self._refresh_tree()
         
             
     def _quick_filter(self) -> None:
@@ -494,14 +522,16 @@ class TUI:
             self.stdscr.refresh()
     
     def _get_project_info(self) -> str:
-        """Get project information for the status line."""
-        # Check if we're in a Claude project
-        claude_project = find_claude_project_for_cwd()
-        if claude_project:
-            from pathlib import Path
-            project_name = Path(claude_project).name
-            return f" [📁{project_name}]"
-        return ""
+        """Get project information for the status line.
+        
+        Looked up on the first frame only: the working directory doesn't
+        change while the TUI runs, and the lookup stats the projects folder.
+        """
+        if self._project_info is None:
+            # Check if we're in a Claude project
+            claude_project = find_claude_project_for_cwd()
+            self._project_info = f" [📁{Path(claude_project).name}]" if claude_project else ""
+        return self._project_info
     
 
 
@@ -519,16 +549,21 @@ def main():
     setup_logging(debug_mode=args.debug)
     logger = get_logger(__name__)
     
-    # Auto-detect Claude or Gemini project if no file specified
+    # Auto-detect Claude or Gemini project if no file specified.
+    # Detected directories were just found on disk, so they aren't checked again below.
+    detected = False
     if not args.conversations_file:
         # Check if we're in a Claude project directory
         claude_project = find_claude_project_for_cwd()
+        gemini_dir = Path.home() / ".gemini" / "tmp"
         if claude_project:
             args.conversations_file = claude_project
             args.format = "claude"
-        elif (Path.home() / ".gemini" / "tmp").exists():
-            args.conversations_file = str(Path.home() / ".gemini" / "tmp")
+            detected = True
+        elif gemini_dir.exists():
+            args.conversations_file = str(gemini_dir)
             args.format = "gemini"
+            detected = True
         else:
             # Fall back to showing Claude project picker
             projects = list_claude_projects()
@@ -568,7 +603,7 @@ def main():
                 print("\nCancelled.")
                 sys.exit(0)
     
-    if not Path(args.conversations_file).exists():
+    if not detected and not Path(args.conversations_file).exists():
         print(f"File not found: {args.conversations_file}")
         sys.exit(1)
     
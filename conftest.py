@@ -8,7 +8,15 @@ This ensures that the 'src' module can be imported when running pytest directly.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
\ No newline at end of file
+    sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk conversation cache out of the user's home directory."""
+    monkeypatch.setenv("CCSM_CACHE_DIR", str(tmp_path / "ccsm-cache"))
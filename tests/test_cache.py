@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the on-disk conversation cache."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from ccsm.core import cache
+from ccsm.core.loader import load_conversations
+
+
+def _write_session(path: Path, text: str) -> None:
+    """Write a minimal Claude session file."""
+    entries = [
+        {"type": "user", "uuid": "u1", "timestamp": "2024-01-01T10:00:00Z",
+         "message": {"content": [{"type": "text", "text": text}]}},
+        {"type": "assistant", "uuid": "a1", "timestamp": "2024-01-01T10:01:00Z",
+         "message": {"content": [{"type": "text", "text": "Sure, here is how."}]}},
+    ]
+    path.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
+
+
+class TestConversationCache:
+    """Test mtime-keyed caching of parsed conversations."""
+
+    def setup_method(self):
+        """Create a project directory with two sessions."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = Path(self.temp_dir)
+        _write_session(self.project / "one.jsonl", "How do I reverse a list in Python?")
+        _write_session(self.project / "two.jsonl", "What is the capital of France, please?")
+
+    def test_cache_dir_override(self):
+        """Test CCSM_CACHE_DIR controls the cache location."""
+        assert cache.get_cache_dir() == Path(os.environ["CCSM_CACHE_DIR"])
+
+    def test_second_load_uses_cache(self):
+        """Test unchanged files are not re-parsed."""
+        first = load_conversations(str(self.project))
+        with patch('ccsm.core.claude_loader.load_claude_conversation') as mock_load:
+            second = load_conversations(str(self.project))
+            mock_load.assert_not_called()
+        assert [c.title for c in second] == [c.title for c in first]
+
+    def test_changed_file_is_reparsed(self):
+        """Test only the modified session is parsed again."""
+        load_conversations(str(self.project))
+        _write_session(self.project / "two.jsonl", "A completely different and longer question here?")
+
+        from ccsm.core.claude_loader import load_claude_conversation
+        with patch('ccsm.core.claude_loader.load_claude_conversation',
+                   side_effect=load_claude_conversation) as mock_load:
+            conversations = load_conversations(str(self.project))
+            assert mock_load.call_count == 1
+        assert "A completely different and longer question here?" in {c.title for c in conversations}
+
+    def test_removed_file_is_dropped(self):
+        """Test deleted sessions disappear from cached results."""
+        load_conversations(str(self.project))
+        (self.project / "one.jsonl").unlink()
+        assert [c.id for c in load_conversations(str(self.project))] == ["two"]
+
+    def test_single_file_cache(self):
+        """Test single-file loads are cached too."""
+        path = str(self.project / "one.jsonl")
+        load_conversations(path)
+        with patch('ccsm.core.loader.load_claude_conversations') as mock_load:
+            conversations = load_conversations(path)
+            mock_load.assert_not_called()
+        assert conversations[0].id == "one"
+
+    def test_no_cache_bypasses_cache(self):
+        """Test use_cache=False always parses."""
+        path = str(self.project / "one.jsonl")
+        load_conversations(path)
+        with patch('ccsm.core.loader.load_claude_conversations', return_value=[]) as mock_load:
+            assert load_conversations(path, use_cache=False) == []
+            mock_load.assert_called_once()
+
+    def test_corrupt_cache_is_a_miss(self):
+        """Test unreadable cache files fall back to parsing."""
+        load_conversations(str(self.project))
+        for entry in cache.get_cache_dir().iterdir():
+            entry.write_bytes(b"not a pickle")
+        assert len(load_conversations(str(self.project))) == 2
+
+    def test_stale_entry_skips_payload(self):
+        """Test a stale single-file entry is rejected from its header alone."""
+        import pickle
+        path = self.project / "one.jsonl"
+        load_conversations(str(path))
+        _write_session(path, "An edited question that changes the file size?")
+
+        with patch('ccsm.core.cache.pickle.load', side_effect=pickle.load) as mock_load:
+            conversations = load_conversations(str(path))
+            assert mock_load.call_count == 1
+        assert conversations[0].title == "An edited question that changes the file size?"
@@ -6,7 +6,7 @@ import json
 import pytest
 from pathlib import Path
 
-from ccsm.core.claude_loader import load_claude_conversations, parse_claude_message
+from ccsm.core.claude_loader import load_claude_conversation, load_claude_conversations, parse_claude_message
 
 
 class TestClaudeLoader:
@@ -44,6 +44,15 @@ class TestClaudeLoader:
         assert msg.role.value == "assistant"
         assert msg.content == "Hello! How can I help you?"
     
+    def test_parse_claude_message_keeps_slim_metadata(self):
+        """Test only user messages keep the message body, and not the raw entry."""
+        message = {"content": [{"type": "text", "text": "Hi"}]}
+        user = parse_claude_message({"type": "user", "uuid": "u", "cwd": "/big", "message": message})
+        assistant = parse_claude_message({"type": "assistant", "uuid": "a", "message": message})
+        
+        assert user.metadata == {'message': message}
+        assert assistant.metadata is None
+    
     def test_parse_claude_message_with_text_content(self):
         """Test parsing message with text field."""
         claude_data = {
@@ -70,6 +79,23 @@ class TestClaudeLoader:
         msg = parse_claude_message(claude_data)
         assert msg.content == "[Empty message]"
     
+    def test_extract_claude_content_tools(self):
+        """Test tool items are summarized, long results truncated, and left out of titles."""
+        from ccsm.core.claude_loader import extract_claude_content
+        message = {"content": [
+            {"type": "text", "text": "Run the tests"},
+            {"type": "tool_use", "name": "Bash", "input": {"command": "pytest", "a": 1, "b": 2, "c": 3}},
+            {"type": "tool_result", "content": "x" * 250},
+            {"type": "tool_result", "content": [{"type": "text", "text": "structured"}]},
+            {"type": "text", "text": "Error: not a title"},
+        ]}
+        
+        assert extract_claude_content(message).split("\n") == [
+            "Run the tests", "[Tool: Bash]", "  command: pytest", "  a: 1", "  b: 2",
+            f"[Tool Result: {'x' * 200}...]", "Error: not a title",
+        ]
+        assert extract_claude_content(message, for_title=True) == "Run the tests"
+    
     def test_load_claude_conversations_empty(self):
         """Test loading empty JSONL file."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
@@ -227,4 +253,161 @@ class TestClaudeLoader:
             conv = conversations[0]
             assert conv.metadata is not None
             assert conv.metadata.get('source') == 'claude'
-            assert conv.metadata.get('project') == '-home-user-myproject'
\ No newline at end of file
+            assert conv.metadata.get('project') == '-home-user-myproject'
+
+    def test_metadata_only_matches_full_load(self):
+        """Test metadata-only loading keeps title, times and message count."""
+        entries = [{"type": "summary", "summary": "Earlier work"}]
+        for i in range(8):
+            entries.append({
+                "type": "assistant", "uuid": f"a{i}", "timestamp": f"2024-01-15T14:3{i}:00Z",
+                "message": {"content": [{"type": "tool_use", "name": "Bash", "input": {"command": "ls"}}]}
+            })
+            entries.append({
+                "type": "user", "uuid": f"u{i}", "timestamp": f"2024-01-15T14:3{i}:30Z",
+                "message": {"content": "plain string content is not counted"}
+            })
+        entries.append({
+            "type": "user", "uuid": "late", "timestamp": "2024-01-15T14:40:00Z",
+            "message": {"content": [{"type": "text", "text": "Please refactor the session loader for speed"}]}
+        })
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write('\n'.join(json.dumps(e) for e in entries) + '\n')
+            test_file = f.name
+        
+        try:
+            full = load_claude_conversations(test_file)[0]
+            meta = load_claude_conversations(test_file, metadata_only=True)[0]
+            
+            assert meta.get_message_count() == len(full.messages) == 9
+            assert meta.title == full.title == "Please refactor the session loader for speed"
+            assert meta.create_time == full.create_time
+            assert meta.update_time == full.update_time
+            
+            # Messages are parsed only when first read
+            assert meta._messages is None
+            assert [m.id for m in meta.messages] == [m.id for m in full.messages]
+        finally:
+            Path(test_file).unlink(missing_ok=True)
+    
+    def test_metadata_only_skips_lines_without_a_role(self):
+        """Test lines that can't be messages aren't JSON-parsed once the title is known."""
+        from unittest.mock import patch
+        from ccsm.core.json_compat import loads
+        
+        entries = []
+        for i in range(10):
+            entries.append({
+                "type": "user", "uuid": f"u{i}", "timestamp": f"2024-01-15T14:3{i}:00Z",
+                "message": {"content": [{"type": "text", "text": f"Question {i} about the loader"}]}
+            })
+            entries.append({"type": "summary", "summary": f"Summary {i}"})
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write('\n'.join(json.dumps(e) for e in entries) + '\n')
+            test_file = f.name
+        
+        try:
+            with patch('ccsm.core.claude_loader.loads', wraps=loads) as mock_loads:
+                meta = load_claude_conversation(test_file, metadata_only=True)
+            
+            assert meta.get_message_count() == 10
+            assert meta.title == "Question 0 about the loader"
+            assert mock_loads.call_count < len(entries)
+        finally:
+            Path(test_file).unlink(missing_ok=True)
+    
+    def test_load_conversation_at_parses_one_session(self):
+        """Test loading one conversation by listing position from a project directory."""
+        from unittest.mock import patch
+        from ccsm.core.claude_loader import load_claude_conversation
+        from ccsm.core.loader import load_conversation_at, load_conversations
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i, text in enumerate(["Oldest question here", "Newest question here"]):
+                entry = {"type": "user", "uuid": f"u{i}", "timestamp": f"2024-01-0{i + 1}T10:00:00Z",
+                         "message": {"content": [{"type": "text", "text": text}]}}
+                (Path(temp_dir) / f"s{i}.jsonl").write_text(json.dumps(entry) + "\n")
+            
+            listing = load_conversations(temp_dir, metadata_only=True)
+            with patch('ccsm.core.claude_loader.load_claude_conversation',
+                       wraps=load_claude_conversation) as mock_load:
+                conv, total = load_conversation_at(temp_dir, 1)
+                assert mock_load.call_count == 0
+                assert conv.messages[0].content == "Oldest question here"
+                assert mock_load.call_count == 1
+            
+            assert total == 2
+            assert conv.id == listing[1].id == "s0"
+            assert load_conversation_at(temp_dir, 2) == (None, 2)
+    
+    def test_bad_lines_are_skipped(self):
+        """Test malformed JSON and invalid UTF-8 lines don't lose the rest of the session."""
+        good = {"type": "user", "uuid": "u1", "timestamp": "2024-01-01T10:00:00Z",
+                "message": {"content": [{"type": "text", "text": "Héllo from a valid line"}]}}
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.jsonl', delete=False) as f:
+            f.write(b'{"type": "user", "broken\n')
+            f.write(b'{"type": "user", "text": "\xff\xfe"}\n')
+            f.write(json.dumps(good, ensure_ascii=False).encode('utf-8') + b'\n')
+            test_file = f.name
+        
+        try:
+            conversations = load_claude_conversations(test_file)
+            assert len(conversations) == 1
+            assert conversations[0].messages[0].content == "Héllo from a valid line"
+        finally:
+            Path(test_file).unlink()
+    
+    def test_large_file_read_through_mmap(self):
+        """Test files over the mmap threshold load the same as small ones."""
+        from unittest.mock import patch
+        
+        entries = [{"type": "user", "uuid": f"u{i}", "timestamp": "2024-01-01T10:00:00Z",
+                    "message": {"content": [{"type": "text", "text": f"Question number {i}"}]}}
+                   for i in range(3)]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write("\n".join(json.dumps(e) for e in entries))  # no trailing newline
+            test_file = f.name
+        
+        try:
+            small = load_claude_conversation(test_file)
+            with patch('ccsm.core.claude_loader._MMAP_THRESHOLD', 1):
+                large = load_claude_conversation(test_file)
+            
+            assert [m.content for m in large.messages] == [m.content for m in small.messages]
+            assert len(large.messages) == 3
+        finally:
+            Path(test_file).unlink()
+    
+    def test_parse_timestamp(self):
+        """Test ISO timestamps parse to epoch seconds and bad input gives None."""
+        from ccsm.core.claude_loader import parse_timestamp
+        
+        assert parse_timestamp("2024-01-01T10:00:00Z") == 1704103200.0
+        assert parse_timestamp("2024-01-01T10:00:00.500Z") == 1704103200.5
+        assert parse_timestamp("not a date") is None
+        assert parse_timestamp(None) is None
+        assert parse_timestamp({"unexpected": "dict"}) is None
+    
+    def test_inline_title_matches_generate_title(self):
+        """Test the title picked up while loading is what generate_title gives for the messages."""
+        from ccsm.core.claude_loader import generate_title
+        
+        texts = [
+            "This session is being continued from a previous conversation. Summary: nothing quoted",
+            "short",
+            "Please add a streaming exporter for large sessions",
+        ]
+        entries = [{"type": "user", "uuid": f"u{i}", "timestamp": "2024-01-01T10:00:00Z",
+                    "message": {"content": [{"type": "text", "text": text}]}} for i, text in enumerate(texts)]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write('\n'.join(json.dumps(e) for e in entries) + '\n')
+            test_file = f.name
+        
+        try:
+            conv = load_claude_conversations(test_file)[0]
+            assert conv.title == "Please add a streaming exporter for large sessions"
+            assert conv.title == generate_title(conv.messages, None)
+        finally:
+            Path(test_file).unlink()
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
-from ccsm.core.claude_loader import find_claude_project_for_cwd, encode_path_like_claude
+from ccsm.core.claude_loader import find_claude_project_for_cwd, encode_path_like_claude, list_claude_projects
 
 
 class TestClaudeProjectDetection:
@@ -241,4 +241,52 @@ class TestClaudeProjectDetection:
                         # Test exact match
                         mock_cwd.return_value = Path(original_path)
                         result = find_claude_project_for_cwd()
-                        assert result == str(project_dir.resolve()), f"Failed for {original_path} -> {encoded_name}"
\ No newline at end of file
+                        assert result == str(project_dir.resolve()), f"Failed for {original_path} -> {encoded_name}"
+    def test_list_claude_projects(self):
+        """Test projects are counted and sorted by most recent session."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            projects_dir = temp_path / ".claude" / "projects"
+            
+            for name, sessions, mtime in [("-old", 2, 1000), ("-new", 3, 3000), ("-empty", 0, None)]:
+                project_dir = projects_dir / name
+                project_dir.mkdir(parents=True)
+                for i in range(sessions):
+                    conv_file = project_dir / f"conv{i}.jsonl"
+                    conv_file.write_text('{"type": "user", "content": "test"}\n')
+                    os.utime(conv_file, (mtime - i, mtime - i))
+            (projects_dir / "stray.txt").write_text("not a project")
+            
+            with patch('pathlib.Path.home') as mock_home:
+                mock_home.return_value = temp_path
+                projects = list_claude_projects()
+            
+            assert [p['name'] for p in projects] == ["-new", "-old", "-empty"]
+            assert [p['conversation_count'] for p in projects] == [3, 2, 0]
+            assert [p['last_modified'] for p in projects] == [3000, 1000, None]
+            assert projects[0]['path'] == str(projects_dir / "-new")
+    
+    def test_list_claude_projects_reuses_unchanged_listings(self):
+        """Test directory listings are reused until entries are added, while mtimes stay live."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            project_dir = temp_path / ".claude" / "projects" / "-proj"
+            project_dir.mkdir(parents=True)
+            conv_file = project_dir / "a.jsonl"
+            conv_file.write_text("{}\n")
+            os.utime(conv_file, (1000, 1000))
+            
+            with patch('pathlib.Path.home', return_value=temp_path):
+                list_claude_projects()
+                
+                # Appending to a session is seen without re-reading the directories
+                os.utime(conv_file, (2000, 2000))
+                with patch('ccsm.core.claude_loader.os.scandir') as mock_scandir:
+                    projects = list_claude_projects()
+                    mock_scandir.assert_not_called()
+                assert projects[0]['last_modified'] == 2000
+                
+                # A new session changes the directory mtime and is picked up
+                (project_dir / "b.jsonl").write_text("{}\n")
+                os.utime(project_dir, ns=(0, os.stat(project_dir).st_mtime_ns + 1))
+                assert list_claude_projects()[0]['conversation_count'] == 2
@@ -8,7 +8,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 import argparse
 
-from ccsm.cli.cli import main, list_conversations, export_conversation, search_conversations
+from ccsm.cli.cli import main, list_conversations, export_conversation, search_conversations, compact_json, _create_parser, _get_parser, _parse_fast
 from ccsm.core.models import Conversation, Message, MessageRole
 
 
@@ -42,39 +42,48 @@ class TestCLI:
             json.dump(self.test_data, f)
             self.test_file = f.name
     
-    def test_list_conversations_basic(self):
+    def test_list_conversations_basic(self, capsys):
         """Test basic conversation listing.""" 
-        with patch('builtins.print') as mock_print:
-            list_conversations(self.test_file)
-            
-            # Should print header and conversation entries
-            mock_print.assert_any_call("     Modified     Created      # Messages  Summary")
-            # Check that conversations are listed (format has changed to claude style)
-            calls = [str(call) for call in mock_print.call_args_list]
-            assert any("Python Tutorial" in call for call in calls)
-            assert any("JavaScript Guide" in call for call in calls)
-    
-    def test_list_conversations_with_count(self):
+        list_conversations(self.test_file)
+        lines = capsys.readouterr().out.splitlines()
+        
+        # Should print header and conversation entries
+        assert lines[0] == "     Modified     Created      # Messages  Summary"
+        # Check that conversations are listed (format has changed to claude style)
+        assert len(lines) == 3
+        assert any("Python Tutorial" in line for line in lines)
+        assert any("JavaScript Guide" in line for line in lines)
+    
+    def test_list_conversations_with_count(self, capsys):
         """Test listing conversations with count limit."""
-        with patch('builtins.print') as mock_print:
-            list_conversations(self.test_file, count=1)
-            
-            # Should limit to 1 conversation
-            calls = [str(call) for call in mock_print.call_args_list]
-            python_calls = [call for call in calls if "Python Tutorial" in call]
-            javascript_calls = [call for call in calls if "JavaScript Guide" in call]
-            # Should have Python but maybe not JavaScript (depends on order)
-            assert len(python_calls) + len(javascript_calls) <= 1
-    
-    def test_export_conversation(self):
-        """Test exporting a conversation."""
-        with patch('builtins.print') as mock_print:
-            export_conversation(self.test_file, 1)  # Use number instead of ID
-            
-            # Should print the exported conversation
-            # The exact format depends on the exporter implementation
-            mock_print.assert_called()
+        list_conversations(self.test_file, count=1)
+        output = capsys.readouterr().out
+        
+        # Should limit to 1 conversation
+        assert len(output.splitlines()) == 2
+        assert ("Python Tutorial" in output) + ("JavaScript Guide" in output) == 1
     
+    def test_export_conversation(self, capsys):
+        """Test exporting a conversation."""
+        export_conversation(self.test_file, 1)  # Use number instead of ID
+        
+        # Should write the exported conversation to stdout
+        output = capsys.readouterr().out
+        assert output.startswith("Conversation: Python Tutorial\n")
+        assert 'Start with print("Hello World")' in output
+        assert output.endswith("\n\n\n")
+
+    def test_export_role_headers(self, capsys):
+        """Test each message is introduced by its role in text and markdown exports."""
+        export_conversation(self.test_file, 1)
+        output = capsys.readouterr().out
+        assert f"USER:\n{'-' * 70}\nHow do I write Python?" in output
+
+        export_conversation(self.test_file, 1, export_format='markdown')
+        output = capsys.readouterr().out
+        assert "## 👤 USER\n\nHow do I write Python?" in output
+        assert "## 🤖 ASSISTANT\n\n" in output
+
     def test_export_nonexistent_conversation(self):
         """Test exporting a conversation that doesn't exist."""
         with patch('builtins.print') as mock_print:
@@ -91,6 +100,23 @@ class TestCLI:
             mock_print.assert_any_call("Found 1 matches for 'python'")
             mock_print.assert_any_call("1. [1] Python Tutorial (title match)")
     
+    def test_search_content(self):
+        """Test searching message content."""
+        with patch('builtins.print') as mock_print:
+            search_conversations(self.test_file, 'WEB DEVELOPMENT', content=True)
+            
+            mock_print.assert_any_call("Found 1 matches for 'WEB DEVELOPMENT'")
+            mock_print.assert_any_call("1. [2] JavaScript Guide (content match)")
+    
+    def test_search_limit(self):
+        """Test search stops after the requested number of matches."""
+        with patch('builtins.print') as mock_print:
+            search_conversations(self.test_file, 't', limit=1)
+            
+            mock_print.assert_any_call("Found more than 1 matches for 't'")
+            mock_print.assert_any_call("1. [1] Python Tutorial (title match)")
+            assert "JavaScript Guide" not in str(mock_print.call_args_list)
+    
     def test_search_case_insensitive(self):
         """Test that search is case insensitive."""
         with patch('builtins.print') as mock_print:
@@ -103,21 +129,74 @@ class TestCLI:
         with patch('sys.argv', ['cli', self.test_file, 'list']):
             with patch('ccsm.cli.cli.list_conversations') as mock_list:
                 main()
-                mock_list.assert_called_once_with(self.test_file, 20, format='auto')
+                mock_list.assert_called_once_with(self.test_file, 20, format='auto', use_cache=True)
     
     def test_main_export_command(self):
         """Test main function with export command."""
         with patch('sys.argv', ['cli', self.test_file, 'export', '1']):
             with patch('ccsm.cli.cli.export_conversation') as mock_export:
                 main()
-                mock_export.assert_called_once_with(self.test_file, 1, format='auto', export_format='text')
+                mock_export.assert_called_once_with(self.test_file, 1, format='auto', export_format='text',
+                                                    use_cache=True)
     
     def test_main_search_command(self):
         """Test main function with search command."""
         with patch('sys.argv', ['cli', self.test_file, 'search', 'python']):
             with patch('ccsm.cli.cli.search_conversations') as mock_search:
                 main()
-                mock_search.assert_called_once_with(self.test_file, 'python', False, format='auto')
+                mock_search.assert_called_once_with(self.test_file, 'python', False, format='auto', use_cache=True,
+                                                    limit=20)
+    
+    def test_main_no_cache_flag(self):
+        """Test --no-cache is passed through to the command."""
+        with patch('sys.argv', ['cli', '--no-cache', self.test_file, 'list']):
+            with patch('ccsm.cli.cli.list_conversations') as mock_list:
+                main()
+                mock_list.assert_called_once_with(self.test_file, 20, format='auto', use_cache=False)
+    
+    @pytest.mark.parametrize("argv", [
+        ["conv.json", "list"],
+        ["conv.json", "list", "-n", "5"],
+        ["conv.json", "list", "--count", "3"],
+        ["conv.json", "export", "2"],
+        ["conv.json", "export", "2", "--export-format", "markdown"],
+        ["conv.json", "search", "python"],
+        ["conv.json", "search", "-c", "python"],
+        ["conv.json", "search", "python", "--content"],
+    ])
+    def test_fast_parse_matches_argparse(self, argv):
+        """Test the fast path produces the same arguments as argparse."""
+        assert vars(_parse_fast(argv)) == vars(_create_parser().parse_args(argv))
+    
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["--help"],
+        ["list", "-n", "3"],
+        ["--debug", "conv.json", "list"],
+        ["conv.json", "list", "-n", "many"],
+        ["conv.json", "export", "1", "--export-format", "pdf"],
+        ["conv.json", "search", "a", "b"],
+        ["conv.json", "search", "a", "--limit", "5"],
+        ["conv.json", "projects"],
+    ])
+    def test_fast_parse_defers_to_argparse(self, argv):
+        """Test anything unusual falls back to the full parser."""
+        assert _parse_fast(argv) is None
+
+    @pytest.mark.parametrize("limit", ["0", "-1"])
+    def test_search_limit_must_be_positive(self, limit, capsys):
+        """Test --limit below 1 is rejected instead of reporting 'more than 0 matches'."""
+        assert _create_parser().parse_args(["conv.json", "search", "a", "--limit", "1"]).limit == 1
+        with pytest.raises(SystemExit):
+            _create_parser().parse_args(["conv.json", "search", "a", "--limit", limit])
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_parser_is_reused(self):
+        """Test the full parser is built once and parses independently each time."""
+        parser = _get_parser()
+        assert _get_parser() is parser
+        assert parser.parse_args(["conv.json", "search", "a", "--limit", "5"]).limit == 5
+        assert parser.parse_args(["conv.json", "search", "a"]).limit == 20
     
     def test_main_no_command(self):
         """Test main function with no command defaults to list."""
@@ -168,6 +247,21 @@ class TestCLIEdgeCases:
         finally:
             Path(test_file).unlink(missing_ok=True)
     
+    def test_compact_json(self):
+        """Test pretty-printed entries are written back one per line."""
+        entries = [{'type': 'user', 'text': 'héllo'}, {'type': 'assistant', 'n': 2}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pretty = Path(tmpdir) / 'session.json'
+            pretty.write_text('\n'.join(json.dumps(e, indent=2, ensure_ascii=False) for e in entries),
+                              encoding='utf-8')
+            
+            with patch('builtins.print'):
+                compact_json(str(pretty))
+            
+            lines = (Path(tmpdir) / 'session.jsonl').read_text(encoding='utf-8').split('\n')
+            assert [json.loads(line) for line in lines[:-1]] == entries
+            assert lines[-1] == ''
+    
     def test_invalid_file_handling(self):
         """Test handling of invalid or missing files."""
         with pytest.raises(FileNotFoundError):
@@ -178,23 +272,39 @@ class TestCLIEdgeCases:
 class TestCLIClaudeProjectDetection:
     """Test CLI Claude project auto-detection functionality."""
     
+    def test_list_claude_projects_cmd_output(self, capsys):
+        """Test the projects listing is written as complete lines."""
+        from ccsm.cli.cli import list_claude_projects_cmd
+        projects = [
+            {'name': '-home-user-app', 'path': '/p/1', 'conversation_count': 5, 'last_modified': None},
+            {'name': 'tmp', 'path': '/p/2', 'conversation_count': 1, 'last_modified': None},
+        ]
+        with patch('ccsm.core.claude_loader.list_claude_projects', return_value=projects):
+            list_claude_projects_cmd()
+        
+        output = capsys.readouterr().out
+        assert output.startswith("Found 2 Claude projects:\n")
+        assert "❯  1. Unknown                5  /home/user/app\n" in output
+        assert "\n   2. Unknown                1  /tmp\n" in output
+        assert output.endswith("--claude-project <PROJECT_NAME> list\n")
+    
     def test_main_no_args_with_claude_project(self):
         """Test main function with no arguments auto-detects Claude project."""
         with patch('sys.argv', ['cli']):
-            with patch('ccsm.cli.cli.find_claude_project_for_cwd') as mock_find:
+            with patch('ccsm.core.claude_loader.find_claude_project_for_cwd') as mock_find:
                 with patch('ccsm.cli.cli.list_conversations') as mock_list:
                     with patch('pathlib.Path.exists', return_value=True):
                         mock_find.return_value = '/fake/project/path'
                         main()
-                        mock_list.assert_called_once_with('/fake/project/path', format='claude')
+                        mock_list.assert_called_once_with('/fake/project/path', format='claude', use_cache=True)
     
     def test_main_no_args_no_claude_project(self):
         """Test main function with no arguments falls back to project picker."""
         with patch('sys.argv', ['cli']):
-            with patch('ccsm.cli.cli.find_claude_project_for_cwd') as mock_find:
-                with patch('ccsm.cli.cli.list_claude_projects') as mock_list_projects:
+            with patch('ccsm.core.claude_loader.find_claude_project_for_cwd') as mock_find:
+                with patch('ccsm.core.claude_loader.list_claude_projects') as mock_list_projects:
                     with patch('ccsm.cli.cli.list_claude_projects_cmd') as mock_projects_cmd:
-                        with patch('builtins.input', return_value='1'):
+                        with patch('builtins.input', return_value='1'), patch('sys.stdin.isatty', return_value=True):
                             with patch('pathlib.Path.exists', return_value=True):
                                 mock_find.return_value = None
                                 mock_list_projects.return_value = [
@@ -203,15 +313,28 @@ class TestCLIClaudeProjectDetection:
                                 main()
                                 mock_projects_cmd.assert_called_once()
     
+    def test_main_no_args_non_interactive(self, capsys):
+        """Test the project picker is skipped when stdin is not a terminal."""
+        with patch('sys.argv', ['cli']):
+            with patch('ccsm.core.claude_loader.find_claude_project_for_cwd', return_value=None):
+                with patch('ccsm.core.claude_loader.list_claude_projects') as mock_list_projects:
+                    with patch('sys.stdin.isatty', return_value=False):
+                        with pytest.raises(SystemExit) as exc_info:
+                            main()
+        
+        assert exc_info.value.code == 2
+        mock_list_projects.assert_not_called()
+        assert "not running interactively" in capsys.readouterr().err
+    
     def test_main_no_args_with_claude_project_list_command(self):
         """Test main function with list command auto-detects Claude project."""
         with patch('sys.argv', ['cli', 'list']):
-            with patch('ccsm.cli.cli.find_claude_project_for_cwd') as mock_find:
+            with patch('ccsm.core.claude_loader.find_claude_project_for_cwd') as mock_find:
                 with patch('ccsm.cli.cli.list_conversations') as mock_list:
                     with patch('pathlib.Path.exists', return_value=True):
                         mock_find.return_value = '/fake/project/path'
                         main()
-                        mock_list.assert_called_once_with('/fake/project/path', 20, format='claude')
+                        mock_list.assert_called_once_with('/fake/project/path', 20, format='claude', use_cache=True)
     
     def test_main_explicit_file_overrides_detection(self):
         """Test that explicitly providing a file path overrides auto-detection."""
@@ -221,11 +344,11 @@ class TestCLIClaudeProjectDetection:
         
         try:
             with patch('sys.argv', ['cli', test_file, 'list']):
-                with patch('ccsm.cli.cli.find_claude_project_for_cwd') as mock_find:
+                with patch('ccsm.core.claude_loader.find_claude_project_for_cwd') as mock_find:
                     with patch('ccsm.cli.cli.list_conversations') as mock_list:
                         mock_find.return_value = '/fake/project/path'
                         main()
                         # Should use the explicit file, not the detected project
-                        mock_list.assert_called_once_with(test_file, 20, format='auto')
+                        mock_list.assert_called_once_with(test_file, 20, format='auto', use_cache=True)
         finally:
             Path(test_file).unlink(missing_ok=True)
\ No newline at end of file
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Tests for the `ccsm serve` daemon and its client."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from ccsm.cli.daemon import ConversationServer, request, source_signature
+from ccsm.cli.cli import list_conversations, search_conversations
+
+
+@pytest.fixture
+def conversations_file(tmp_path):
+    """A small ChatGPT export."""
+    path = tmp_path / "conversations.json"
+    path.write_text(json.dumps([
+        {'id': 'conv1', 'title': 'Python Tutorial', 'create_time': 1234567890,
+         'messages': [{'id': 'm1', 'role': 'user', 'content': 'How do I write Python?'}]},
+        {'id': 'conv2', 'title': 'JavaScript Guide', 'create_time': 1234567891,
+         'messages': [{'id': 'm2', 'role': 'user', 'content': 'What is JavaScript?'}]},
+    ]))
+    return str(path)
+
+
+@pytest.fixture
+def server(tmp_path):
+    """A daemon serving from a background thread."""
+    socket_path = str(tmp_path / "ccsm.sock")
+    server = ConversationServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, socket_path
+    server.shutdown()
+    server.server_close()
+
+
+class TestDaemon:
+    """Test commands answered by a running daemon."""
+
+    def test_list_matches_local_output(self, server, conversations_file, capsys):
+        """Daemon output is what the command prints when run locally."""
+        _, socket_path = server
+        output = request({'cmd': 'list', 'file': conversations_file, 'format': 'auto', 'count': 20},
+                         socket_path)
+
+        list_conversations(conversations_file, 20)
+        assert output == capsys.readouterr().out
+
+    def test_search_reuses_loaded_conversations(self, server, conversations_file):
+        """Conversations are parsed once and kept for later commands."""
+        srv, socket_path = server
+        command = {'cmd': 'search', 'file': conversations_file, 'query': 'python', 'content': False}
+        assert "Python Tutorial" in request(command, socket_path)
+        loaded = srv.conversations[(conversations_file, 'auto')][1]
+
+        assert "Python Tutorial" in request(command, socket_path)
+        assert srv.conversations[(conversations_file, 'auto')][1] is loaded
+
+    def test_reloads_when_file_changes(self, server, conversations_file):
+        """A modified source file is re-parsed on the next command."""
+        _, socket_path = server
+        command = {'cmd': 'search', 'file': conversations_file, 'query': 'rust', 'content': False}
+        assert "Found 0 matches" in request(command, socket_path)
+
+        with open(conversations_file, 'w') as f:
+            json.dump([{'id': 'conv3', 'title': 'Rust Book',
+                        'messages': [{'id': 'm3', 'role': 'user', 'content': 'Borrowing?'}]}], f)
+        os.utime(conversations_file, ns=(0, 10 ** 9))
+
+        assert "Found 1 matches" in request(command, socket_path)
+
+    def test_failed_command_returns_none(self, server, conversations_file):
+        """Errors make the client fall back to running the command itself."""
+        _, socket_path = server
+        assert request({'cmd': 'bogus', 'file': conversations_file}, socket_path) is None
+
+    def test_no_daemon_returns_none(self, tmp_path):
+        """Without a socket the client reports no daemon."""
+        assert request({'cmd': 'list'}, str(tmp_path / "missing.sock")) is None
+
+    def test_directory_signature_tracks_files(self, tmp_path):
+        """Adding a session file changes a directory's signature."""
+        (tmp_path / "a.jsonl").write_text("{}\n")
+        before = source_signature(str(tmp_path))
+        (tmp_path / "b.jsonl").write_text("{}\n")
+        assert source_signature(str(tmp_path)) != before
+
+    def test_main_uses_daemon_when_enabled(self, server, conversations_file, monkeypatch, capsys):
+        """CCSM_DAEMON=1 routes CLI commands through the daemon."""
+        from ccsm.cli import cli, daemon
+        _, socket_path = server
+        monkeypatch.setenv('CCSM_DAEMON', '1')
+        monkeypatch.setattr('ccsm.cli.daemon.get_socket_path', lambda: socket_path)
+        monkeypatch.setattr('sys.argv', ['ccsm', conversations_file, 'search', 'guide'])
+        sent = []
+        real_request = daemon.request
+        monkeypatch.setattr(daemon, 'request', lambda command: sent.append(command) or real_request(command))
+
+        cli.main()
+
+        assert sent[0]['cmd'] == 'search' and sent[0]['query'] == 'guide'
+        assert "JavaScript Guide" in capsys.readouterr().out
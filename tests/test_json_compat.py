@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Tests for the optional-orjson JSON shim."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ccsm.core.json_compat import loads, load_file, dumps_indented, JSONDecodeError
+
+
+class TestJsonCompat:
+    """Test the shim behaves like json.loads whichever backend is active."""
+
+    def test_loads_bytes_and_str(self):
+        """Test both bytes and str input decode identically."""
+        data = [{"id": "c1", "title": "Héllo ✓", "create_time": 1700000000.5, "n": 3, "x": None}]
+        text = json.dumps(data, ensure_ascii=False)
+        assert loads(text) == data
+        assert loads(text.encode('utf-8')) == data
+
+    def test_decode_error_is_stdlib_compatible(self):
+        """Test malformed input raises something callers catching json.JSONDecodeError handle."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"unterminated": ')
+        assert JSONDecodeError is json.JSONDecodeError
+
+    def test_load_file(self):
+        """Test whole-file decoding, including files too small to memory-map."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "conversations.json"
+            path.write_text('[{"title": "Héllo"}]', encoding='utf-8')
+            assert load_file(str(path)) == [{"title": "Héllo"}]
+            
+            path.write_bytes(b"")
+            with pytest.raises(json.JSONDecodeError):
+                load_file(str(path))
+
+    def test_dumps_indented_matches_stdlib(self):
+        """Test encoding matches json.dumps(indent=2, ensure_ascii=False), including values orjson rejects."""
+        data = {"title": "Héllo ✓", "messages": [{"n": 3, "x": None, "t": 1700000000.5}], "empty": []}
+        assert dumps_indented(data) == json.dumps(data, indent=2, ensure_ascii=False)
+        
+        unusual = {"big": 2 ** 70, 1: "int key"}
+        assert dumps_indented(unusual) == json.dumps(unusual, indent=2, ensure_ascii=False)
+        
+        floats = {"tiny": [1e-05, 0.0001, -0.0], "huge": (1e16, -2.5e300), "odd": [float('nan'), float('inf')]}
+        assert dumps_indented(floats) == json.dumps(floats, indent=2, ensure_ascii=False)
+        for value in (1e16, 1e-05, float('nan'), 123.25, 0.0):
+            assert dumps_indented([value]) == json.dumps([value], indent=2, ensure_ascii=False)
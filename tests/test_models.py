@@ -112,6 +112,32 @@ class TestConversation:
         
         conv = Conversation("conv1", "Multi-turn Chat", messages)
         assert len(conv.messages) == 3
+    
+    def test_conversation_metadata_only_count(self):
+        """Test message_count is reported when messages were not kept."""
+        conv = Conversation("conv1", "Summary only", [], message_count=42)
+        assert conv.get_message_count() == 42
+        assert Conversation("conv2", "Empty", []).get_message_count() == 0
+    
+    def test_conversation_contains_text(self):
+        """Test case-insensitive content matching does not span messages."""
+        messages = [
+            Message("msg1", MessageRole.USER, "How do I use Python?"),
+            Message("msg2", MessageRole.ASSISTANT, "Start with the Tutorial")
+        ]
+        
+        conv = Conversation("conv1", "Chat", messages)
+        assert conv.contains_text("python")
+        assert conv.contains_text("the tutorial")
+        assert not conv.contains_text("python?start")
+        assert not conv.contains_text("rust")
+    
+    def test_conversation_title_lower(self):
+        """Test the lowercased title is precomputed and excluded from equality."""
+        conv = Conversation("conv1", "Python TUTORIAL", [])
+        assert conv.title_lower == "python tutorial"
+        assert "title_lower" not in repr(conv)
+        assert Conversation("conv2", None, []).title_lower == ""
 
 
 class TestModelEdgeCases:
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Tests for parsing files across worker processes."""
+
+import os
+from unittest.mock import patch
+
+from ccsm.core.parallel import map_files, PARALLEL_MIN_FILES
+
+
+class TestMapFiles:
+    """Test map_files keeps results in order whichever path it takes."""
+
+    def test_small_batch_is_serial(self):
+        """Test small batches run in-process (closures are fine)."""
+        seen = []
+        result = map_files(lambda p: seen.append(p) or p.upper(), ["a", "b"])
+        assert result == ["A", "B"]
+        assert seen == ["a", "b"]
+
+    def test_large_batch_preserves_order(self):
+        """Test pooled results come back in input order."""
+        paths = [f"/tmp/dir{i}/file{i}.jsonl" for i in range(PARALLEL_MIN_FILES * 3)]
+        with patch('ccsm.core.parallel.os.cpu_count', return_value=4):
+            assert map_files(os.path.basename, paths) == [os.path.basename(p) for p in paths]
+
+    def test_unpicklable_loader_falls_back(self):
+        """Test a loader that can't be sent to workers still gets every file loaded."""
+        paths = [str(i) for i in range(PARALLEL_MIN_FILES * 2)]
+        with patch('ccsm.core.parallel.os.cpu_count', return_value=4):
+            assert map_files(lambda p: int(p) * 2, paths) == [i * 2 for i in range(len(paths))]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for performance monitoring functionality."""
 
+import sys
 import time
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
@@ -9,6 +10,7 @@ import pytest
 from ccsm.core.performance import (
     PerformanceMetric,
     PerformanceMonitor,
+    OperationStats,
     enable_performance_monitoring,
     get_performance_monitor,
     performance_timer,
@@ -54,6 +56,25 @@ class TestPerformanceMetric:
         assert duration == metric.duration
         assert metric.duration >= 0.01
     
+    def test_finish_metric_uses_monotonic_clock(self):
+        """Test a metric started with start_ns ignores wall-clock jumps."""
+        metric = PerformanceMetric("test_operation", 1000.0, start_ns=time.perf_counter_ns())
+        
+        with patch('ccsm.core.performance.time.time', return_value=5000.0):
+            duration = metric.finish()
+        
+        assert 0 <= duration < 1.0
+        assert metric.end_time == 1000.0 + duration
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_metric_has_no_instance_dict(self):
+        """Test metrics use __slots__ rather than a per-instance __dict__."""
+        metric = PerformanceMetric("test_operation", time.time())
+        
+        assert not hasattr(metric, '__dict__')
+        with pytest.raises(AttributeError):
+            metric.unexpected = 1
+    
     def test_finish_metric_with_custom_end_time(self):
         """Test finishing metric with custom end time."""
         start_time = 1000.0
@@ -109,7 +130,7 @@ class TestPerformanceMonitor:
         
         # Check aggregated stats
         assert operation_name in self.monitor.aggregated_stats
-        assert len(self.monitor.aggregated_stats[operation_name]) == 1
+        assert self.monitor.aggregated_stats[operation_name].count == 1
     
     def test_measure_disabled_monitor(self):
         """Test measure with disabled monitor."""
@@ -167,6 +188,33 @@ class TestPerformanceMonitor:
         assert metric.memory_after is not None
         assert metric.metadata.get("memory_delta") is not None
     
+    @patch('ccsm.core.performance.psutil.Process')
+    def test_memory_readings_are_throttled(self, mock_process):
+        """Test back-to-back measurements share one memory reading."""
+        mock_process.return_value.memory_info.return_value.rss = 100 * 1024 * 1024
+        
+        for _ in range(5):
+            with self.monitor.measure("tiny_operation"):
+                pass
+        
+        assert mock_process.call_count == 1
+        assert mock_process.return_value.memory_info.call_count == 1
+        assert self.monitor._get_memory_usage(max_age=0) == 100.0
+        assert mock_process.return_value.memory_info.call_count == 2
+    
+    def test_metrics_history_is_bounded(self):
+        """Test only the newest metrics are kept while stats cover every call."""
+        with patch('ccsm.core.performance.MAX_METRICS', 3):
+            monitor = PerformanceMonitor()
+        
+        for i in range(5):
+            with monitor.measure(f"operation_{i % 2}"):
+                pass
+        
+        assert [m.name for m in monitor.metrics] == ["operation_0", "operation_1", "operation_0"]
+        assert [m.name for m in monitor.get_recent_metrics(2)] == ["operation_1", "operation_0"]
+        assert monitor.aggregated_stats["operation_0"].count == 3
+    
     def test_get_stats(self):
         """Test getting performance statistics."""
         # Record multiple metrics
@@ -252,6 +300,22 @@ class TestPerformanceMonitor:
             assert any("slow_op: 2.000s" in call for call in warning_calls)
 
 
+class TestOperationStats:
+    """Test running operation statistics."""
+    
+    def test_running_statistics(self):
+        """Test durations fold into count, total, min, max and last."""
+        op = OperationStats()
+        for duration in (0.3, 0.1, 0.5, 0.2):
+            op.add(duration)
+        
+        assert op.count == 4
+        assert op.total_time == pytest.approx(1.1)
+        assert op.min_time == 0.1
+        assert op.max_time == 0.5
+        assert op.last_time == 0.2
+
+
 class TestGlobalPerformanceMonitor:
     """Test global performance monitor functions."""
     
@@ -325,6 +389,7 @@ class TestGlobalPerformanceMonitor:
     def test_memory_monitor_context_manager(self, mock_process):
         """Test memory monitor context manager."""
         enable_performance_monitoring(True)
+        get_performance_monitor()._process = None  # drop the Process kept from earlier tests
         
         # Mock memory usage progression
         mock_memory_info = Mock()
@@ -410,6 +475,17 @@ class TestProgressIndicator:
                 log_message = mock_info.call_args[0][0]
                 assert "ETA:" in log_message
     
+    def test_progress_update_checks_clock_in_batches(self):
+        """Test large runs only read the clock every total/1000 items."""
+        progress = ProgressIndicator(100_000, "Batched progress")
+        
+        with patch('ccsm.core.performance.time.time', return_value=progress.start_time) as mock_time:
+            for _ in range(1000):
+                progress.update()
+        
+        assert progress.current_item == 1000
+        assert mock_time.call_count < 20  # 10 checks, plus the first progress log
+    
     def test_progress_finish(self):
         """Test finishing progress."""
         progress = ProgressIndicator(50, "Finish test")
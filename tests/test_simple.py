@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 """Simple tests for the refactored codebase."""
 
+import sys
 import tempfile
 import json
 import pytest
 from pathlib import Path
 
-from ccsm.core.loader import load_conversations, extract_content
+from ccsm.core.loader import load_conversations, extract_content, parse_message
 from ccsm.tree.tree import ConversationTree, TreeNode
 from ccsm.core.models import Conversation, Message, MessageRole
 from ccsm.tui.tree_view import TreeView
@@ -62,6 +63,18 @@ class TestSimpleLoader:
         
         # Empty content
         assert extract_content({}) == '[Empty message]'
+    
+    def test_parse_message_roles(self):
+        """Test roles come from 'role' or the author, and anything unrecognised is UNKNOWN."""
+        def role_of(**fields):
+            return parse_message({'id': 'm', 'content': 'Hi', **fields}).role
+        
+        assert role_of(role='assistant') == MessageRole.ASSISTANT
+        assert role_of(author={'role': 'tool'}) == MessageRole.TOOL
+        assert role_of(role='narrator', author={'role': 'user'}) == MessageRole.UNKNOWN
+        assert role_of(role=['user']) == MessageRole.UNKNOWN
+        assert role_of(author={'name': 'x'}) == MessageRole.UNKNOWN
+        assert role_of() == MessageRole.UNKNOWN
 
 
 class TestSimpleTree:
@@ -121,6 +134,154 @@ class TestSimpleTree:
             tree.delete_node(folder_id)
             
             assert folder_id not in tree.nodes
+    
+    def test_move_nodes(self):
+        """Test moving several nodes at once skips unknown IDs and records the rest."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            folder_id = tree.create_folder('Folder')
+            tree.add_conversation('conv-1', 'One')
+            tree.add_conversation('conv-2', 'Two')
+            
+            previous_parents = []
+            moved = tree.move_nodes([('conv-1', folder_id), ('missing', folder_id), ('conv-2', folder_id)],
+                                    previous_parents)
+            
+            assert moved == 2
+            assert previous_parents == [('conv-1', None), ('conv-2', None)]
+            assert tree.nodes[folder_id].children == {'conv-1', 'conv-2'}
+            assert tree.root_nodes == {folder_id}
+            with pytest.raises(ValueError):
+                tree.move_node('missing', None)
+    
+    def test_ancestors(self):
+        """Test walking from a node up to the root."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            outer_id = tree.create_folder('Outer')
+            inner_id = tree.create_folder('Inner', parent_id=outer_id)
+            tree.add_conversation('conv-1', 'Chat', parent_id=inner_id)
+            
+            assert list(tree.ancestors('conv-1')) == [inner_id, outer_id]
+            assert list(tree.ancestors(outer_id)) == []
+            assert list(tree.ancestors('missing')) == []
+    
+    def test_folders(self):
+        """Test the folder list follows creates and deletes and skips conversations."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            tree.add_conversation('conv-1', 'Chat')
+            folder_id = tree.create_folder('Folder')
+            assert [node.id for node in tree.folders()] == [folder_id]
+            
+            inner_id = tree.create_folder('Inner', parent_id=folder_id)
+            assert {node.id for node in tree.folders()} == {folder_id, inner_id}
+            
+            tree.delete_node(folder_id)
+            assert tree.folders() == []
+    
+    def test_automatic_sort(self):
+        """Test folders come first by name, then conversations by date or name."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            beta_id = tree.create_folder('beta')
+            alpha_id = tree.create_folder('Alpha')
+            tree.nodes[alpha_id].expanded = False
+            convs = [Conversation("old", "b old", [], create_time=1),
+                     Conversation("new", "c new", [], create_time=3),
+                     Conversation("undated", "a undated", [])]
+            
+            by_date = tree.get_tree_items(convs)
+            assert [node.id for node, _, _ in by_date] == [alpha_id, beta_id, 'new', 'old', 'undated']
+            by_name = tree.get_tree_items(convs, sort_by_date=False)
+            assert [node.id for node, _, _ in by_name] == [alpha_id, beta_id, 'undated', 'old', 'new']
+    
+    def test_tree_items_depth_first(self):
+        """Test nested items are listed under their folder, however deep the nesting."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            outer_id = tree.create_folder('Outer')
+            inner_id = tree.create_folder('Inner', parent_id=outer_id)
+            convs = [Conversation("top", "Top", [], create_time=1),
+                     Conversation("nested", "Nested", [], create_time=2)]
+            tree.add_conversation('nested', 'Nested', parent_id=inner_id)
+            
+            items = tree.get_tree_items(convs)
+            assert [(node.id, depth) for node, _, depth in items] == [
+                (outer_id, 0), (inner_id, 1), ('nested', 2), ('top', 0)]
+            
+            parent_id = inner_id
+            for i in range(2000):
+                parent_id = tree.create_folder(f'Level {i}', parent_id=parent_id)
+            assert len(tree.get_tree_items(convs)) == len(items) + 2000
+    
+    def test_tree_items_adds_missing_conversations(self):
+        """Test conversations missing from the tree are added, including after a delete."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            convs = [Conversation("conv-1", "One", [], create_time=1)]
+            assert len(tree.get_tree_items(convs)) == 1
+            
+            convs.append(Conversation("conv-2", "Two", [], create_time=2))
+            assert len(tree.get_tree_items(convs)) == 2
+            
+            tree.delete_node('conv-1')
+            assert len(tree.get_tree_items(convs)) == 2
+            assert 'conv-1' in tree.root_nodes
+    
+    def test_custom_order(self):
+        """Test custom ordering keeps moved items in place and appends new ones."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            convs = [Conversation(f"conv-{i}", f"Chat {i}", [], create_time=i) for i in range(3)]
+            tree.get_tree_items(convs)
+            assert tree.move_item_up('conv-2')
+            
+            convs.append(Conversation("conv-3", "Chat 3", [], create_time=3))
+            items = tree.get_tree_items(convs)
+            assert [node.id for node, _, _ in items] == ['conv-0', 'conv-2', 'conv-1', 'conv-3']
+    
+    def test_first_folder_child(self):
+        """Test finding a folder to indent into follows moves and deletes."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([], f)
+            f.flush()
+            
+            tree = ConversationTree(f.name)
+            tree.add_conversation('conv-1', 'Chat')
+            folder_id = tree.create_folder('Folder')
+            
+            assert tree.first_folder_child(None) == folder_id
+            assert tree.first_folder_child(None, exclude={folder_id}) is None
+            
+            other_id = tree.create_folder('Other')
+            tree.move_node(folder_id, other_id)
+            assert tree.first_folder_child(None) == other_id
+            assert tree.first_folder_child(other_id) == folder_id
+            
+            tree.delete_node(folder_id)
+            assert tree.first_folder_child(other_id) is None
 
 
 class TestTreeNode:
@@ -136,6 +297,15 @@ class TestTreeNode:
         assert node.parent_id is None
         assert node.children == set()
         assert node.expanded
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_node_has_no_instance_dict(self):
+        """Test nodes use __slots__ rather than a per-instance __dict__."""
+        node = TreeNode('test-id', 'Test Node', is_folder=False)
+        
+        assert not hasattr(node, '__dict__')
+        with pytest.raises(AttributeError):
+            node.unexpected = 1
 
 
 class TestTreeView:
@@ -359,6 +529,34 @@ class TestTreeView:
         expected_offset = max(0, 2 - self.tree_view.height // 2)
         assert self.tree_view.offset == expected_offset
 
+    def test_draw_uses_precomputed_message_count(self):
+        """Test that the header counts items and rows show loader-supplied message counts."""
+        conv = Conversation("5", "Listed", [], update_time=1, create_time=1, message_count=42)
+        self.tree_view.set_items([
+            (TreeNode("1", "Folder 1", is_folder=True), None, 0),
+            (TreeNode("5", "Listed", is_folder=False), conv, 1),
+        ])
+
+        with patch('curses.color_pair', return_value=0):
+            self.tree_view.draw()
+
+        drawn = [call.args[2] for call in self.mock_stdscr.addstr.call_args_list]
+        assert drawn[0].startswith("📁 1 folders, 💬 1 conversations")
+        assert any("(  42) Listed" in text for text in drawn)
+
+    def test_size_read_on_resize_only(self):
+        """Test drawing reuses the known size and resize() picks up a new one."""
+        self.mock_stdscr.getmaxyx.reset_mock()
+        self.mock_stdscr.getmaxyx.return_value = (40, 100)
+        self.tree_view.show_dates = False
+        with patch('curses.color_pair', return_value=0):
+            self.tree_view.draw()
+        self.mock_stdscr.getmaxyx.assert_not_called()
+        assert (self.tree_view.height, self.tree_view.width) == (22, 80)
+
+        self.tree_view.resize()
+        assert (self.tree_view.height, self.tree_view.width) == (38, 100)
+
 
 class TestTUIEnhancements:
     """Test the enhanced TUI functionality."""
@@ -428,6 +626,31 @@ class TestTUIEnhancements:
         assert result is not None
         assert "Paste:" in result.message
     
+    def test_action_context_looks_up_selection_lazily(self):
+        """Test the selected item is only fetched when a handler reads it, and only once."""
+        from ccsm.tui.action_handler import ActionContext
+        
+        context = ActionContext(self.tui, ord('y'), "copy")
+        self.tui.tree_view.get_selected.assert_not_called()
+        
+        assert context.selected_item is None
+        assert context.selected_item is None
+        self.tui.tree_view.get_selected.assert_called_once()
+    
+    def test_operations_dispatch(self):
+        """Test operations are routed by action name and unknown actions are declined."""
+        from ccsm.tui.action_handler import ActionContext
+        ops = self.tui.operations_manager
+        
+        assert ops.can_handle("indent")
+        assert not ops.can_handle("copy")
+        assert ops.handle("copy", ActionContext(self.tui, ord('y'), "copy")) is None
+        
+        result = ops.handle("rename", ActionContext(self.tui, ord('r'), "rename"))
+        assert result is not None
+        assert not result.success
+        assert "No item selected" in result.message
+    
     def test_refresh_conversations(self):
         """Test refreshing conversations from file."""
         from ccsm.tui.action_handler import ActionContext
@@ -483,6 +706,49 @@ class TestTUIEnhancements:
         result = self.tui.tree_manager.handle("expand_depth_2", context)
         assert result is not None
         assert "Expanded to depth 2" in result.message
+        assert self.tui.tree.nodes[folder1_id].expanded
+        assert not self.tui.tree.nodes[folder2_id].expanded
+    
+    def test_view_in_less_streams_export(self):
+        """Test viewing pipes the export to less in pieces and tolerates less quitting early."""
+        conv = Conversation("1", "Streamed", [Message("m1", MessageRole.USER, "Hello")])
+        with patch('curses.endwin'), patch('curses.doupdate'), \
+             patch('ccsm.tui.tree_manager.subprocess.Popen') as popen:
+            result = self.tui.tree_manager._view_in_less(conv)
+            assert result.success
+            chunks = list(popen.return_value.stdin.writelines.call_args[0][0])
+            assert len(chunks) == 2
+            assert "Hello" in chunks[1]
+            popen.return_value.wait.assert_called_once()
+            
+            popen.return_value.stdin.writelines.side_effect = BrokenPipeError
+            assert self.tui.tree_manager._view_in_less(conv).success
+    
+    def test_action_routes_cached_per_handler_list(self):
+        """Test each action asks the handlers once, until the handler list is replaced."""
+        first, second = Mock(), Mock()
+        first.can_handle.side_effect = lambda action: action == "copy"
+        second.can_handle.return_value = True
+        self.tui.action_handlers = [first, second]
+        
+        assert self.tui._handlers_for("copy") == [first, second]
+        assert self.tui._handlers_for("copy") == [first, second]
+        assert self.tui._handlers_for("undo") == [second]
+        assert first.can_handle.call_count == 2
+        
+        self.tui.action_handlers = [second]
+        assert self.tui._handlers_for("copy") == [second]
+    
+    def test_tree_manager_dispatch(self):
+        """Test tree actions are recognised by name or expand_depth_ prefix and nothing else."""
+        from ccsm.tui.action_handler import ActionContext
+        manager = self.tui.tree_manager
+        assert manager.can_handle("collapse_all")
+        assert manager.can_handle("expand_depth_3")
+        assert not manager.can_handle("rename")
+        
+        context = ActionContext(self.tui, ord('x'), "rename")
+        assert manager.handle("rename", context) is None
     
     def test_implemented_actions(self):
         """Test actually implemented action messages."""
@@ -541,6 +807,56 @@ class TestTUIEnhancements:
         assert result is not None
         assert "No folder available" in result.message
     
+    def test_bulk_move_keeps_selected_children_in_selected_folders(self):
+        """Test bulk move only moves the outermost selected items."""
+        from ccsm.tui.action_handler import ActionContext
+        tree = self.tui.tree
+        folder_id = tree.create_folder("Project")
+        dest_id = tree.create_folder("Archive")
+        tree.add_conversation("conv-1", "Inside", parent_id=folder_id)
+        
+        self.tui.selection_manager.selected_items = {folder_id, "conv-1"}
+        context = ActionContext(self.tui, ord('m'), "move")
+        with patch('ccsm.tui.operations_manager.select_folder', return_value=dest_id):
+            result = self.tui.operations_manager.handle("move", context)
+        
+        assert result.success
+        assert "Moved 1 items" in result.message
+        assert tree.nodes[folder_id].parent_id == dest_id
+        assert tree.nodes["conv-1"].parent_id == folder_id
+    
+    def test_bulk_move_into_selected_folder_moves_nested_items(self):
+        """Test items nested below a selected destination are still moved into it."""
+        from ccsm.tui.action_handler import ActionContext
+        tree = self.tui.tree
+        dest_id = tree.create_folder("Archive")
+        inner_id = tree.create_folder("Old", parent_id=dest_id)
+        tree.add_conversation("conv-1", "Nested", parent_id=inner_id)
+        
+        self.tui.selection_manager.selected_items = {dest_id, "conv-1"}
+        context = ActionContext(self.tui, ord('m'), "move")
+        with patch('ccsm.tui.operations_manager.select_folder', return_value=dest_id):
+            result = self.tui.operations_manager.handle("move", context)
+        
+        assert result.success
+        assert "Moved 1 items" in result.message
+        assert tree.nodes["conv-1"].parent_id == dest_id
+        assert tree.nodes[inner_id].parent_id == dest_id
+    
+    def test_operations_report_success_explicitly(self):
+        """Test operation results carry a success flag rather than relying on message wording."""
+        ops = self.tui.operations_manager
+        
+        result = ops.bulk_move_up(set(), [])
+        assert not result.success
+        assert result.message == "No items selected to move"
+        
+        with patch.object(self.tui.tree, 'move_node', side_effect=ValueError("Moved elsewhere")):
+            with patch('ccsm.tui.operations_manager.select_folder', return_value="target"):
+                result = ops.move_item((TreeNode("1", "Test", is_folder=False), None, 0))
+        assert not result.success
+        assert "Moved elsewhere" in result.message
+    
     def test_quick_filter(self):
         """Test quick filter activation."""
         from ccsm.tui.tui import ViewMode
@@ -896,6 +1212,75 @@ class TestTUIEnhancements:
         # Selection should be preserved  
         assert len(self.tui.selection_manager.selected_items) == 1
     
+    def test_visual_selection_follows_cursor(self):
+        """Test the visual range stays exact as the cursor jumps around and items change."""
+        from ccsm.tui.selection_manager import SelectionManager
+        items = [(TreeNode(f"id-{i}", f"Item {i}", False), None, 0) for i in range(10)]
+        
+        manager = SelectionManager()
+        manager.toggle_visual_mode(4, items)
+        for position in [5, 9, 3, 0, 4, 8, 12, 2]:
+            manager.update_visual_selection(position, items)
+            low, high = min(4, position), min(max(4, position), 9)
+            assert manager.selected_items == {f"id-{i}" for i in range(low, high + 1)}
+        
+        # A refreshed item list is re-read rather than patched
+        manager.selected_items.discard("id-3")
+        refreshed = items[::-1]
+        manager.update_visual_selection(3, refreshed)
+        assert manager.selected_items == {"id-6", "id-5"}
+    
+    def test_project_info_looked_up_once(self):
+        """Test the status line's project tag isn't recomputed every frame."""
+        with patch('ccsm.tui.tui.find_claude_project_for_cwd',
+                   return_value='/home/u/.claude/projects/-home-u-app') as find:
+            assert self.tui._get_project_info() == " [📁-home-u-app]"
+            assert self.tui._get_project_info() == " [📁-home-u-app]"
+            find.assert_called_once()
+    
+    def test_get_editor_looks_up_path_once(self):
+        """Test the fallback editor is found with shutil.which and remembered."""
+        with patch.dict('os.environ', {}, clear=True), \
+             patch('ccsm.tui.tree_manager.shutil.which',
+                   side_effect=lambda ed: '/usr/bin/vim' if ed == 'vim' else None) as which:
+            assert self.tui.tree_manager._get_editor() == 'vim'
+            assert self.tui.tree_manager._get_editor() == 'vim'
+            assert which.call_count == 2  # nano, then vim
+            
+            with patch.dict('os.environ', {'EDITOR': 'hx'}):
+                assert self.tui.tree_manager._get_editor() == 'hx'
+    
+    def test_filter_narrows_as_user_types(self):
+        """Test typing forward filters the previous matches, and anything else starts over."""
+        java_conv = Conversation("java1", "Java Guide", [], create_time=1234567891)
+        self.tui.conversations.append(java_conv)
+        self.tui.tree_view = Mock()
+        
+        self.tui._update_search("conv")
+        assert [conv.id for conv in self.tui.filtered_conversations] == ["1", "2"]
+        
+        # A conversation that only matches the new term can't appear when narrowing
+        self.tui.conversations.append(Conversation("3", "Conv 2 notes", [], create_time=1234567892))
+        self.tui._update_search("conv 2")
+        assert [conv.id for conv in self.tui.filtered_conversations] == ["2"]
+        
+        # Backspacing searches everything again
+        self.tui._update_search("conv")
+        assert [conv.id for conv in self.tui.filtered_conversations] == ["1", "2", "3"]
+        
+        # As does typing forward after the filter was replaced from elsewhere
+        self.tui.filtered_conversations = self.tui.conversations
+        self.tui._update_search("java")
+        assert self.tui.filtered_conversations == [java_conv]
+        
+        # Narrowing that keeps every match, or clearing an absent filter, leaves the tree alone
+        with patch.object(self.tui, '_refresh_tree') as refresh:
+            self.tui._update_search("java g")
+            assert self.tui.filtered_conversations == [java_conv]
+            self.tui._clear_search()
+            self.tui._clear_search()
+            assert refresh.call_count == 1
+    
     def test_filter_vs_search_modes(self):
         """Test that f activates filter mode and / activates search mode."""
         # Create test data by adding to both tree and conversations list
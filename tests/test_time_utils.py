@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for time formatting."""
+
+import pytest
+
+from ccsm.core.time_utils import format_relative_time, format_relative_times, format_timestamp, MINUTE, HOUR, DAY
+
+NOW = 1_700_000_000.0
+
+
+class TestFormatRelativeTime:
+    """Test bucket boundaries of format_relative_time."""
+
+    @pytest.mark.parametrize("age, expected", [
+        (0, "Just now"),
+        (59, "Just now"),
+        (MINUTE, "1m ago"),
+        (59 * MINUTE, "59m ago"),
+        (HOUR, "1h ago"),
+        (23 * HOUR + 59 * MINUTE, "23h ago"),
+        (DAY, "1 day ago"),
+        (6 * DAY, "6 days ago"),
+        (7 * DAY, "1 week ago"),
+        (29 * DAY, "4 weeks ago"),
+        (30 * DAY, "1 month ago"),
+        (364 * DAY, "12 months ago"),
+        (365 * DAY, "1 year ago"),
+        (800 * DAY, "2 years ago"),
+        (-5 * DAY, "Just now"),
+    ])
+    def test_buckets(self, age, expected):
+        """Test each bucket and its edges."""
+        assert format_relative_time(NOW - age, now=NOW) == expected
+
+    def test_missing_timestamp(self):
+        """Test missing timestamps are reported as unknown."""
+        assert format_relative_time(None) == "Unknown"
+        assert format_relative_time(0) == "Unknown"
+
+    def test_bulk_matches_single(self):
+        """Test the bulk helper formats each timestamp like the single version."""
+        import time
+        now = time.time()
+        timestamps = [None, now - 30, now - 2 * HOUR, now - 3 * DAY, now - 400 * DAY]
+        assert format_relative_times(timestamps) == [format_relative_time(ts, now) for ts in timestamps]
+
+
+class TestFormatTimestamp:
+    """Test absolute timestamp formatting."""
+
+    @pytest.mark.parametrize("timestamp", [NOW, NOW + 0.75, 86400.0])
+    def test_matches_datetime(self, timestamp):
+        """Test output matches datetime.fromtimestamp().strftime()."""
+        from datetime import datetime, timezone
+        assert format_timestamp(timestamp) == datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+        assert (format_timestamp(timestamp, "%Y-%m-%d %H:%M:%S", utc=True)
+                == datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
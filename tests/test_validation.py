@@ -4,6 +4,7 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -35,6 +36,19 @@ class TestFilePathValidation:
         assert result is not None
         assert str(result) == "/some/path/file.txt"
     
+    def test_validate_relative_path_follows_cwd(self, tmp_path, monkeypatch):
+        """Test relative paths resolve against the current directory each time."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        
+        monkeypatch.chdir(tmp_path / "a")
+        first = validate_file_path("conv.json", must_exist=False)
+        monkeypatch.chdir(tmp_path / "b")
+        second = validate_file_path("conv.json", must_exist=False)
+        
+        assert first == (tmp_path / "a" / "conv.json").resolve()
+        assert second == (tmp_path / "b" / "conv.json").resolve()
+    
     def test_validate_directory_with_jsonl(self):
         """Test validation of directory containing JSONL files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -74,6 +88,20 @@ class TestJsonValidation:
         result = validate_json_data(json_str, expect_array=True)
         assert result is None
     
+    def test_validate_array_skips_parse_of_non_array(self):
+        """Test a document that can't be an array is rejected without parsing."""
+        with patch('ccsm.core.validation.json.loads') as mock_loads:
+            assert validate_json_data('  {"key": "value"}', expect_array=True) is None
+            mock_loads.assert_not_called()
+        
+        assert validate_json_data(' \n [1, 2]', expect_array=True) == [1, 2]
+    
+    def test_validate_keeps_stdlib_values(self):
+        """Test validation returns exactly what json.loads would, big integers and NaN included."""
+        assert validate_json_data('[123456789012345678901234567890]') == [123456789012345678901234567890]
+        result = validate_json_data('{"a": NaN}')
+        assert result is not None and result['a'] != result['a']
+    
     def test_validate_invalid_json(self):
         """Test validation fails for invalid JSON."""
         json_str = '{"invalid": json,}'
@@ -89,6 +117,26 @@ class TestConversationNumberValidation:
         result = validate_conversation_number("5", 10)
         assert result == 5
     
+    def test_repeat_input_is_cached_but_still_warns(self):
+        """Test repeated bad input reuses the cached check and logs every time."""
+        from ccsm.core.validation import _check_conversation_number
+        
+        _check_conversation_number.cache_clear()
+        with patch('ccsm.core.validation.logger') as mock_logger:
+            assert validate_conversation_number("abc", 10) is None
+            assert validate_conversation_number("abc", 10) is None
+        
+        assert mock_logger.warning.call_count == 2
+        assert _check_conversation_number.cache_info().hits == 1
+    
+    def test_validate_number_signs_and_whitespace(self):
+        """Test signed and padded numbers parse while other digit-like input doesn't."""
+        assert validate_conversation_number(" +3 ", 10) == 3
+        assert validate_conversation_number("-3", 10) is None
+        assert validate_conversation_number("+", 10) is None
+        assert validate_conversation_number("\u00b2", 10) is None  # superscript two
+        assert validate_conversation_number("", 10) is None
+    
     def test_validate_number_too_low(self):
         """Test validation fails for number too low."""
         result = validate_conversation_number("0", 10)
@@ -172,6 +220,11 @@ class TestSearchTermSanitization:
         result = sanitize_search_term("hello\x07world")
         assert result == "helloworld"
     
+    def test_sanitize_keeps_non_ascii(self):
+        """Test sanitization only strips ASCII control characters."""
+        result = sanitize_search_term("caf\u00e9\x00\x1b[31m \u65e5\u672c\x7f")
+        assert result == "caf\u00e9[31m \u65e5\u672c\x7f"
+    
     def test_sanitize_length_limit(self):
         """Test sanitization respects length limit."""
         long_term = "a" * 200